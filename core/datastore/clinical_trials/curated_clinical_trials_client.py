@@ -8,7 +8,7 @@ with lazy loading and caching capabilities.
 import json
 import logging
 from pathlib import Path
-from typing import Dict, List, Optional, Set
+from typing import Dict, List, Optional, Set, Sequence
 from functools import lru_cache
 
 logger = logging.getLogger(__name__)
@@ -139,6 +139,45 @@ class CuratedClinicalTrialsClient:
         spanish_trials = self._load_spanish_trials_data()
         return spanish_trials.get(orpha_code, [])
     
+    def get_eu_trials_for_diseases(self, orpha_codes: Sequence[str]) -> List[List[str]]:
+        """
+        Get EU-accessible trials for several diseases at once
+        
+        Args:
+            orpha_codes: Disease Orphanet codes
+            
+        Returns:
+            List of NCT IDs for EU-accessible trials for each code, in order
+        """
+        eu_trials = self._load_eu_trials_data()
+        return [eu_trials.get(orpha_code, []) for orpha_code in orpha_codes]
+    
+    def get_all_trials_for_diseases(self, orpha_codes: Sequence[str]) -> List[List[str]]:
+        """
+        Get all trials for several diseases at once
+        
+        Args:
+            orpha_codes: Disease Orphanet codes
+            
+        Returns:
+            List of all NCT IDs for each code, in order
+        """
+        all_trials = self._load_all_trials_data()
+        return [all_trials.get(orpha_code, []) for orpha_code in orpha_codes]
+    
+    def get_spanish_trials_for_diseases(self, orpha_codes: Sequence[str]) -> List[List[str]]:
+        """
+        Get Spanish-accessible trials for several diseases at once
+        
+        Args:
+            orpha_codes: Disease Orphanet codes
+            
+        Returns:
+            List of NCT IDs for Spanish-accessible trials for each code, in order
+        """
+        spanish_trials = self._load_spanish_trials_data()
+        return [spanish_trials.get(orpha_code, []) for orpha_code in orpha_codes]
+    
     @lru_cache(maxsize=1000)
     def get_trial_name(self, nct_id: str) -> str:
         """
@@ -8,7 +8,7 @@ with lazy loading and caching capabilities.
 import json
 import logging
 from pathlib import Path
-from typing import Dict, List, Optional, Set
+from typing import Dict, List, Optional, Set, Sequence
 from functools import lru_cache
 
 logger = logging.getLogger(__name__)
@@ -180,6 +180,17 @@ class CuratedDrugsClient:
         usa_medical_products = self._load_usa_medical_products_data()
         return usa_medical_products.get(orpha_code, [])
     
+    # Batch methods
+    def get_eu_tradename_drugs_for_diseases(self, orpha_codes: Sequence[str]) -> List[List[str]]:
+        """Get EU-accessible tradename drugs for each disease, in order"""
+        eu_tradename_drugs = self._load_eu_tradename_drugs_data()
+        return [eu_tradename_drugs.get(orpha_code, []) for orpha_code in orpha_codes]
+    
+    def get_eu_medical_products_for_diseases(self, orpha_codes: Sequence[str]) -> List[List[str]]:
+        """Get EU-accessible medical products for each disease, in order"""
+        eu_medical_products = self._load_eu_medical_products_data()
+        return [eu_medical_products.get(orpha_code, []) for orpha_code in orpha_codes]
+    
     # Combined methods
     def get_all_drugs_for_disease(self, orpha_code: str, region: str = "all", drug_type: str = "all") -> List[str]:
         """
@@ -228,6 +239,19 @@ class CuratedDrugsClient:
         drug_names = self._load_drug_names_data()
         return drug_names.get(drug_id, f"Drug {drug_id}")
     
+    def get_drug_name_map(self) -> Dict[str, str]:
+        """
+        Get the full drug ID to name mapping
+        
+        Meant for bulk name resolution; the returned dict is shared with the
+        client and must not be modified. Unknown IDs should fall back to
+        get_drug_name's "Drug <id>" default.
+        
+        Returns:
+            Dict mapping drug IDs to drug names
+        """
+        return self._load_drug_names_data()
+    
     def get_drug_names_for_disease(self, orpha_code: str, region: str = "all", drug_type: str = "all") -> Dict[str, str]:
         """
         Get drug IDs and names for disease
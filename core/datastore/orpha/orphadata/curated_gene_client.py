@@ -9,7 +9,7 @@ and caching capabilities for efficient data access.
 import json
 import logging
 from pathlib import Path
-from typing import Dict, List, Optional, Set, Any
+from typing import Dict, List, Optional, Set, Any, Sequence
 from datetime import datetime
 import csv
 
@@ -134,6 +134,20 @@ class CuratedGeneClient:
         self._ensure_disease2genes_loaded()
         return self._disease2genes.get(orpha_code, [])
 
+    def get_genes_for_diseases(self, orpha_codes: Sequence[str]) -> List[List[str]]:
+        """
+        Get disease-causing genes for several diseases at once.
+        
+        Args:
+            orpha_codes: Orpha codes of the diseases
+            
+        Returns:
+            List of gene symbols (empty if not found) for each code, in order
+        """
+        self._ensure_disease2genes_loaded()
+        disease2genes = self._disease2genes
+        return [disease2genes.get(orpha_code, []) for orpha_code in orpha_codes]
+
     def get_diseases_for_gene(self, gene_symbol: str) -> List[str]:
         """
         Get diseases associated with a specific gene.
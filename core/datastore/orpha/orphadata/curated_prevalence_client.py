@@ -9,7 +9,7 @@ and caching capabilities for efficient data access.
 import json
 import logging
 from pathlib import Path
-from typing import Dict, List, Optional, Set, Any
+from typing import Dict, List, Optional, Set, Any, Sequence
 from datetime import datetime
 
 
@@ -112,6 +112,20 @@ class CuratedOrphaPrevalenceClient:
         self._ensure_disease2prevalence_loaded()
         return self._disease2prevalence.get(orpha_code)
 
+    def get_prevalence_classes(self, orpha_codes: Sequence[str]) -> List[Optional[str]]:
+        """
+        Get prevalence classes for several diseases at once.
+        
+        Args:
+            orpha_codes: Orpha codes of the diseases
+            
+        Returns:
+            Prevalence class (or None if not found) for each code, in order
+        """
+        self._ensure_disease2prevalence_loaded()
+        disease2prevalence = self._disease2prevalence
+        return [disease2prevalence.get(orpha_code) for orpha_code in orpha_codes]
+
     def get_disease_name(self, orpha_code: str) -> Optional[str]:
         """
         Get disease name for a specific orpha code.
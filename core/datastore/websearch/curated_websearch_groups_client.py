@@ -8,7 +8,7 @@ with lazy loading and caching capabilities.
 import json
 import logging
 from pathlib import Path
-from typing import Dict, List, Optional, Set, Any
+from typing import Dict, List, Optional, Set, Any, Sequence
 from functools import lru_cache
 import csv
 
@@ -111,6 +111,19 @@ class CuratedWebsearchGroupsClient:
         disease_data = self._load_disease_group_data()
         return disease_data.get(orpha_code, [])
     
+    def get_groups_for_diseases(self, orpha_codes: Sequence[str]) -> List[List[str]]:
+        """
+        Get research groups associated with several diseases at once
+        
+        Args:
+            orpha_codes: Orpha codes as strings
+            
+        Returns:
+            List of group names (empty if none found) for each code, in order
+        """
+        disease_data = self._load_disease_group_data()
+        return [disease_data.get(orpha_code, []) for orpha_code in orpha_codes]
+    
     def get_diseases_for_group(self, group_name: str) -> List[str]:
         """
         Get diseases associated with a research group
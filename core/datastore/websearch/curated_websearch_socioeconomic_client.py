@@ -8,7 +8,7 @@ with lazy loading and caching capabilities.
 import json
 import logging
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Sequence
 from functools import lru_cache
 
 logger = logging.getLogger(__name__)
@@ -89,6 +89,19 @@ class CuratedWebsearchSocioeconomicClient:
         """
         return self.evidence_level_data.get(orpha_code)
     
+    def get_evidence_levels_for_diseases(self, orpha_codes: Sequence[str]) -> List[Optional[str]]:
+        """
+        Get evidence levels for several diseases at once
+        
+        Args:
+            orpha_codes: ORPHA codes of the diseases
+            
+        Returns:
+            Evidence level string (or None if not found) for each code, in order
+        """
+        evidence_level_data = self.evidence_level_data
+        return [evidence_level_data.get(orpha_code) for orpha_code in orpha_codes]
+    
     def get_justification_for_disease(self, orpha_code: str) -> Optional[str]:
         """
         Get justification for a specific disease
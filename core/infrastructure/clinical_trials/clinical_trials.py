@@ -51,6 +51,8 @@ from datetime import datetime
 import logging
 from urllib.parse import urlencode
 
+from core.infrastructure.utils.retry import retry_http
+
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
@@ -65,6 +67,16 @@ class ClinicalTrialsAPIClient:
         }
         self.session = requests.Session()
         self.session.headers.update(self.headers)
+    
+    def close(self):
+        """Close the pooled connections held by the session"""
+        self.session.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc_info):
+        self.close()
         
     def search_by_orphacode(self, orphacode: str, max_results: int = 100) -> pd.DataFrame:
         """
@@ -385,10 +397,7 @@ class ClinicalTrialsAPIClient:
                 params['pageToken'] = next_page_token
             
             try:
-                response = self.session.get(self.base_url, params=params)
-                response.raise_for_status()
-                
-                data = response.json()
+                data = self._get_page(params)
                 studies = data.get('studies', [])
                 
                 if not studies:
@@ -413,6 +422,13 @@ class ClinicalTrialsAPIClient:
         
         return all_studies[:max_results]
     
+    @retry_http()
+    def _get_page(self, params: Dict) -> Dict:
+        """Fetch one page of studies, retrying transient failures with backoff"""
+        response = self.session.get(self.base_url, params=params)
+        response.raise_for_status()
+        return response.json()
+    
     def _extract_study_info(self, study: Dict) -> Dict:
         """
         Extract relevant information from a study record
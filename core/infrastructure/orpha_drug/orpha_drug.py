@@ -7,6 +7,8 @@ import logging
 import re
 import json
 
+from core.infrastructure.utils.retry import retry_http
+
 class DrugParser:
     """
     Handles HTML parsing of Orpha.net drug search results.
@@ -750,6 +752,16 @@ class OrphaDrugAPIClient:
         # Track last request time for rate limiting
         self.last_request_time = 0
     
+    def close(self):
+        """Close the pooled connections held by the session."""
+        self.session.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc_info):
+        self.close()
+    
     def search(self, disease_name: str, orphacode: Union[str, int],
                region: str = "", status: str = "all") -> Dict:
         """
@@ -790,8 +802,7 @@ class OrphaDrugAPIClient:
             self._enforce_rate_limit()
             
             # Make the request
-            response = self.session.get(self.base_url, params=params, timeout=30)
-            response.raise_for_status()
+            response = self._get(self.base_url, params=params)
             
             # Parse the HTML
             soup = BeautifulSoup(response.content, 'html.parser')
@@ -828,6 +839,13 @@ class OrphaDrugAPIClient:
                 'timestamp': time.time()
             }
     
+    @retry_http()
+    def _get(self, url: str, params: Optional[Dict] = None) -> requests.Response:
+        """GET a page, retrying transient failures with backoff."""
+        response = self.session.get(url, params=params, timeout=30)
+        response.raise_for_status()
+        return response
+    
     def _enforce_rate_limit(self):
         """Enforce rate limiting between requests."""
         current_time = time.time()
@@ -856,8 +874,7 @@ class OrphaDrugAPIClient:
             if substance_url.startswith('/'):
                 substance_url = f"https://www.orpha.net{substance_url}"
             
-            response = self.session.get(substance_url, timeout=30)
-            response.raise_for_status()
+            response = self._get(substance_url)
             
             soup = BeautifulSoup(response.content, 'html.parser')
             
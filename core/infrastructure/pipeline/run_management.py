@@ -1,14 +1,21 @@
 import os
+import re
 import json
 from pathlib import Path
 import logging
+from typing import Dict, Set, Union
+
+from pydantic import BaseModel
 
 logger = logging.getLogger(__name__)
+
+# Where get_next_run_number looks for earlier runs of a disease
+RUN_HISTORY_PATH = "data/preprocessing"
     
 
 def get_next_run_number(data_type: str, orphacode: str) -> int:
     """Check existing run files for specific disease and return next number"""
-    disease_dir = Path(f"data/preprocessing/{data_type}/{orphacode}")
+    disease_dir = Path(f"{RUN_HISTORY_PATH}/{data_type}/{orphacode}")
     if not disease_dir.exists():
         return 1
     
@@ -27,6 +34,33 @@ def get_next_run_number(data_type: str, orphacode: str) -> int:
     return max(run_numbers) + 1 if run_numbers else 1
 
 
+def build_run_manifest(data_type: str, base_path: str = "data/02_preprocess") -> Dict[str, Set[int]]:
+    """
+    Scan the output tree of a data type once and return the run numbers on disk per orphacode
+    
+    Lets a batch answer run-number and already-processed checks from memory
+    instead of probing the filesystem for every disease.
+    """
+    run_file = re.compile(rf"run(\d+)_disease2{re.escape(data_type)}\.json")
+    manifest = {}
+    try:
+        disease_dirs = os.scandir(f"{base_path}/{data_type}")
+    except FileNotFoundError:
+        return manifest
+    
+    with disease_dirs:
+        for disease_dir in disease_dirs:
+            if not disease_dir.is_dir():
+                continue
+            with os.scandir(disease_dir.path) as files:
+                matches = (run_file.fullmatch(file.name) for file in files)
+                runs = {int(match.group(1)) for match in matches if match}
+            if runs:
+                manifest[disease_dir.name] = runs
+    
+    return manifest
+
+
 def is_disease_processed(orphacode: str, data_type: str, run_number: int) -> bool:
     """Check if disease already processed in current run"""
     output_path = create_output_path(data_type, orphacode, run_number)
@@ -38,15 +72,24 @@ def create_output_path(data_type: str, orphacode: str, run_number: int, base_pat
     return f"{base_path}/{data_type}/{orphacode}/run{run_number}_disease2{data_type}.json"
 
 
-def save_processing_result(data: dict, data_type: str, orphacode: str, run_number: int, base_path: str = "data/02_preprocess"):
-    """Save processing result to appropriate location"""
+def save_processing_result(data: Union[dict, BaseModel], data_type: str, orphacode: str, run_number: int, base_path: str = "data/02_preprocess"):
+    """
+    Save processing result to appropriate location
+    
+    Pydantic models are serialized by pydantic-core straight to UTF-8
+    bytes, without building an intermediate dict or str first.
+    """
     output_path = create_output_path(data_type, orphacode, run_number, base_path)
     output_dir = Path(output_path).parent
     logger.info(f"Saving result to {output_path}")
     output_dir.mkdir(parents=True, exist_ok=True)
     
-    with open(output_path, 'w', encoding='utf-8') as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
+    if isinstance(data, BaseModel):
+        with open(output_path, 'wb') as f:
+            f.write(data.__pydantic_serializer__.to_json(data, indent=2))
+    else:
+        with open(output_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=2, ensure_ascii=False)
 
 
 def should_reprocess_disease(data_type: str, orphacode: str, run_number: int) -> bool:
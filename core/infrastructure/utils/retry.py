@@ -5,12 +5,19 @@ This module provides a reusable retry decorator that can be applied to any funct
 to handle transient failures with intelligent backoff strategies.
 """
 
-from tenacity import retry, stop_after_attempt, wait_exponential_jitter, retry_if_exception_type, RetryError
+from tenacity import retry, stop_after_attempt, wait_exponential_jitter, retry_if_exception, retry_if_exception_type, RetryError
 from typing import Callable, Any, Union, Tuple, Optional
+from collections import Counter
+import threading
 import logging
+import requests
 
 logger = logging.getLogger(__name__)
 
+# Number of HTTP retries per wrapped function, for spotting flaky endpoints
+http_retry_counts = Counter()
+_http_retry_lock = threading.Lock()
+
 
 def retry_it(func: Callable, attempts: int = 3) -> Callable:
     """
@@ -38,6 +45,53 @@ def retry_it(func: Callable, attempts: int = 3) -> Callable:
     )(func)
 
 
+def is_transient_http_error(exc: BaseException) -> bool:
+    """
+    Whether a requests failure is worth retrying.
+    
+    Connection errors, timeouts, 429 and 5xx responses are transient; any
+    other 4xx means the request itself is wrong and will fail again.
+    """
+    if isinstance(exc, requests.HTTPError):
+        status = exc.response.status_code if exc.response is not None else None
+        return status is not None and (status == 429 or status >= 500)
+    return isinstance(exc, (requests.ConnectionError, requests.Timeout))
+
+
+def _count_http_retry(retry_state) -> None:
+    """Record and log an HTTP retry before tenacity sleeps."""
+    name = retry_state.fn.__qualname__
+    with _http_retry_lock:
+        http_retry_counts[name] += 1
+    logger.warning(f"{name} failed ({retry_state.outcome.exception()}), "
+                   f"retrying (attempt {retry_state.attempt_number + 1})")
+
+
+def retry_http(attempts: int = 5, initial: float = 0.5, max_wait: float = 10) -> Callable:
+    """
+    Retry decorator for HTTP calls made with requests.
+    
+    Transient failures (see is_transient_http_error) are retried with
+    exponential backoff and jitter; anything else, and the last failure once
+    attempts run out, is re-raised unchanged for the caller to handle.
+    
+    Args:
+        attempts: Maximum number of attempts (default: 5)
+        initial: First backoff in seconds (default: 0.5)
+        max_wait: Upper bound for a single backoff in seconds (default: 10)
+        
+    Returns:
+        Decorator adding the retry logic
+    """
+    return retry(
+        stop=stop_after_attempt(attempts),
+        wait=wait_exponential_jitter(initial=initial, max=max_wait),
+        retry=retry_if_exception(is_transient_http_error),
+        before_sleep=_count_http_retry,
+        reraise=True
+    )
+
+
 class EmptySearchError(Exception):
     """Exception raised when a search returns empty results."""
     pass
@@ -1,4 +1,4 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 from typing import List, Dict, Optional
 from datetime import datetime
 
@@ -6,6 +6,8 @@ from datetime import datetime
 class SimpleDisease(BaseModel):
     disease_name: str
     orpha_code: str
+    
+    model_config = ConfigDict(frozen=True)
 
 
 class ClinicalTrialResult(BaseModel):
@@ -15,6 +17,8 @@ class ClinicalTrialResult(BaseModel):
     processing_timestamp: datetime
     run_number: int
     total_trials_found: int
+    
+    model_config = ConfigDict(frozen=True, extra='forbid')
 
 
 class ProcessingStatus(BaseModel):
@@ -49,4 +53,6 @@ class DrugResult(BaseModel):
     run_number: int
     total_drugs_found: int
     search_url: str
-    search_params: Dict 
\ No newline at end of file
+    search_params: Dict
+    
+    model_config = ConfigDict(frozen=True, extra='forbid')
@@ -5,7 +5,8 @@ These models represent the updated data structures used in Orpha drug processing
 based on the new boolean-based schema from preprocessed data.
 """
 
-from typing import List, Dict, Optional, Any
+from functools import cached_property
+from typing import List, Dict, Optional, Any, Iterable
 from pydantic import BaseModel, Field, validator
 from datetime import datetime
 
@@ -34,9 +35,14 @@ class DrugInstanceV2(BaseModel):
         # Use substance_id or regulatory_id as drug identifier
         return v
     
+    @cached_property
+    def drug_id(self) -> str:
+        """Unique drug identifier, preferring substance_id (computed once per instance)"""
+        return self.substance_id or self.regulatory_id or f"drug_{hash(self.name)}"
+    
     def get_drug_id(self) -> str:
         """Get unique drug identifier, preferring substance_id"""
-        return self.substance_id or self.regulatory_id or f"drug_{hash(self.name)}"
+        return self.drug_id
 
 
 class DiseaseDataV2(BaseModel):
@@ -181,12 +187,28 @@ def create_drug_name_mapping_v2(diseases_data: Dict[str, DiseaseDataV2]) -> Dict
     Args:
         diseases_data: Dictionary of disease data
         
+    Returns:
+        Dict mapping drug IDs to names (only specific drugs)
+    """
+    return create_drug_name_mapping_v2_stream(diseases_data.values())
+
+
+def create_drug_name_mapping_v2_stream(diseases: Iterable[DiseaseDataV2]) -> Dict[str, str]:
+    """
+    Create drug ID to name mapping from a stream of diseases, only including specific drugs
+    
+    Consumes the iterable one disease at a time, so a generator that loads
+    diseases from disk keeps memory bounded by the number of unique drugs.
+    
+    Args:
+        diseases: Iterable of disease data (e.g. a generator over run files)
+        
     Returns:
         Dict mapping drug IDs to names (only specific drugs)
     """
     drug_names = {}
     
-    for disease_data in diseases_data.values():
+    for disease_data in diseases:
         for drug in disease_data.drugs:
             # Only include drugs that are specific
             if not drug.is_specific:
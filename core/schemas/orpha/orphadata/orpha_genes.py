@@ -5,11 +5,99 @@ These models represent the data structures used in gene preprocessing,
 following the patterns established in the prevalence system.
 """
 
+import re
+import sys
+import string
 from typing import List, Dict, Optional, Any, Union
-from pydantic import BaseModel, Field, validator
+import numpy as np
+from pydantic import BaseModel, Field, validator, root_validator
 from datetime import datetime
 
 
+# Shared instances for small-vocabulary string fields (gene types, association
+# types/statuses, loci) so repeated values across records reference one object
+_INTERNED_VALUES: Dict[str, str] = {}
+
+
+def _intern(value: Any) -> Any:
+    """Return the shared instance of a repeated vocabulary string"""
+    if isinstance(value, str):
+        return _INTERNED_VALUES.setdefault(value, value)
+    return value
+
+
+def _reliability_score(record: Dict[str, Any]) -> float:
+    """A record's reliability_score as a float, NaN when missing or not numeric"""
+    try:
+        return float(record['reliability_score'])
+    except (KeyError, TypeError, ValueError):
+        return np.nan
+
+
+def _check_reliability_scores(records: List[Dict[str, Any]]) -> np.ndarray:
+    """
+    Range-check reliability_score across a batch of records in one pass
+    
+    Missing and non-numeric scores are reported as invalid rows along with
+    out-of-range ones.
+    
+    Returns:
+        The scores as a float64 array aligned with records
+    """
+    try:
+        scores = np.fromiter(
+            (record['reliability_score'] for record in records),
+            dtype=np.float64,
+            count=len(records)
+        )
+    except (KeyError, TypeError, ValueError):
+        scores = np.fromiter((_reliability_score(record) for record in records), dtype=np.float64, count=len(records))
+    
+    # NaN fails both comparisons, so it is caught here too
+    bad = np.flatnonzero(~((scores >= 0) & (scores <= 10)))
+    if bad.size:
+        raise ValueError(
+            f'Reliability score must be a number between 0 and 10 '
+            f'({bad.size} invalid records, first indices: {bad[:10].tolist()})'
+        )
+    return scores
+
+
+def _construct_batch(model_cls, records: List[Dict[str, Any]], scores: np.ndarray,
+                     vocabulary_fields: tuple) -> list:
+    """Build instances without per-record validation, interning vocabulary fields"""
+    instances = []
+    for record, score in zip(records, scores.tolist()):
+        values = dict(record, reliability_score=score)
+        for field_name in vocabulary_fields:
+            if field_name in values:
+                values[field_name] = _intern(values[field_name])
+        instances.append(model_cls.model_construct(**values))
+    return instances
+
+
+# Python 3.11+ parses the 'Z' UTC suffix natively; older versions need it rewritten
+if sys.version_info >= (3, 11):
+    _parse_timestamp = datetime.fromisoformat
+else:
+    def _parse_timestamp(value: str) -> datetime:
+        return datetime.fromisoformat(value[:-1] + '+00:00' if value.endswith('Z') else value)
+
+
+# External reference sources present in en_product6.xml mapped to the flat
+# GeneInstance fields that store them
+EXTERNAL_REFERENCE_FIELDS = {
+    "HGNC": "hgnc",
+    "OMIM": "omim",
+    "Ensembl": "ensembl",
+    "ClinVar": "clinvar",
+    "SwissProt": "swissprot",
+    "Genatlas": "genatlas",
+    "Reactome": "reactome",
+    "IUPHAR": "iuphar",
+}
+
+
 class GeneInstance(BaseModel):
     """
     Model for individual gene records from en_product6.xml
@@ -22,7 +110,17 @@ class GeneInstance(BaseModel):
     gene_type: str = Field(..., description="Gene type classification")
     gene_locus: Optional[str] = Field(None, description="Chromosomal location (e.g., 15q26.1)")
     gene_synonyms: List[str] = Field(default_factory=list, description="List of gene synonyms")
-    external_references: Dict[str, str] = Field(default_factory=dict, description="External database references")
+    
+    # External references (flattened, see EXTERNAL_REFERENCE_FIELDS)
+    hgnc: Optional[str] = Field(None, description="HGNC identifier")
+    omim: Optional[str] = Field(None, description="OMIM identifier")
+    ensembl: Optional[str] = Field(None, description="Ensembl gene identifier")
+    clinvar: Optional[str] = Field(None, description="ClinVar identifier")
+    swissprot: Optional[str] = Field(None, description="SwissProt identifier")
+    genatlas: Optional[str] = Field(None, description="Genatlas identifier")
+    reactome: Optional[str] = Field(None, description="Reactome identifier")
+    iuphar: Optional[str] = Field(None, description="IUPHAR identifier")
+    other_references: Optional[Dict[str, str]] = Field(None, description="References from sources without a dedicated field")
     
     # Calculated metrics
     associated_diseases_count: int = Field(0, description="Number of associated diseases")
@@ -31,30 +129,39 @@ class GeneInstance(BaseModel):
     # Processing metadata
     processing_metadata: Dict[str, Any] = Field(default_factory=dict, description="Processing metadata")
     
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "gene_id": "20160",
-                "gene_symbol": "KIF7",
-                "gene_name": "kinesin family member 7",
-                "gene_type": "gene with protein product",
-                "gene_locus": "15q26.1",
-                "gene_synonyms": ["JBTS12"],
-                "external_references": {
-                    "HGNC": "30497",
-                    "OMIM": "611254",
-                    "Ensembl": "ENSG00000166813",
-                    "ClinVar": "KIF7"
-                },
-                "associated_diseases_count": 3,
-                "validated_associations_count": 2,
-                "processing_metadata": {
-                    "first_seen": "2024-01-15T10:30:00Z",
-                    "data_quality_score": 9.2,
-                    "validation_status": "complete"
-                }
-            }
+    @root_validator(pre=True)
+    def flatten_external_references(cls, values):
+        # Accept the processed JSON layout ({"HGNC": ..., "OMIM": ...})
+        references = values.get('external_references')
+        if references is None:
+            return values
+        values = {k: v for k, v in values.items() if k != 'external_references'}
+        other = {}
+        for source, reference in references.items():
+            field_name = EXTERNAL_REFERENCE_FIELDS.get(source)
+            if field_name:
+                values.setdefault(field_name, reference)
+            else:
+                other[source] = reference
+        if other:
+            values.setdefault('other_references', other)
+        return values
+    
+    @validator('gene_type', 'gene_locus', pre=True)
+    def intern_vocabulary(cls, v):
+        return _intern(v)
+    
+    @property
+    def external_references(self) -> Dict[str, str]:
+        """External database references keyed by source name"""
+        references = {
+            source: getattr(self, field_name)
+            for source, field_name in EXTERNAL_REFERENCE_FIELDS.items()
+            if getattr(self, field_name)
         }
+        if self.other_references:
+            references.update(self.other_references)
+        return references
 
 
 class GeneAssociationInstance(BaseModel):
@@ -96,35 +203,28 @@ class GeneAssociationInstance(BaseModel):
             raise ValueError('Reliability score must be between 0 and 10')
         return v
     
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "gene_association_id": "assoc_166024_KIF7",
-                "orpha_code": "166024",
-                "disease_name": "Multiple epiphyseal dysplasia-macrocephaly-facial dysmorphism syndrome",
-                "gene_id": "20160",
-                "gene_symbol": "KIF7",
-                "gene_name": "kinesin family member 7",
-                "gene_type": "gene with protein product",
-                "gene_locus": "15q26.1",
-                "gene_synonyms": ["JBTS12"],
-                "association_type": "Disease-causing germline mutation(s) in",
-                "association_status": "Assessed",
-                "source_validation": "22587682[PMID]",
-                "reliability_score": 8.5,
-                "is_validated": True,
-                "external_references": {
-                    "HGNC": "30497",
-                    "OMIM": "611254",
-                    "Ensembl": "ENSG00000166813"
-                },
-                "processing_metadata": {
-                    "xml_disorder_id": "17601",
-                    "xml_gene_id": "20160",
-                    "processed_timestamp": "2024-01-15T10:30:00Z"
-                }
-            }
-        }
+    @validator('gene_type', 'gene_locus', 'association_type', 'association_status', pre=True)
+    def intern_vocabulary(cls, v):
+        return _intern(v)
+    
+    @classmethod
+    def bulk_validate(cls, records: List[Dict[str, Any]]) -> List['GeneAssociationInstance']:
+        """
+        Validate a batch of association records
+        
+        Reliability scores for the whole batch are range-checked in a single
+        vectorized pass, so an invalid batch is rejected (with every offending
+        row reported) before any instance is built. The instances are then
+        created with model_construct: records are expected to come from the
+        gene preprocessing output, and no other field is validated.
+        
+        Raises:
+            ValueError: If any reliability score is missing, not numeric or outside 0-10
+        """
+        scores = _check_reliability_scores(records)
+        return _construct_batch(cls, records, scores, (
+            'gene_type', 'gene_locus', 'association_type', 'association_status'
+        ))
 
 
 class DiseaseAssociation(BaseModel):
@@ -143,6 +243,97 @@ class DiseaseAssociation(BaseModel):
         if not 0 <= v <= 10:
             raise ValueError('Reliability score must be between 0 and 10')
         return v
+    
+    @validator('association_type', 'association_status', pre=True)
+    def intern_vocabulary(cls, v):
+        return _intern(v)
+    
+    @classmethod
+    def bulk_validate(cls, records: List[Dict[str, Any]]) -> List['DiseaseAssociation']:
+        """
+        Validate a batch of disease association records
+        
+        Same contract as GeneAssociationInstance.bulk_validate: only the
+        reliability scores are checked before model_construct.
+        
+        Raises:
+            ValueError: If any reliability score is missing, not numeric or outside 0-10
+        """
+        scores = _check_reliability_scores(records)
+        return _construct_batch(cls, records, scores, ('association_type', 'association_status'))
+
+
+class GeneAssociationStore:
+    """
+    Columnar store for the hot numeric fields of gene association instances
+    
+    Reliability score, validation flag and dictionary-encoded gene, disease and
+    association type columns are packed into one NumPy structured array, so
+    queries such as "validated associations with score >= 6" are a single
+    vectorized comparison instead of a walk over the instance dictionary.
+    The Pydantic instances remain the source of truth for full records.
+    """
+    DTYPE = np.dtype([
+        ('reliability_score', 'f8'),
+        ('is_validated', '?'),
+        ('gene_idx', 'u4'),
+        ('orpha_idx', 'u4'),
+        ('association_type_idx', 'u2'),
+    ])
+    
+    def __init__(self, arr: np.ndarray, association_ids: List[str], gene_ids: List[str],
+                 orpha_codes: List[str], association_types: List[str]):
+        self.arr = arr
+        self.association_ids = association_ids
+        self.gene_ids = gene_ids
+        self.orpha_codes = orpha_codes
+        self.association_types = association_types
+    
+    @classmethod
+    def from_instances(cls, instances: Dict[str, GeneAssociationInstance]) -> 'GeneAssociationStore':
+        """Build the store from an association_id -> instance mapping"""
+        gene_index: Dict[str, int] = {}
+        orpha_index: Dict[str, int] = {}
+        type_index: Dict[str, int] = {}
+        
+        arr = np.fromiter(
+            (
+                (
+                    assoc.reliability_score,
+                    assoc.is_validated,
+                    gene_index.setdefault(assoc.gene_id, len(gene_index)),
+                    orpha_index.setdefault(assoc.orpha_code, len(orpha_index)),
+                    type_index.setdefault(assoc.association_type, len(type_index)),
+                )
+                for assoc in instances.values()
+            ),
+            dtype=cls.DTYPE,
+            count=len(instances)
+        )
+        
+        return cls(
+            arr=arr,
+            association_ids=list(instances),
+            gene_ids=list(gene_index),
+            orpha_codes=list(orpha_index),
+            association_types=list(type_index)
+        )
+    
+    def __len__(self) -> int:
+        return len(self.arr)
+    
+    def validated_mask(self, min_score: float = 6.0) -> np.ndarray:
+        """Boolean mask of validated associations scoring at least min_score"""
+        return self.arr['is_validated'] & (self.arr['reliability_score'] >= min_score)
+    
+    def mean_reliability_score(self, mask: Optional[np.ndarray] = None) -> float:
+        """Mean reliability score, optionally restricted to a row mask"""
+        scores = self.arr['reliability_score'] if mask is None else self.arr['reliability_score'][mask]
+        return float(scores.mean()) if scores.size else 0.0
+    
+    def association_ids_where(self, mask: np.ndarray) -> List[str]:
+        """Association identifiers of the rows selected by mask"""
+        return [self.association_ids[i] for i in np.flatnonzero(mask)]
 
 
 class GeneAssociationStatistics(BaseModel):
@@ -176,6 +367,10 @@ class Gene2DiseasesMapping(BaseModel):
     
     # Statistics
     statistics: GeneAssociationStatistics = Field(default_factory=GeneAssociationStatistics, description="Association statistics")
+    
+    @validator('gene_type', 'gene_locus', pre=True)
+    def intern_vocabulary(cls, v):
+        return _intern(v)
 
 
 class GeneAssociationSummary(BaseModel):
@@ -194,6 +389,10 @@ class GeneAssociationSummary(BaseModel):
     gene_locus: Optional[str] = Field(None, description="Gene locus")
     gene_type: str = Field(..., description="Gene type")
     external_references: Dict[str, str] = Field(default_factory=dict, description="External references")
+    
+    @validator('gene_type', 'gene_locus', 'association_type', 'association_status', pre=True)
+    def intern_vocabulary(cls, v):
+        return _intern(v)
 
 
 class DiseaseStatistics(BaseModel):
@@ -281,7 +480,7 @@ class ProcessingStatistics(BaseModel):
     @validator('processing_timestamp')
     def validate_timestamp(cls, v):
         try:
-            datetime.fromisoformat(v.replace('Z', '+00:00'))
+            _parse_timestamp(v)
         except ValueError:
             raise ValueError('Invalid timestamp format')
         return v
@@ -297,6 +496,67 @@ class GeneProcessingResult(BaseModel):
     gene_instances: Dict[str, GeneInstance] = Field(default_factory=dict, description="Gene instances")
     gene_association_instances: Dict[str, GeneAssociationInstance] = Field(default_factory=dict, description="Association instances")
     orpha_index: Dict[str, OrphaIndexEntry] = Field(default_factory=dict, description="Orpha index")
+    
+    def to_dataframes(self) -> Dict[str, Any]:
+        """
+        Materialize gene and association instances as columnar DataFrames
+        
+        Vocabulary columns are stored as categoricals and counts as int32, so
+        analytical filters run over contiguous columns instead of walking the
+        model dictionaries.
+        
+        Returns:
+            Dict with 'gene_instances' and 'gene_association_instances' DataFrames
+        """
+        import pandas as pd
+        
+        genes = pd.DataFrame.from_records(
+            [gene.model_dump() for gene in self.gene_instances.values()],
+            columns=list(GeneInstance.model_fields)
+        )
+        genes['gene_type'] = genes['gene_type'].astype('category')
+        genes[['associated_diseases_count', 'validated_associations_count']] = (
+            genes[['associated_diseases_count', 'validated_associations_count']].astype('int32')
+        )
+        
+        associations = pd.DataFrame.from_records(
+            [assoc.model_dump() for assoc in self.gene_association_instances.values()],
+            columns=list(GeneAssociationInstance.model_fields)
+        )
+        for column in ('gene_type', 'association_type', 'association_status'):
+            associations[column] = associations[column].astype('category')
+        associations['is_validated'] = associations['is_validated'].astype(bool)
+        
+        return {
+            'gene_instances': genes,
+            'gene_association_instances': associations
+        }
+    
+    @classmethod
+    def from_dataframes(cls, statistics: ProcessingStatistics,
+                        gene_instances: Any,
+                        gene_association_instances: Any) -> 'GeneProcessingResult':
+        """
+        Rebuild a result from DataFrames produced by to_dataframes
+        
+        Only the instance collections are restored; mapping and index
+        dictionaries are left empty.
+        """
+        genes = gene_instances.astype(object).where(gene_instances.notna(), None)
+        associations = gene_association_instances.astype(object).where(
+            gene_association_instances.notna(), None
+        )
+        return cls(
+            statistics=statistics,
+            gene_instances={
+                record['gene_symbol']: GeneInstance(**record)
+                for record in genes.to_dict('records')
+            },
+            gene_association_instances={
+                record['gene_association_id']: GeneAssociationInstance(**record)
+                for record in associations.to_dict('records')
+            }
+        )
 
 
 # Type aliases for convenience
@@ -308,4 +568,23 @@ AssociationId = str
 # Common validation patterns
 ORPHA_CODE_PATTERN = r'^\d+$'
 GENE_SYMBOL_PATTERN = r'^[A-Z0-9-]+$'
-PMID_PATTERN = r'\d+\[PMID\]' 
\ No newline at end of file
+PMID_PATTERN = r'\d+\[PMID\]'
+
+# Compiled once at import so callers don't pay a pattern-cache lookup per match
+ORPHA_CODE_RE = re.compile(ORPHA_CODE_PATTERN)
+GENE_SYMBOL_RE = re.compile(GENE_SYMBOL_PATTERN)
+PMID_RE = re.compile(PMID_PATTERN)
+
+_GENE_SYMBOL_CHARS = frozenset(string.ascii_uppercase + string.digits + '-')
+
+find_pmids = PMID_RE.findall
+
+
+def is_orpha_code(value: str) -> bool:
+    """Check whether a value is a valid OrphaCode (digits only) without regex"""
+    return value.isdecimal()
+
+
+def is_gene_symbol(value: str) -> bool:
+    """Check whether a value is a valid gene symbol (A-Z, 0-9, '-') without regex"""
+    return bool(value) and _GENE_SYMBOL_CHARS.issuperset(value) 
\ No newline at end of file
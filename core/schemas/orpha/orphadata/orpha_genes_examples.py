@@ -0,0 +1,67 @@
+"""
+Example payloads for the Orphanet gene schemas
+
+The examples are only needed for JSON schema / OpenAPI export, so they live
+here instead of in the model classes and are attached on demand with
+attach_examples().
+"""
+
+from core.schemas.orpha.orphadata.orpha_genes import GeneInstance, GeneAssociationInstance
+
+
+GENE_INSTANCE_EXAMPLE = {
+    "gene_id": "20160",
+    "gene_symbol": "KIF7",
+    "gene_name": "kinesin family member 7",
+    "gene_type": "gene with protein product",
+    "gene_locus": "15q26.1",
+    "gene_synonyms": ["JBTS12"],
+    "hgnc": "30497",
+    "omim": "611254",
+    "ensembl": "ENSG00000166813",
+    "clinvar": "KIF7",
+    "associated_diseases_count": 3,
+    "validated_associations_count": 2,
+    "processing_metadata": {
+        "first_seen": "2024-01-15T10:30:00Z",
+        "data_quality_score": 9.2,
+        "validation_status": "complete"
+    }
+}
+
+GENE_ASSOCIATION_INSTANCE_EXAMPLE = {
+    "gene_association_id": "assoc_166024_KIF7",
+    "orpha_code": "166024",
+    "disease_name": "Multiple epiphyseal dysplasia-macrocephaly-facial dysmorphism syndrome",
+    "gene_id": "20160",
+    "gene_symbol": "KIF7",
+    "gene_name": "kinesin family member 7",
+    "gene_type": "gene with protein product",
+    "gene_locus": "15q26.1",
+    "gene_synonyms": ["JBTS12"],
+    "association_type": "Disease-causing germline mutation(s) in",
+    "association_status": "Assessed",
+    "source_validation": "22587682[PMID]",
+    "reliability_score": 8.5,
+    "is_validated": True,
+    "external_references": {
+        "HGNC": "30497",
+        "OMIM": "611254",
+        "Ensembl": "ENSG00000166813"
+    },
+    "processing_metadata": {
+        "xml_disorder_id": "17601",
+        "xml_gene_id": "20160",
+        "processed_timestamp": "2024-01-15T10:30:00Z"
+    }
+}
+
+
+def attach_examples() -> None:
+    """Attach the example payloads to the gene models' JSON schema"""
+    for model, example in (
+        (GeneInstance, GENE_INSTANCE_EXAMPLE),
+        (GeneAssociationInstance, GENE_ASSOCIATION_INSTANCE_EXAMPLE),
+    ):
+        model.model_config['json_schema_extra'] = {"example": example}
+        model.model_rebuild(force=True)
@@ -5,12 +5,58 @@ These models represent the data structures used in prevalence preprocessing,
 based on the actual output from tools/prevalence_preprocessing.py
 """
 
-from typing import List, Dict, Optional, Any, Union
-from pydantic import BaseModel, Field, validator
+import logging
+import sys
+from collections import Counter
+from dataclasses import dataclass
+from pathlib import Path
+from typing import List, Dict, Optional, Any, Union, Tuple
+import numpy as np
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter, ValidationError, validator, root_validator
 from datetime import datetime
 
+logger = logging.getLogger(__name__)
 
-class PrevalenceInstance(BaseModel):
+# Processing timestamp shared by every report built in this process
+_RUN_TIMESTAMP: Optional[str] = None
+
+
+def run_timestamp() -> str:
+    """ISO timestamp of the current run, computed once per process"""
+    global _RUN_TIMESTAMP
+    if _RUN_TIMESTAMP is None:
+        _RUN_TIMESTAMP = datetime.now().isoformat()
+    return _RUN_TIMESTAMP
+
+
+# Codebooks for the small fixed vocabularies of categorical prevalence fields.
+# Columnar views store the int8 code; -1 marks a value outside the codebook.
+PREVALENCE_TYPE_NAMES = ("Point prevalence", "Prevalence at birth", "Annual incidence", "Cases/families")
+VALIDATION_STATUS_NAMES = ("Validated", "Not yet validated", "")
+QUALIFICATION_NAMES = ("Value and class", "Class only", "Case(s)", "Family(ies)")
+
+PREVALENCE_TYPE_CODES = {name: code for code, name in enumerate(PREVALENCE_TYPE_NAMES)}
+VALIDATION_STATUS_CODES = {name: code for code, name in enumerate(VALIDATION_STATUS_NAMES)}
+QUALIFICATION_CODES = {name: code for code, name in enumerate(QUALIFICATION_NAMES)}
+
+_VALID_PREVALENCE_TYPES = frozenset(PREVALENCE_TYPE_NAMES)
+_VALID_VALIDATION_STATUSES = frozenset(VALIDATION_STATUS_NAMES)
+_SCORE_BREAKDOWN_KEYS = ("validation_status", "has_pmid", "qualification", "prevalence_type", "geographic_specificity")
+_REQUIRED_SCORE_BREAKDOWN_KEYS = frozenset(_SCORE_BREAKDOWN_KEYS)
+
+
+class _FrozenModel(BaseModel):
+    """
+    Base for the prevalence schemas
+    
+    Instances are immutable once validated, so nested models (e.g. the
+    PrevalenceInstance lists inside DiseasePrevalenceMapping) are shared by
+    reference and never revalidated or copied.
+    """
+    model_config = ConfigDict(frozen=True, revalidate_instances='never')
+
+
+class PrevalenceInstance(_FrozenModel):
     """
     Model for individual prevalence records from en_product9_prev.xml
     
@@ -30,34 +76,140 @@ class PrevalenceInstance(BaseModel):
     validation_status: str = Field(..., description="Validated, Not yet validated")
     
     # Calculated reliability metrics
-    reliability_score: float = Field(..., description="Calculated reliability score 0-10")
+    reliability_score: float = Field(..., ge=0, le=10, description="Calculated reliability score 0-10")
     is_fiable: bool = Field(..., description="Meets reliability criteria (≥6.0 score)")
     
     # Processed data
     per_million_estimate: Optional[float] = Field(None, description="Standardized per-million estimate")
     
-    @validator('reliability_score')
-    def validate_reliability_score(cls, v):
-        if not 0 <= v <= 10:
-            raise ValueError('Reliability score must be between 0 and 10')
-        return v
-    
     @validator('prevalence_type')
     def validate_prevalence_type(cls, v):
-        valid_types = ["Point prevalence", "Prevalence at birth", "Annual incidence", "Cases/families"]
-        if v not in valid_types:
-            raise ValueError(f'Prevalence type must be one of: {valid_types}')
+        if v not in _VALID_PREVALENCE_TYPES:
+            raise ValueError(f'Prevalence type must be one of: {list(PREVALENCE_TYPE_NAMES)}')
         return v
     
     @validator('validation_status')
     def validate_validation_status(cls, v):
-        valid_statuses = ["Validated", "Not yet validated", ""]
-        if v not in valid_statuses:
-            raise ValueError(f'Validation status must be one of: {valid_statuses}')
+        if v not in _VALID_VALIDATION_STATUSES:
+            raise ValueError(f'Validation status must be one of: {list(VALIDATION_STATUS_NAMES)}')
         return v
 
 
-class ReliabilityScore(BaseModel):
+def _code_distribution(codes: np.ndarray, names) -> Dict[str, int]:
+    """Count dictionary-encoded values with np.bincount, skipping unknown (-1) codes"""
+    counts = np.bincount(codes[codes >= 0], minlength=len(names))
+    return {names[code]: count for code, count in enumerate(counts.tolist()) if count}
+
+
+class PrevalenceTable:
+    """
+    Columnar (structure-of-arrays) view over a set of prevalence records
+    
+    The fields used for reliability filtering and weighted means are held as
+    parallel NumPy arrays, with geographic_area dictionary-encoded against
+    the geographic_areas codebook. Counts such as reliable records become a
+    single vectorized reduction instead of a walk over PrevalenceInstance
+    objects. prevalence_type, validation_status and qualification are stored
+    as int8 codes into the module-level codebooks, and the numeric
+    prevalence_id / orpha_code strings as int32. The instances are kept
+    alongside for full-record access.
+    """
+    __slots__ = (
+        'prevalence_ids', 'orpha_codes', 'reliability_score', 'is_fiable', 'val_moy',
+        'per_million_estimate', 'geographic_area_idx', 'geographic_areas',
+        'prevalence_type_code', 'validation_status_code', 'qualification_code', 'records',
+    )
+    
+    def __init__(self, prevalence_ids: np.ndarray, orpha_codes: np.ndarray,
+                 reliability_score: np.ndarray, is_fiable: np.ndarray,
+                 val_moy: np.ndarray, per_million_estimate: np.ndarray,
+                 geographic_area_idx: np.ndarray, geographic_areas: List[str],
+                 prevalence_type_code: np.ndarray, validation_status_code: np.ndarray,
+                 qualification_code: np.ndarray, records: List[PrevalenceInstance]):
+        self.prevalence_ids = prevalence_ids
+        self.orpha_codes = orpha_codes
+        self.reliability_score = reliability_score
+        self.is_fiable = is_fiable
+        self.val_moy = val_moy
+        self.per_million_estimate = per_million_estimate
+        self.geographic_area_idx = geographic_area_idx
+        self.geographic_areas = geographic_areas
+        self.prevalence_type_code = prevalence_type_code
+        self.validation_status_code = validation_status_code
+        self.qualification_code = qualification_code
+        self.records = records
+    
+    @classmethod
+    def from_instances(cls, instances: Dict[str, PrevalenceInstance]) -> 'PrevalenceTable':
+        """Build the table from a prevalence_id -> instance mapping"""
+        records = list(instances.values())
+        n = len(records)
+        area_index: Dict[str, int] = {}
+        
+        def _optional(value: Optional[float]) -> float:
+            return np.nan if value is None else value
+        
+        return cls(
+            prevalence_ids=np.fromiter((int(r.prevalence_id) for r in records), dtype=np.int32, count=n),
+            orpha_codes=np.fromiter((int(r.orpha_code) for r in records), dtype=np.int32, count=n),
+            reliability_score=np.fromiter((r.reliability_score for r in records), dtype=np.float32, count=n),
+            is_fiable=np.fromiter((r.is_fiable for r in records), dtype=np.bool_, count=n),
+            val_moy=np.fromiter((_optional(r.val_moy) for r in records), dtype=np.float32, count=n),
+            per_million_estimate=np.fromiter(
+                (_optional(r.per_million_estimate) for r in records), dtype=np.float32, count=n
+            ),
+            geographic_area_idx=np.fromiter(
+                (area_index.setdefault(r.geographic_area, len(area_index)) for r in records),
+                dtype=np.int16, count=n
+            ),
+            geographic_areas=list(area_index),
+            prevalence_type_code=np.fromiter(
+                (PREVALENCE_TYPE_CODES.get(r.prevalence_type, -1) for r in records), dtype=np.int8, count=n
+            ),
+            validation_status_code=np.fromiter(
+                (VALIDATION_STATUS_CODES.get(r.validation_status, -1) for r in records), dtype=np.int8, count=n
+            ),
+            qualification_code=np.fromiter(
+                (QUALIFICATION_CODES.get(r.qualification, -1) for r in records), dtype=np.int8, count=n
+            ),
+            records=records
+        )
+    
+    def __len__(self) -> int:
+        return len(self.records)
+    
+    def reliable_records(self, mask: Optional[np.ndarray] = None) -> int:
+        """Number of fiable records, optionally restricted to a row mask"""
+        is_fiable = self.is_fiable if mask is None else self.is_fiable[mask]
+        return int(is_fiable.sum())
+    
+    def orpha_code_mask(self, orpha_code: Union[int, str]) -> np.ndarray:
+        """Boolean mask of the records belonging to one disease"""
+        return self.orpha_codes == int(orpha_code)
+    
+    def validated_mask(self) -> np.ndarray:
+        """Boolean mask of records with 'Validated' status"""
+        return self.validation_status_code == VALIDATION_STATUS_CODES["Validated"]
+    
+    def distributions(self) -> Dict[str, Dict[str, int]]:
+        """
+        Record counts by region, validation status and prevalence type
+        
+        Keyed like the distribution fields of ValidationReport and
+        ProcessingStatistics, so the result can be passed to either directly.
+        """
+        return {
+            'geographic_distribution': _code_distribution(self.geographic_area_idx, self.geographic_areas),
+            'validation_status_distribution': _code_distribution(self.validation_status_code, VALIDATION_STATUS_NAMES),
+            'prevalence_type_distribution': _code_distribution(self.prevalence_type_code, PREVALENCE_TYPE_NAMES),
+        }
+    
+    def to_instances(self) -> Dict[str, PrevalenceInstance]:
+        """Return the prevalence_id -> instance mapping the table was built from"""
+        return {record.prevalence_id: record for record in self.records}
+
+
+class ReliabilityScore(_FrozenModel):
     """
     Model for detailed reliability scoring breakdown
     
@@ -71,14 +223,12 @@ class ReliabilityScore(BaseModel):
     
     @validator('score_breakdown')
     def validate_score_breakdown(cls, v):
-        required_keys = ["validation_status", "has_pmid", "qualification", "prevalence_type", "geographic_specificity"]
-        for key in required_keys:
-            if key not in v:
-                raise ValueError(f'Score breakdown must include: {required_keys}')
+        if not _REQUIRED_SCORE_BREAKDOWN_KEYS.issubset(v):
+            raise ValueError(f'Score breakdown must include: {list(_SCORE_BREAKDOWN_KEYS)}')
         return v
 
 
-class MeanCalculationMetadata(BaseModel):
+class MeanCalculationMetadata(_FrozenModel):
     """Metadata for weighted mean calculation"""
     mean_value_per_million: float = Field(..., description="Calculated weighted mean")
     valid_records_count: int = Field(..., description="Records used in calculation")
@@ -89,14 +239,21 @@ class MeanCalculationMetadata(BaseModel):
     weight_distribution: Dict[str, float] = Field(default_factory=dict, description="Min/max/mean weight statistics")
 
 
-class DiseaseStatistics(BaseModel):
-    """Statistics for a disease's prevalence records"""
-    total_records: int = Field(..., description="Total number of prevalence records")
-    reliable_records: int = Field(..., description="Number of reliable records (≥6.0 score)")
-    valid_for_mean: int = Field(0, description="Number of records valid for mean calculation")
+@dataclass(frozen=True)
+class DiseaseStatistics:
+    """
+    Statistics for a disease's prevalence records
+    
+    A plain dataclass rather than a BaseModel: it is built once per disease
+    and needs no validation of its own. Pydantic still validates dict input
+    when it is nested in DiseasePrevalenceMapping and serializes it as an object.
+    """
+    total_records: int  # Total number of prevalence records
+    reliable_records: int  # Number of reliable records (≥6.0 score)
+    valid_for_mean: int = 0  # Number of records valid for mean calculation
 
 
-class DiseasePrevalenceMapping(BaseModel):
+class DiseasePrevalenceMapping(_FrozenModel):
     """
     Model for OrphaCode-to-prevalence relationships (disease2prevalence.json)
     
@@ -122,14 +279,61 @@ class DiseasePrevalenceMapping(BaseModel):
     # Statistics
     statistics: DiseaseStatistics = Field(..., description="Statistics for this disease")
     
-    @validator('statistics', pre=True)
-    def create_statistics(cls, v, values):
-        if isinstance(v, dict):
-            return DiseaseStatistics(**v)
-        return v
-
-
-class OrphaIndex(BaseModel):
+    @root_validator(pre=True)
+    def share_prevalence_records(cls, values):
+        """
+        Validate each prevalence record once
+        
+        most_reliable_prevalence, validated_prevalences and regional_prevalences
+        repeat records from prevalence_records. When loading from JSON they
+        arrive as separate dict copies, so they are resolved by prevalence_id
+        to the validated instances instead of being validated again; the ids
+        must therefore be unique within prevalence_records.
+        """
+        records = values.get('prevalence_records')
+        if not records:
+            return values
+        
+        values = dict(values)
+        instances = []
+        by_id = {}
+        for i, record in enumerate(records):
+            if not isinstance(record, PrevalenceInstance):
+                try:
+                    record = PrevalenceInstance(**record)
+                except ValidationError as e:
+                    # Keep the record's position in the error locations
+                    raise ValidationError.from_exception_data(cls.__name__, [
+                        {'type': err['type'], 'loc': ('prevalence_records', i, *err['loc']),
+                         'input': err['input'], **({'ctx': err['ctx']} if 'ctx' in err else {})}
+                        for err in e.errors()
+                    ])
+            if record.prevalence_id in by_id:
+                raise ValueError(
+                    f"prevalence_records.{i}: duplicate prevalence_id '{record.prevalence_id}'"
+                )
+            instances.append(record)
+            by_id[record.prevalence_id] = record
+        
+        def resolve(record):
+            if isinstance(record, dict):
+                return by_id.get(record.get('prevalence_id'), record)
+            return record
+        
+        values['prevalence_records'] = instances
+        if values.get('most_reliable_prevalence') is not None:
+            values['most_reliable_prevalence'] = resolve(values['most_reliable_prevalence'])
+        if values.get('validated_prevalences'):
+            values['validated_prevalences'] = [resolve(r) for r in values['validated_prevalences']]
+        if values.get('regional_prevalences'):
+            values['regional_prevalences'] = {
+                region: [resolve(r) for r in region_records]
+                for region, region_records in values['regional_prevalences'].items()
+            }
+        return values
+
+
+class OrphaIndex(_FrozenModel):
     """
     Model for optimized OrphaCode lookup (orpha_index.json)
     
@@ -141,7 +345,7 @@ class OrphaIndex(BaseModel):
     geographic_areas: List[str] = Field(default_factory=list, description="List of geographic areas")
 
 
-class RegionalSummary(BaseModel):
+class RegionalSummary(_FrozenModel):
     """
     Model for regional summary statistics (regional_data/regional_summary.json)
     """
@@ -150,21 +354,15 @@ class RegionalSummary(BaseModel):
     diseases: int = Field(..., description="Number of diseases with prevalence data in this region")
 
 
-class PrevalenceClassMapping(BaseModel):
+class PrevalenceClassMapping(_FrozenModel):
     """
     Model for prevalence class standardization (cache/prevalence_classes.json)
     """
-    per_million_min: float = Field(..., description="Minimum per-million estimate")
-    per_million_max: float = Field(..., description="Maximum per-million estimate")
-    
-    @validator('per_million_min', 'per_million_max')
-    def validate_per_million(cls, v):
-        if v < 0:
-            raise ValueError('Per-million values must be non-negative')
-        return v
+    per_million_min: float = Field(..., ge=0, description="Minimum per-million estimate")
+    per_million_max: float = Field(..., ge=0, description="Maximum per-million estimate")
 
 
-class GeographicIndex(BaseModel):
+class GeographicIndex(_FrozenModel):
     """
     Model for geographic area groupings (cache/geographic_index.json)
     """
@@ -172,33 +370,28 @@ class GeographicIndex(BaseModel):
     total_records: int = Field(..., description="Total records in this region")
 
 
-class DataQualityMetrics(BaseModel):
-    """Data quality metrics for validation report"""
-    total_records: int = Field(..., description="Total prevalence records processed")
-    reliable_records: int = Field(..., description="Records meeting reliability threshold")
-    reliability_percentage: float = Field(..., description="Percentage of reliable records")
-    validated_records: int = Field(..., description="Records with 'Validated' status")
+@dataclass(frozen=True)
+class DataQualityMetrics:
+    """Data quality metrics for validation report, validated when nested in ValidationReport"""
+    total_records: int  # Total prevalence records processed
+    reliable_records: int  # Records meeting reliability threshold
+    reliability_percentage: float  # Percentage of reliable records
+    validated_records: int  # Records with 'Validated' status
 
 
-class ValidationReport(BaseModel):
+class ValidationReport(_FrozenModel):
     """
     Model for data quality assessment (reliability/validation_report.json)
     """
-    processing_timestamp: str = Field(..., description="ISO timestamp of processing")
+    processing_timestamp: str = Field(default_factory=run_timestamp, description="ISO timestamp of processing")
     
     data_quality_metrics: DataQualityMetrics = Field(..., description="Quality metrics")
     geographic_distribution: Dict[str, int] = Field(default_factory=dict, description="Records by region")
     validation_status_distribution: Dict[str, int] = Field(default_factory=dict, description="Records by validation status")
     prevalence_type_distribution: Dict[str, int] = Field(default_factory=dict, description="Records by prevalence type")
-    
-    @validator('data_quality_metrics', pre=True)
-    def create_data_quality_metrics(cls, v):
-        if isinstance(v, dict):
-            return DataQualityMetrics(**v)
-        return v
 
 
-class ProcessingStatistics(BaseModel):
+class ProcessingStatistics(_FrozenModel):
     """
     Model for processing statistics (cache/statistics.json)
     """
@@ -211,7 +404,7 @@ class ProcessingStatistics(BaseModel):
     validation_status_distribution: Dict[str, int] = Field(default_factory=dict, description="Distribution by validation")
     prevalence_type_distribution: Dict[str, int] = Field(default_factory=dict, description="Distribution by type")
     
-    processing_timestamp: str = Field(..., description="Processing timestamp")
+    processing_timestamp: str = Field(default_factory=run_timestamp, description="Processing timestamp")
     file_sizes: Optional[Dict[str, str]] = Field(None, description="Generated file sizes")
     total_size_mb: Optional[str] = Field(None, description="Total output size")
 
@@ -226,8 +419,34 @@ PrevalenceClassMappings = Dict[str, PrevalenceClassMapping]
 GeographicIndexMapping = Dict[str, GeographicIndex]
 ReliabilityScores = Dict[str, ReliabilityScore]
 
+# Parses and validates disease2prevalence.json in a single pass
+_DISEASE2PREVALENCE_ADAPTER = TypeAdapter(Disease2PrevalenceMapping)
+
+
+def load_disease_prevalence(path: Union[str, Path]) -> Disease2PrevalenceMapping:
+    """Load and validate a disease2prevalence.json file"""
+    return _DISEASE2PREVALENCE_ADAPTER.validate_json(Path(path).read_bytes())
+
+
+def save_disease_prevalence(mapping: Disease2PrevalenceMapping, path: Union[str, Path]) -> None:
+    """Write a disease2prevalence mapping as indented UTF-8 JSON"""
+    Path(path).write_bytes(_DISEASE2PREVALENCE_ADAPTER.dump_json(mapping, indent=2))
+
 
 # Data validation functions
+_MODEL_MAP = {
+    'prevalence_instance': PrevalenceInstance,
+    'disease_prevalence_mapping': DiseasePrevalenceMapping,
+    'orpha_index': OrphaIndex,
+    'regional_summary': RegionalSummary,
+    'reliability_score': ReliabilityScore,
+    'validation_report': ValidationReport
+}
+
+# Validation failures per model type, for summary reporting
+_VALIDATION_ERROR_COUNTS: Counter = Counter()
+
+
 def validate_prevalence_data(data: Dict[str, Any], model_type: str) -> bool:
     """
     Validate prevalence data against appropriate Pydantic model
@@ -239,20 +458,11 @@ def validate_prevalence_data(data: Dict[str, Any], model_type: str) -> bool:
     Returns:
         bool: True if data is valid
     """
-    model_map = {
-        'prevalence_instance': PrevalenceInstance,
-        'disease_prevalence_mapping': DiseasePrevalenceMapping,
-        'orpha_index': OrphaIndex,
-        'regional_summary': RegionalSummary,
-        'reliability_score': ReliabilityScore,
-        'validation_report': ValidationReport
-    }
-    
-    if model_type not in model_map:
+    model_class = _MODEL_MAP.get(model_type)
+    if model_class is None:
         raise ValueError(f"Unknown model type: {model_type}")
     
     try:
-        model_class = model_map[model_type]
         if isinstance(data, dict):
             model_class(**data)
         elif isinstance(data, list):
@@ -260,24 +470,86 @@ def validate_prevalence_data(data: Dict[str, Any], model_type: str) -> bool:
                 model_class(**item)
         return True
     except Exception as e:
-        print(f"Validation error for {model_type}: {e}")
+        _VALIDATION_ERROR_COUNTS[model_type] += 1
+        logger.debug("Validation error for %s: %s", model_type, e)
         return False
 
 
+def validate_prevalence_data_batch(items: List[Dict[str, Any]], model_type: str) -> Tuple[int, List[Tuple[int, str]]]:
+    """
+    Validate a list of records, collecting failures instead of stopping at the first
+    
+    Args:
+        items: Dictionary records to validate
+        model_type: Type of model to validate against
+        
+    Returns:
+        Tuple of (valid record count, list of (item index, error message))
+    """
+    model_class = _MODEL_MAP.get(model_type)
+    if model_class is None:
+        raise ValueError(f"Unknown model type: {model_type}")
+    
+    errors = []
+    for index, item in enumerate(items):
+        try:
+            model_class(**item)
+        except Exception as e:
+            errors.append((index, str(e)))
+    
+    if errors:
+        _VALIDATION_ERROR_COUNTS[model_type] += len(errors)
+        logger.debug("%d validation errors for %s", len(errors), model_type)
+    return len(items) - len(errors), errors
+
+
+def validate_prevalence_batch(scores: np.ndarray, per_million_min: np.ndarray,
+                              per_million_max: np.ndarray) -> np.ndarray:
+    """
+    Vectorized range checks over columnar prevalence data
+    
+    Applies the reliability_score (0-10) and per-million (non-negative,
+    ordered min/max) constraints to whole arrays at once.
+    
+    Returns:
+        np.ndarray: Boolean mask of rows that pass every check
+    """
+    scores = np.asarray(scores, dtype=np.float64)
+    per_million_min = np.asarray(per_million_min, dtype=np.float64)
+    per_million_max = np.asarray(per_million_max, dtype=np.float64)
+    return (
+        (scores >= 0.0) & (scores <= 10.0)
+        & (per_million_min >= 0.0)
+        & (per_million_max >= per_million_min)
+    )
+
+
 # Utility functions for model creation
+# Disease names repeat across every prevalence record of a disease; deduped
+# here rather than through sys.intern to keep them out of the global table
+_NAME_CACHE: Dict[str, str] = {}
+
+
 def create_prevalence_instance(xml_data: Dict[str, Any], orpha_code: str, disease_name: str) -> PrevalenceInstance:
-    """Create PrevalenceInstance from XML data"""
+    """
+    Create PrevalenceInstance from XML data
+
+    Records are always validated: under Pydantic v2 model_construct() is
+    slower than the compiled validator for this model, so there is no
+    separate trusted path for preprocessed data.
+    """
+    prevalence_class = xml_data.get('prevalence_class')
     return PrevalenceInstance(
         prevalence_id=xml_data.get('id', ''),
         orpha_code=orpha_code,
-        disease_name=disease_name,
+        disease_name=_NAME_CACHE.setdefault(disease_name, disease_name),
         source=xml_data.get('source', ''),
-        prevalence_type=xml_data.get('prevalence_type', ''),
-        prevalence_class=xml_data.get('prevalence_class'),
-        qualification=xml_data.get('qualification', ''),
+        prevalence_type=sys.intern(xml_data.get('prevalence_type', '')),
+        prevalence_class=sys.intern(prevalence_class) if prevalence_class is not None else None,
+        qualification=sys.intern(xml_data.get('qualification', '')),
         val_moy=xml_data.get('val_moy'),
-        geographic_area=xml_data.get('geographic_area', ''),
-        validation_status=xml_data.get('validation_status', ''),
+        geographic_area=sys.intern(xml_data.get('geographic_area', '')),
+        validation_status=sys.intern(xml_data.get('validation_status', '')),
         reliability_score=xml_data.get('reliability_score', 0.0),
         is_fiable=xml_data.get('is_fiable', False),
         per_million_estimate=xml_data.get('per_million_estimate')
@@ -287,24 +559,28 @@ def create_prevalence_instance(xml_data: Dict[str, Any], orpha_code: str, diseas
 def create_disease_prevalence_mapping(orpha_code: str, disease_name: str, 
                                     prevalence_records: List[PrevalenceInstance]) -> DiseasePrevalenceMapping:
     """Create DiseasePrevalenceMapping from prevalence records"""
-    # Find most reliable
-    most_reliable = max(prevalence_records, key=lambda x: x.reliability_score) if prevalence_records else None
-    
-    # Filter validated
-    validated = [r for r in prevalence_records if r.validation_status == "Validated"]
-    
-    # Group by region
+    # Single pass: most reliable record, reliable count, validated filter
+    # and regional grouping
+    most_reliable = None
+    best_score = -1.0
+    reliable_records = 0
+    validated = []
     regional = {}
     for record in prevalence_records:
-        region = record.geographic_area or "Unknown"
-        if region not in regional:
-            regional[region] = []
-        regional[region].append(record)
+        score = record.reliability_score
+        if score > best_score:
+            most_reliable = record
+            best_score = score
+        if record.is_fiable:
+            reliable_records += 1
+        if record.validation_status == "Validated":
+            validated.append(record)
+        regional.setdefault(record.geographic_area or "Unknown", []).append(record)
     
     # Statistics
     stats = DiseaseStatistics(
         total_records=len(prevalence_records),
-        reliable_records=len([r for r in prevalence_records if r.is_fiable])
+        reliable_records=reliable_records
     )
     
     return DiseasePrevalenceMapping(
@@ -14,16 +14,40 @@ The script processes diseases from curated data sources, applies scoring algorit
 and outputs a prioritized Excel file with the top N diseases and a JSON file.
 """
 
+import re
 import sys
 import json
+import math
+import queue
+import atexit
+import importlib.util
 import yaml
 import logging
 import argparse
-import pandas as pd
+import zipfile
+from xml.sax.saxutils import escape, quoteattr
+from logging.handlers import QueueHandler, QueueListener
+import numpy as np
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, List, Any, Optional
-from dataclasses import dataclass
+from typing import TYPE_CHECKING, Dict, List, Any, Optional, Tuple, Union
+from functools import cached_property, partial
+from collections import namedtuple
+from dataclasses import dataclass, field
+
+# pandas and openpyxl are only needed by the Excel exports and are imported
+# there, so --dry-run / --help don't pay for them
+if TYPE_CHECKING:
+    import pandas as pd
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Only checked here; pandas imports xlsxwriter when _write_excel uses it
+XLSXWRITER_AVAILABLE = importlib.util.find_spec('xlsxwriter') is not None
 
 # Add project root to Python path
 project_root = Path(__file__).parent.parent.parent
@@ -39,7 +63,28 @@ from core.datastore.websearch.curated_websearch_socioeconomic_client import Cura
 from core.datastore.websearch.curated_websearch_groups_client import CuratedWebsearchGroupsClient
 
 
-@dataclass
+LOG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+
+
+# Criteria in CriteriaScore field order, used for column-wise scoring
+CRITERIA_KEYS = ('prevalence', 'socioeconomic', 'orpha_drugs', 'clinical_trials', 'orpha_gene', 'groups')
+
+# Criteria display names for the summary report, in CRITERIA_KEYS order
+CRITERIA_LABELS = (
+    ('Prevalence', 'prevalence'),
+    ('Socioeconomic', 'socioeconomic'),
+    ('Drugs (Therapies)', 'orpha_drugs'),
+    ('Clinical Trials', 'clinical_trials'),
+    ('Gene Therapy', 'orpha_gene'),
+    ('Groups', 'groups'),
+)
+
+
+# Slotted dataclasses need Python 3.10+; older interpreters get regular ones
+_DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(frozen=True, **_DATACLASS_SLOTS)
 class CriteriaScore:
     """Data class for storing criteria scores"""
     prevalence: float = 0.0
@@ -50,7 +95,20 @@ class CriteriaScore:
     groups: float = 0.0
     
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
+class CriteriaEvidence:
+    """Data class for the raw client data behind a disease's criteria scores"""
+    prevalence_class: Optional[str] = None
+    evidence_level: Optional[str] = None
+    eu_tradename_ids: List[str] = field(default_factory=list)
+    eu_medical_ids: List[str] = field(default_factory=list)
+    spanish_trials: List[str] = field(default_factory=list)
+    eu_trials: List[str] = field(default_factory=list)
+    genes: List[str] = field(default_factory=list)
+    groups: List[str] = field(default_factory=list)
+
+
+@dataclass(**_DATACLASS_SLOTS)
 class DiseaseScore:
     """Data class for storing disease prioritization results"""
     orpha_code: str
@@ -58,6 +116,250 @@ class DiseaseScore:
     criteria_scores: CriteriaScore
     weighted_score: float
     rank: int = 0
+    evidence: Optional[CriteriaEvidence] = None
+
+
+def _weighted_sum(score_matrix: np.ndarray, weights: Tuple[float, ...]) -> np.ndarray:
+    """
+    Weighted sum of an (N, 6) criteria score matrix
+    
+    Accumulated criterion by criterion in CRITERIA_KEYS order, so every row
+    gets exactly the float64 result of a left-to-right sum of its scores.
+    """
+    weighted_scores = np.zeros(score_matrix.shape[0])
+    weighted_column = np.empty(score_matrix.shape[0])
+    for j, weight in enumerate(weights):
+        np.multiply(score_matrix[:, j], weight, out=weighted_column)
+        weighted_scores += weighted_column
+    return weighted_scores
+
+
+@dataclass(**_DATACLASS_SLOTS)
+class ScoredTable:
+    """
+    Struct-of-arrays view of prioritization results, one row per disease
+    
+    criteria_scores columns follow CRITERIA_KEYS; rows are in the order they
+    were given (rank order when produced by rank_diseases).
+    """
+    ranks: np.ndarray            # int64
+    orpha_codes: np.ndarray      # object (str)
+    disease_names: np.ndarray    # object (str)
+    criteria_scores: np.ndarray  # (N, 6) float64
+    weighted_scores: np.ndarray  # float64
+    evidence: List[Optional[CriteriaEvidence]]
+    
+    def __len__(self) -> int:
+        return len(self.ranks)
+    
+    @classmethod
+    def from_disease_scores(cls, scored_diseases: List[DiseaseScore]) -> 'ScoredTable':
+        """Build a table from DiseaseScore objects in a single pass"""
+        n = len(scored_diseases)
+        ranks = np.empty(n, dtype=np.int64)
+        orpha_codes = np.empty(n, dtype=object)
+        disease_names = np.empty(n, dtype=object)
+        criteria_scores = np.empty((n, len(CRITERIA_KEYS)))
+        weighted_scores = np.empty(n)
+        evidence = []
+        for i, d in enumerate(scored_diseases):
+            c = d.criteria_scores
+            ranks[i] = d.rank
+            orpha_codes[i] = d.orpha_code
+            disease_names[i] = d.disease_name
+            criteria_scores[i] = (c.prevalence, c.socioeconomic, c.orpha_drugs, c.clinical_trials, c.orpha_gene, c.groups)
+            weighted_scores[i] = d.weighted_score
+            evidence.append(d.evidence)
+        return cls(ranks, orpha_codes, disease_names, criteria_scores, weighted_scores, evidence)
+    
+    def criterion(self, key: str) -> np.ndarray:
+        """Scores for one criterion, by CRITERIA_KEYS name"""
+        return self.criteria_scores[:, CRITERIA_KEYS.index(key)]
+    
+    def head(self, n: int) -> 'ScoredTable':
+        """First n rows (views of the arrays, no copy)"""
+        return ScoredTable(
+            ranks=self.ranks[:n],
+            orpha_codes=self.orpha_codes[:n],
+            disease_names=self.disease_names[:n],
+            criteria_scores=self.criteria_scores[:n],
+            weighted_scores=self.weighted_scores[:n],
+            evidence=self.evidence[:n]
+        )
+    
+    def reweighted(self, weights: Dict[str, float]) -> 'ScoredTable':
+        """
+        Recompute weighted scores with new criteria weights, without rescoring
+        
+        Rows keep their order and ranks; use top_n() to re-rank.
+        """
+        return ScoredTable(
+            ranks=self.ranks,
+            orpha_codes=self.orpha_codes,
+            disease_names=self.disease_names,
+            criteria_scores=self.criteria_scores,
+            weighted_scores=_weighted_sum(self.criteria_scores, tuple(weights[key] for key in CRITERIA_KEYS)),
+            evidence=self.evidence
+        )
+    
+    def top_n(self, k: int) -> 'ScoredTable':
+        """
+        Select the k highest weighted scores without sorting the whole table
+        
+        Uses np.argpartition for an O(N + k log k) selection. Ties are broken
+        by row position, so the result matches a stable full sort. The
+        selected rows are ranked 1..k by their current weighted scores.
+        """
+        n = len(self)
+        if k >= n:
+            order = np.argsort(-self.weighted_scores, kind='stable')
+        elif k <= 0:
+            order = np.empty(0, dtype=np.intp)
+        else:
+            neg_scores = -self.weighted_scores
+            threshold = neg_scores[np.argpartition(neg_scores, k - 1)[k - 1]]
+            # Everything strictly above the k-th score, then the earliest ties
+            above = np.flatnonzero(neg_scores < threshold)
+            ties = np.flatnonzero(neg_scores == threshold)[:k - len(above)]
+            idx = np.concatenate((above, ties))
+            order = idx[np.argsort(neg_scores[idx], kind='stable')]
+        return ScoredTable(
+            ranks=np.arange(1, len(order) + 1),
+            orpha_codes=self.orpha_codes[order],
+            disease_names=self.disease_names[order],
+            criteria_scores=self.criteria_scores[order],
+            weighted_scores=self.weighted_scores[order],
+            evidence=[self.evidence[i] for i in order.tolist()]
+        )
+    
+    def to_disease_scores(self) -> List[DiseaseScore]:
+        """Convert the rows back to DiseaseScore objects"""
+        return [
+            DiseaseScore(
+                orpha_code=orpha_code,
+                disease_name=disease_name,
+                criteria_scores=CriteriaScore(*criteria_row),
+                weighted_score=weighted_score,
+                rank=rank,
+                evidence=evidence
+            )
+            for rank, orpha_code, disease_name, criteria_row, weighted_score, evidence in zip(
+                self.ranks.tolist(), self.orpha_codes.tolist(), self.disease_names.tolist(),
+                self.criteria_scores.tolist(), self.weighted_scores.tolist(), self.evidence
+            )
+        ]
+
+
+# Export data gathered once per run by RareDiseasePrioritizer._build_records:
+# the score table, one justification tuple per row (empty past the justified
+# ranks) and the JSON records for the top_n diseases
+ExportRecords = namedtuple('ExportRecords', ['table', 'justifications', 'json_records'])
+
+
+# Static parts of a minimal single-sheet .xlsx package, see _write_excel_streaming.
+# Style 0 is the default font, style 1 the bold header.
+_XLSX_CONTENT_TYPES = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+    '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+    '<Default Extension="xml" ContentType="application/xml"/>'
+    '<Override PartName="/xl/workbook.xml" '
+    'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>'
+    '<Override PartName="/xl/worksheets/sheet1.xml" '
+    'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>'
+    '<Override PartName="/xl/styles.xml" '
+    'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.styles+xml"/>'
+    '<Override PartName="/xl/sharedStrings.xml" '
+    'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sharedStrings+xml"/>'
+    '</Types>'
+)
+_XLSX_ROOT_RELS = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    '<Relationship Id="rId1" '
+    'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" '
+    'Target="xl/workbook.xml"/>'
+    '</Relationships>'
+)
+_XLSX_WORKBOOK_RELS = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    '<Relationship Id="rId1" '
+    'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/worksheet" '
+    'Target="worksheets/sheet1.xml"/>'
+    '<Relationship Id="rId2" '
+    'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/styles" '
+    'Target="styles.xml"/>'
+    '<Relationship Id="rId3" '
+    'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/sharedStrings" '
+    'Target="sharedStrings.xml"/>'
+    '</Relationships>'
+)
+_XLSX_WORKBOOK = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<workbook xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main" '
+    'xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships">'
+    '<sheets><sheet name={sheet_name} sheetId="1" r:id="rId1"/></sheets>'
+    '</workbook>'
+)
+_XLSX_STYLES = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<styleSheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">'
+    '<fonts count="2">'
+    '<font><sz val="11"/><name val="Calibri"/><family val="2"/></font>'
+    '<font><b/><sz val="11"/><name val="Calibri"/><family val="2"/></font>'
+    '</fonts>'
+    '<fills count="2"><fill><patternFill patternType="none"/></fill>'
+    '<fill><patternFill patternType="gray125"/></fill></fills>'
+    '<borders count="1"><border><left/><right/><top/><bottom/><diagonal/></border></borders>'
+    '<cellStyleXfs count="1"><xf numFmtId="0" fontId="0" fillId="0" borderId="0"/></cellStyleXfs>'
+    '<cellXfs count="2">'
+    '<xf numFmtId="0" fontId="0" fillId="0" borderId="0" xfId="0"/>'
+    '<xf numFmtId="0" fontId="1" fillId="0" borderId="0" xfId="0" applyFont="1"/>'
+    '</cellXfs>'
+    '<cellStyles count="1"><cellStyle name="Normal" xfId="0" builtinId="0"/></cellStyles>'
+    '</styleSheet>'
+)
+_XLSX_SHEET_HEADER = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">'
+)
+# Control characters that are not allowed in XML 1.0 text
+_XLSX_ILLEGAL_CHARS = re.compile(r'[\x00-\x08\x0b\x0c\x0e-\x1f]')
+
+
+def _xlsx_column_letter(column: int) -> str:
+    """Spreadsheet column letter for a 1-based column number (1 -> A, 27 -> AA)"""
+    letters = ''
+    while column > 0:
+        column, remainder = divmod(column - 1, 26)
+        letters = chr(ord('A') + remainder) + letters
+    return letters
+
+
+def _xlsx_cell(ref: str, value: Any, shared_strings: Dict[str, int], style: int = 0) -> str:
+    """
+    XML for one worksheet cell; None and non-finite numbers give an empty string
+    
+    Strings are stored once in shared_strings (text -> index, in insertion
+    order) and referenced by index, so repeated justifications are written once.
+    """
+    style_attr = f' s="{style}"' if style else ''
+    if value is None:
+        return ''
+    if isinstance(value, (bool, np.bool_)):
+        return f'<c r="{ref}"{style_attr} t="b"><v>{int(value)}</v></c>'
+    if isinstance(value, (int, np.integer)):
+        return f'<c r="{ref}"{style_attr}><v>{int(value)}</v></c>'
+    if isinstance(value, (float, np.floating)):
+        if not math.isfinite(value):
+            return ''
+        # Integral floats are written like openpyxl does ("8", not "8.0")
+        number = int(value) if float(value).is_integer() else float(value)
+        return f'<c r="{ref}"{style_attr}><v>{number!r}</v></c>'
+    text = _XLSX_ILLEGAL_CHARS.sub('', str(value))
+    index = shared_strings.setdefault(text, len(shared_strings))
+    return f'<c r="{ref}"{style_attr} t="s"><v>{index}</v></c>'
 
 
 class RareDiseasePrioritizer:
@@ -78,25 +380,34 @@ class RareDiseasePrioritizer:
         self.config = self._load_config(config_path)
         self._setup_logging()
         
-        # Initialize data clients
-        self._init_data_clients()
+        # Data clients are created lazily by the *_client properties
+        
+        # Criteria weights in CRITERIA_KEYS order
+        self._weights = tuple(self.config['criteria'][key]['weight'] for key in CRITERIA_KEYS)
         
         # Cache for scoring data
         self._scoring_cache = {}
         
+        # Justifications per ORPHA code, shared by the Excel exports
+        self._justification_cache = {}
+        
+        # Single timestamp for every output file written by this run
+        self._run_timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        
         self.logger = logging.getLogger(__name__)
         self.logger.info("RareDiseasePrioritizer initialized")
     
-    def _load_config(self, config_path: str) -> dict:
+    @staticmethod
+    def _load_config(config_path: str) -> dict:
         """Load configuration from YAML file"""
         with open(config_path, 'r') as f:
             config = yaml.safe_load(f)
         
         # Validate required keys (removed global 'scoring' for per-criterion scoring)
         required_keys = ['input', 'output', 'criteria']
-        for key in required_keys:
-            if key not in config:
-                raise KeyError(f"Missing required config key: {key}")
+        missing_keys = [key for key in required_keys if key not in config]
+        if missing_keys:
+            raise KeyError(f"Missing required config keys: {missing_keys}")
         
         return config
     
@@ -110,47 +421,66 @@ class RareDiseasePrioritizer:
         if log_file:
             Path(log_file).parent.mkdir(parents=True, exist_ok=True)
         
+        # Logging is already configured (basicConfig would be a no-op)
+        if logging.getLogger().handlers:
+            return
+        
+        # Console and file output run on a listener thread; the root logger
+        # only enqueues records, so file writes stay off the scoring path
+        log_queue = queue.Queue(-1)
+        self._log_listener = QueueListener(
+            log_queue,
+            logging.StreamHandler(),
+            logging.FileHandler(log_file) if log_file else logging.NullHandler()
+        )
+        self._log_listener.start()
+        atexit.register(self._log_listener.stop)
+        
         logging.basicConfig(
             level=getattr(logging, log_level),
-            format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-            handlers=[
-                logging.StreamHandler(),
-                logging.FileHandler(log_file) if log_file else logging.NullHandler()
-            ]
+            format=LOG_FORMAT,
+            handlers=[QueueHandler(log_queue)]
         )
     
-    def _init_data_clients(self):
-        """Initialize curated data clients"""
-        criteria = self.config['criteria']
-        
-        # Initialize clients based on paths in config
-        self.prevalence_client = CuratedOrphaPrevalenceClient(
-            data_dir=criteria['prevalence']['path']
-        )
-        
-        self.drugs_client = CuratedDrugsClient(
-            data_dir=criteria['orpha_drugs']['path']
-        )
-        
-        self.genes_client = CuratedGeneClient(
-            data_dir=criteria['orpha_gene']['path']
-        )
-        
-        self.trials_client = CuratedClinicalTrialsClient(
-            data_dir=criteria['clinical_trials']['path']
-        )
-        
-        # Initialize websearch clients
-        self.socioeconomic_client = CuratedWebsearchSocioeconomicClient(
-            data_dir=criteria['socioeconomic']['path']
-        )
-        
-        self.groups_client = CuratedWebsearchGroupsClient(
-            data_dir=criteria['groups']['path']
-        )
-        
-        # For metabolic diseases, use the specific prevalence client
-        self.metabolic_prevalence_client = CuratedPrevalenceClient()
+    # ===== Data Clients =====
+    # Clients are created on first use, and scoring and justifications skip
+    # the clients of mocked criteria, so a mocked criterion never touches (or
+    # requires) its curated data directory.
+    
+    @cached_property
+    def prevalence_client(self) -> CuratedOrphaPrevalenceClient:
+        """Curated Orpha prevalence client"""
+        return CuratedOrphaPrevalenceClient(data_dir=self.config['criteria']['prevalence']['path'])
+    
+    @cached_property
+    def drugs_client(self) -> CuratedDrugsClient:
+        """Curated Orpha drugs client"""
+        return CuratedDrugsClient(data_dir=self.config['criteria']['orpha_drugs']['path'])
+    
+    @cached_property
+    def genes_client(self) -> CuratedGeneClient:
+        """Curated Orpha genes client"""
+        return CuratedGeneClient(data_dir=self.config['criteria']['orpha_gene']['path'])
+    
+    @cached_property
+    def trials_client(self) -> CuratedClinicalTrialsClient:
+        """Curated clinical trials client"""
+        return CuratedClinicalTrialsClient(data_dir=self.config['criteria']['clinical_trials']['path'])
+    
+    @cached_property
+    def socioeconomic_client(self) -> CuratedWebsearchSocioeconomicClient:
+        """Curated websearch socioeconomic client"""
+        return CuratedWebsearchSocioeconomicClient(data_dir=self.config['criteria']['socioeconomic']['path'])
+    
+    @cached_property
+    def groups_client(self) -> CuratedWebsearchGroupsClient:
+        """Curated websearch research groups client"""
+        return CuratedWebsearchGroupsClient(data_dir=self.config['criteria']['groups']['path'])
+    
+    @cached_property
+    def metabolic_prevalence_client(self) -> CuratedPrevalenceClient:
+        """Metabolic disease prevalence client"""
+        return CuratedPrevalenceClient()
     
     # ===== New Statistical Scoring Utility Methods =====
     
@@ -186,6 +516,34 @@ class RareDiseasePrioritizer:
             return 0.0  # Winsorized at minimum score
         return (1 - value / max_value) * scale_factor
     
+    def _winsor_vec(self, values: np.ndarray, max_value: float, scale_factor: float = 10) -> np.ndarray:
+        """
+        winsorized_min_max_scaling over an array: (values / max_value) * scale_factor, scale_factor where values >= max_value
+        
+        Computed in place; values must be a float array the caller no longer needs.
+        """
+        winsorized = values >= max_value
+        # Winsorized rows are overwritten below, so a zero max_value is harmless
+        with np.errstate(divide='ignore', invalid='ignore'):
+            np.divide(values, max_value, out=values)
+        np.multiply(values, scale_factor, out=values)
+        values[winsorized] = scale_factor
+        return values
+    
+    def _rev_winsor_vec(self, values: np.ndarray, max_value: float, scale_factor: float = 10) -> np.ndarray:
+        """
+        reverse_winsorized_min_max_scaling over an array: (1 - values / max_value) * scale_factor, 0 where values >= max_value
+        
+        Computed in place; values must be a float array the caller no longer needs.
+        """
+        winsorized = values >= max_value
+        with np.errstate(divide='ignore', invalid='ignore'):
+            np.divide(values, max_value, out=values)
+        np.subtract(1, values, out=values)
+        np.multiply(values, scale_factor, out=values)
+        values[winsorized] = 0.0
+        return values
+    
     def load_diseases(self) -> List[Dict[str, str]]:
         """
         Load diseases from input data source
@@ -195,8 +553,11 @@ class RareDiseasePrioritizer:
         """
         input_file = self.config['input']['data_source']
         
-        with open(input_file, 'r', encoding='utf-8') as f:
-            diseases = json.load(f)
+        if ORJSON_AVAILABLE:
+            diseases = orjson.loads(Path(input_file).read_bytes())
+        else:
+            with open(input_file, 'r', encoding='utf-8') as f:
+                diseases = json.load(f)
         
         self.logger.info(f"Loaded {len(diseases)} diseases from {input_file}")
         return diseases
@@ -408,66 +769,301 @@ class RareDiseasePrioritizer:
             DiseaseScore object with all criteria scores and weighted total
         """
         orpha_code = disease['orpha_code']
-        disease_name = disease['disease_name']
-        
-        # Calculate individual criteria scores
-        criteria_scores = CriteriaScore(
-            prevalence=self.score_prevalence(orpha_code),
-            socioeconomic=self.score_socioeconomic(orpha_code),
-            orpha_drugs=self.score_orpha_drugs(orpha_code),
-            clinical_trials=self.score_clinical_trials(orpha_code),
-            orpha_gene=self.score_orpha_gene(orpha_code),
-            groups=self.score_groups(orpha_code)
-        )
         
-        # Calculate weighted score using SOW weights
+        # Same column path as rank_diseases, on a one-row table; errors propagate
+        evidence = self._collect_evidence([orpha_code])
+        score_matrix = self._load_score_matrix([orpha_code], evidence)
+        
+        return ScoredTable(
+            ranks=np.zeros(1, dtype=np.int64),
+            orpha_codes=np.array([orpha_code], dtype=object),
+            disease_names=np.array([disease['disease_name']], dtype=object),
+            criteria_scores=score_matrix,
+            weighted_scores=_weighted_sum(score_matrix, self._weights),
+            evidence=evidence
+        ).to_disease_scores()[0]
+    
+    # ===== Column-wise Scoring =====
+    
+    def _collect_evidence(self, orpha_codes: List[str]) -> List[CriteriaEvidence]:
+        """
+        Fetch the client data used for scoring and justification, once per disease
+        
+        A criterion's data is only fetched when it is not mocked, since neither
+        the scores nor the justifications read it otherwise; mocked criteria
+        get empty evidence and their clients are never created.
+        
+        Args:
+            orpha_codes: Disease Orphanet codes
+            
+        Returns:
+            CriteriaEvidence list aligned with orpha_codes
+        """
         criteria_config = self.config['criteria']
-        weighted_score = (
-            criteria_scores.prevalence * criteria_config['prevalence']['weight'] +
-            criteria_scores.socioeconomic * criteria_config['socioeconomic']['weight'] +
-            criteria_scores.orpha_drugs * criteria_config['orpha_drugs']['weight'] +
-            criteria_scores.clinical_trials * criteria_config['clinical_trials']['weight'] +
-            criteria_scores.orpha_gene * criteria_config['orpha_gene']['weight'] +
-            criteria_scores.groups * criteria_config['groups']['weight']
+        
+        def fetch(key, batch_call, empty):
+            if criteria_config[key]['mock']:
+                return [empty() for _ in orpha_codes]
+            return batch_call()
+        
+        # One batch call per client and data source, in CriteriaEvidence field order
+        columns = zip(
+            fetch('prevalence', lambda: self.prevalence_client.get_prevalence_classes(orpha_codes), lambda: None),
+            fetch('socioeconomic', lambda: self.socioeconomic_client.get_evidence_levels_for_diseases(orpha_codes), lambda: None),
+            fetch('orpha_drugs', lambda: self.drugs_client.get_eu_tradename_drugs_for_diseases(orpha_codes), list),
+            fetch('orpha_drugs', lambda: self.drugs_client.get_eu_medical_products_for_diseases(orpha_codes), list),
+            fetch('clinical_trials', lambda: self.trials_client.get_spanish_trials_for_diseases(orpha_codes), list),
+            fetch('clinical_trials', lambda: self.trials_client.get_eu_trials_for_diseases(orpha_codes), list),
+            fetch('orpha_gene', lambda: self.genes_client.get_genes_for_diseases(orpha_codes), list),
+            fetch('groups', lambda: self.groups_client.get_groups_for_diseases(orpha_codes), list)
         )
         
-        return DiseaseScore(
-            orpha_code=orpha_code,
-            disease_name=disease_name,
-            criteria_scores=criteria_scores,
-            weighted_score=weighted_score
+        return [CriteriaEvidence(*fields) for fields in columns]
+    
+    def _count_column(self, items) -> np.ndarray:
+        """Lengths of a sequence of per-disease lists, as a float array"""
+        return np.fromiter((len(item) for item in items), dtype=np.float64)
+    
+    def _build_category_lut(self, criteria_config: dict, mapping_key: str) -> Tuple[Dict[str, int], np.ndarray]:
+        """
+        Turn a criterion's category -> score mapping into an id lookup table
+        
+        Categories get ids in config order; the two extra slots hold the score
+        for an unmapped category (0) and for missing data (0 or mock_value,
+        per handle_missing_data), so scoring a column is a single gather.
+        
+        Args:
+            criteria_config: Criterion configuration with a scoring section
+            mapping_key: Name of the mapping inside the scoring section
+            
+        Returns:
+            Tuple of (category name -> id dict, score lookup table)
+        """
+        scoring = criteria_config['scoring']
+        mapping = scoring[mapping_key]
+        handle_missing = scoring.get('handle_missing_data', 'zero_score')
+        missing_score = 0.0 if handle_missing == 'zero_score' else criteria_config['mock_value']
+        
+        category_ids = {category: i for i, category in enumerate(mapping)}
+        lut = np.array([*mapping.values(), 0.0, missing_score], dtype=np.float64)
+        return category_ids, lut
+    
+    @cached_property
+    def _prevalence_class_lut(self) -> Tuple[Dict[str, int], np.ndarray]:
+        """Prevalence class ids and scores, see _build_category_lut"""
+        return self._build_category_lut(self.config['criteria']['prevalence'], 'class_mapping')
+    
+    @cached_property
+    def _evidence_level_lut(self) -> Tuple[Dict[str, int], np.ndarray]:
+        """Socioeconomic evidence level ids and scores, see _build_category_lut"""
+        return self._build_category_lut(self.config['criteria']['socioeconomic'], 'evidence_mappings')
+    
+    def _category_column(self, categories: List[Optional[str]],
+                         category_lut: Tuple[Dict[str, int], np.ndarray]) -> np.ndarray:
+        """Score a column of category names (None/empty for missing) through an id lookup table"""
+        category_ids, lut = category_lut
+        unknown_id = len(category_ids)
+        missing_id = unknown_id + 1
+        
+        ids = np.fromiter(
+            (category_ids.get(c, unknown_id) if c else missing_id for c in categories),
+            dtype=np.intp, count=len(categories)
         )
+        return lut[ids]
     
-    def prioritize_diseases(self, diseases: List[Dict[str, str]]) -> List[DiseaseScore]:
+    def _score_prevalence_column(self, orpha_codes: List[str], evidence: List[CriteriaEvidence],
+                                 criteria_config: dict) -> np.ndarray:
+        """Column-wise equivalent of score_prevalence"""
+        return self._category_column([e.prevalence_class for e in evidence], self._prevalence_class_lut)
+    
+    def _score_socioeconomic_column(self, orpha_codes: List[str], evidence: List[CriteriaEvidence],
+                                    criteria_config: dict) -> np.ndarray:
+        """Column-wise equivalent of score_socioeconomic"""
+        return self._category_column([e.evidence_level for e in evidence], self._evidence_level_lut)
+    
+    def _score_orpha_drugs_column(self, orpha_codes: List[str], evidence: List[CriteriaEvidence],
+                                  criteria_config: dict) -> np.ndarray:
+        """Column-wise equivalent of score_orpha_drugs"""
+        total_scores = np.zeros(len(orpha_codes))
+        
+        for component in criteria_config['scoring']['components']:
+            data_source = component['data_source']
+            max_value = component['max']
+            scale_factor = component['scale_factor']
+            
+            if data_source == "eu_tradename_drugs":
+                drug_counts = self._count_column(e.eu_tradename_ids for e in evidence)
+            elif data_source == "medical_products_eu":
+                drug_counts = self._count_column(e.eu_medical_ids for e in evidence)
+            else:
+                drug_counts = np.zeros(len(orpha_codes))
+            
+            component_scores = self._rev_winsor_vec(drug_counts, max_value, scale_factor)
+            np.multiply(component_scores, component['weight'], out=component_scores)
+            total_scores += component_scores
+        
+        return np.minimum(total_scores, 10.0, out=total_scores)
+    
+    def _score_clinical_trials_column(self, orpha_codes: List[str], evidence: List[CriteriaEvidence],
+                                      criteria_config: dict) -> np.ndarray:
+        """Column-wise equivalent of score_clinical_trials"""
+        max_value = criteria_config['scoring']['max']
+        scale_factor = criteria_config['scoring']['scale_factor']
+        data_usage = criteria_config['data_usage']
+        
+        if data_usage['source_preference'] == 'spanish_trials':
+            trial_counts = self._count_column(e.spanish_trials for e in evidence)
+            if 'fallback' in data_usage:
+                no_trials = np.flatnonzero(trial_counts == 0)
+                trial_counts[no_trials] = self._count_column(evidence[i].eu_trials for i in no_trials)
+        else:
+            trial_counts = self._count_column(self.trials_client.get_all_trials_for_diseases(orpha_codes))
+        
+        return self._winsor_vec(trial_counts, max_value, scale_factor)
+    
+    def _score_orpha_gene_column(self, orpha_codes: List[str], evidence: List[CriteriaEvidence],
+                                 criteria_config: dict) -> np.ndarray:
+        """Column-wise equivalent of score_orpha_gene"""
+        gene_counts = self._count_column(e.genes for e in evidence)
+        return np.where(gene_counts == 1, 10.0, 0.0)
+    
+    def _score_groups_column(self, orpha_codes: List[str], evidence: List[CriteriaEvidence],
+                             criteria_config: dict) -> np.ndarray:
+        """Column-wise equivalent of score_groups"""
+        max_value = criteria_config['scoring']['max']
+        scale_factor = criteria_config['scoring']['scale_factor']
+        
+        group_counts = self._count_column(e.groups for e in evidence)
+        return self._winsor_vec(group_counts, max_value, scale_factor)
+    
+    def _load_score_matrix(self, orpha_codes: List[str], evidence: List[CriteriaEvidence]) -> np.ndarray:
         """
-        Score and prioritize all diseases
+        Score all diseases on every criterion, one criterion column at a time
+        
+        Applies the same formulas as the per-disease score_* methods to arrays
+        aligned with orpha_codes, so each criterion costs a few array operations
+        instead of one method call per disease.
         
         Args:
-            diseases: List of disease dictionaries
+            orpha_codes: Disease Orphanet codes
+            evidence: Client data for each disease, from _collect_evidence
             
         Returns:
-            List of DiseaseScore objects sorted by priority (highest first)
+            (N, 6) array of criteria scores, columns in CRITERIA_KEYS order
         """
-        self.logger.info(f"Scoring {len(diseases)} diseases across all criteria")
+        criteria = self.config['criteria']
+        column_scorers = (
+            self._score_prevalence_column,
+            self._score_socioeconomic_column,
+            self._score_orpha_drugs_column,
+            self._score_clinical_trials_column,
+            self._score_orpha_gene_column,
+            self._score_groups_column
+        )
+        
+        score_matrix = np.empty((len(orpha_codes), len(CRITERIA_KEYS)))
+        for j, (key, scorer) in enumerate(zip(CRITERIA_KEYS, column_scorers)):
+            criteria_config = criteria[key]
+            if criteria_config['mock']:
+                score_matrix[:, j] = criteria_config['mock_value']
+            else:
+                score_matrix[:, j] = scorer(orpha_codes, evidence, criteria_config)
+        
+        return score_matrix
+    
+    def _score_rows_isolated(self, orpha_codes: List[str], disease_names: List[str]) -> Tuple[
+            List[str], List[str], List[CriteriaEvidence], np.ndarray]:
+        """
+        Score diseases one at a time, dropping the ones that fail
+        
+        Fallback for rank_diseases when a batch call raises, so a single bad
+        record only loses its own row.
         
-        scored_diseases = []
-        for i, disease in enumerate(diseases):
-            if i % 100 == 0:
-                self.logger.info(f"Processed {i}/{len(diseases)} diseases")
+        Args:
+            orpha_codes: Disease Orphanet codes
+            disease_names: Disease names aligned with orpha_codes
             
+        Returns:
+            Tuple of (orpha codes, disease names, evidence, score matrix) for the diseases that scored
+        """
+        kept_codes, kept_names, evidence, score_rows = [], [], [], []
+        for orpha_code, disease_name in zip(orpha_codes, disease_names):
             try:
-                disease_score = self.score_disease(disease)
-                scored_diseases.append(disease_score)
+                row_evidence = self._collect_evidence([orpha_code])
+                score_rows.append(self._load_score_matrix([orpha_code], row_evidence))
             except Exception as e:
-                self.logger.warning(f"Failed to score disease {disease['orpha_code']}: {e}")
+                self.logger.warning(f"Failed to score disease {orpha_code}: {e}")
                 continue
+            kept_codes.append(orpha_code)
+            kept_names.append(disease_name)
+            evidence.extend(row_evidence)
         
-        # Sort by weighted score (descending)
-        scored_diseases.sort(key=lambda x: x.weighted_score, reverse=True)
+        if score_rows:
+            score_matrix = np.concatenate(score_rows)
+        else:
+            score_matrix = np.empty((0, len(CRITERIA_KEYS)))
+        return kept_codes, kept_names, evidence, score_matrix
+    
+    def rank_diseases(self, diseases: List[Dict[str, str]]) -> ScoredTable:
+        """
+        Score all diseases and rank them, keeping the results as arrays
         
-        # Assign ranks
-        for i, disease_score in enumerate(scored_diseases):
-            disease_score.rank = i + 1
+        Diseases whose data cannot be scored are logged and left out of the
+        table rather than aborting the whole ranking.
+        
+        Args:
+            diseases: List of disease dictionaries
+            
+        Returns:
+            ScoredTable with rows sorted by priority (highest first)
+        """
+        orpha_codes = []
+        disease_names = []
+        for disease in diseases:
+            if 'orpha_code' not in disease or 'disease_name' not in disease:
+                self.logger.warning(f"Skipping disease without orpha_code/disease_name: {disease}")
+                continue
+            orpha_codes.append(disease['orpha_code'])
+            disease_names.append(disease['disease_name'])
+        
+        try:
+            evidence = self._collect_evidence(orpha_codes)
+            score_matrix = self._load_score_matrix(orpha_codes, evidence)
+        except Exception as e:
+            self.logger.warning(f"Batch scoring failed ({e}), scoring diseases one at a time")
+            orpha_codes, disease_names, evidence, score_matrix = self._score_rows_isolated(orpha_codes, disease_names)
+        
+        weighted_scores = _weighted_sum(score_matrix, self._weights)
+        
+        # Rank by weighted score (descending); the stable sort keeps input order for ties
+        order = np.argsort(-weighted_scores, kind='stable')
+        
+        return ScoredTable(
+            ranks=np.arange(1, len(order) + 1),
+            orpha_codes=np.array(orpha_codes, dtype=object)[order],
+            disease_names=np.array(disease_names, dtype=object)[order],
+            criteria_scores=score_matrix[order],
+            weighted_scores=weighted_scores[order],
+            evidence=[evidence[i] for i in order.tolist()]
+        )
+    
+    def prioritize_diseases(self, diseases: List[Dict[str, str]]) -> List[DiseaseScore]:
+        """
+        Score and prioritize all diseases
+        
+        Args:
+            diseases: List of disease dictionaries
+            
+        Returns:
+            List of DiseaseScore objects sorted by priority (highest first)
+        """
+        self.logger.info(f"Scoring {len(diseases)} diseases across all criteria")
+        
+        scored_diseases = self.rank_diseases(diseases).to_disease_scores()
+        
+        if not scored_diseases:
+            self.logger.warning("Prioritization complete. No disease could be scored")
+            return scored_diseases
         
         self.logger.info(f"Prioritization complete. Top disease: {scored_diseases[0].disease_name} "
                         f"(score: {scored_diseases[0].weighted_score:.2f})")
@@ -476,9 +1072,17 @@ class RareDiseasePrioritizer:
     
     # ===== Individual Justification Methods =====
     
-    def generate_prevalence_justification(self, orpha_code: str) -> str:
+    # Each justification reads the client data cached on the DiseaseScore when
+    # evidence is given, and queries the clients directly otherwise.
+    
+    def generate_prevalence_justification(self, orpha_code: str, evidence: Optional[CriteriaEvidence] = None) -> str:
         """Generate justification for prevalence scoring"""
-        prevalence_class = self.prevalence_client.get_prevalence_class(orpha_code)
+        if self.config['criteria']['prevalence']['mock']:
+            return "Prevalencia asumida (fase mock)"
+        if evidence is not None:
+            prevalence_class = evidence.prevalence_class
+        else:
+            prevalence_class = self.prevalence_client.get_prevalence_class(orpha_code)
         if prevalence_class:
             if prevalence_class == ">1 / 1000":
                 return f"Alta prevalencia ({prevalence_class}) indica impacto significativo en salud pública"
@@ -493,8 +1097,8 @@ class RareDiseasePrioritizer:
         else:
             return "Datos de prevalencia desconocidos"
     
-    def generate_socioeconomic_justification(self, orpha_code: str) -> str:
-        """Generate justification for socioeconomic scoring"""
+    def generate_socioeconomic_justification(self, orpha_code: str, evidence: Optional[CriteriaEvidence] = None) -> str:
+        """Generate justification for socioeconomic scoring (evidence is unused, the text comes from curated data)"""
         if self.config['criteria']['socioeconomic']['mock']:
             return "Impacto socioeconómico asumido alto (fase mock)"
         else:
@@ -505,10 +1109,20 @@ class RareDiseasePrioritizer:
             else:
                 return "Análisis de impacto socioeconómico no disponible"
     
-    def generate_drugs_justification(self, orpha_code: str) -> str:
+    def generate_drugs_justification(self, orpha_code: str, evidence: Optional[CriteriaEvidence] = None,
+                                     drug_names: Optional[Dict[str, str]] = None) -> str:
         """Generate justification for drugs scoring"""
-        eu_tradename = self.drugs_client.get_eu_tradename_drugs_for_disease(orpha_code)
-        eu_medical = self.drugs_client.get_eu_medical_products_for_disease(orpha_code)
+        if self.config['criteria']['orpha_drugs']['mock']:
+            return "Terapias aprobadas asumidas (fase mock)"
+        if drug_names is None:
+            drug_names = self.drugs_client.get_drug_name_map()
+        
+        if evidence is not None:
+            eu_tradename = evidence.eu_tradename_ids
+            eu_medical = evidence.eu_medical_ids
+        else:
+            eu_tradename = self.drugs_client.get_eu_tradename_drugs_for_disease(orpha_code)
+            eu_medical = self.drugs_client.get_eu_medical_products_for_disease(orpha_code)
         
         if len(eu_tradename) == 0 and len(eu_medical) == 0:
             return "Sin terapias aprobadas disponibles (alta necesidad médica no cubierta)"
@@ -516,34 +1130,47 @@ class RareDiseasePrioritizer:
             therapy_desc = []
             if len(eu_tradename) > 0:
                 # Get drug names for tradename drugs
-                tradename_names = [self.drugs_client.get_drug_name(drug_id) for drug_id in eu_tradename]
+                tradename_names = [drug_names.get(drug_id, f"Drug {drug_id}") for drug_id in eu_tradename]
                 names_str = ", ".join(tradename_names)
                 therapy_desc.append(f"{len(eu_tradename)} medicamento(s) comercial(es) UE: ({names_str})")
             if len(eu_medical) > 0:
                 # Get drug names for medical products
-                medical_names = [self.drugs_client.get_drug_name(drug_id) for drug_id in eu_medical]
+                medical_names = [drug_names.get(drug_id, f"Drug {drug_id}") for drug_id in eu_medical]
                 names_str = ", ".join(medical_names)
                 therapy_desc.append(f"{len(eu_medical)} producto(s) médico(s): ({names_str})")
             return f"Opciones terapéuticas limitadas: {'; '.join(therapy_desc)}"
     
-    def generate_clinical_trials_justification(self, orpha_code: str) -> str:
+    def generate_clinical_trials_justification(self, orpha_code: str, evidence: Optional[CriteriaEvidence] = None) -> str:
         """Generate justification for clinical trials scoring"""
-        spanish_trials = self.trials_client.get_spanish_trials_for_disease(orpha_code)
+        if self.config['criteria']['clinical_trials']['mock']:
+            return "Ensayos clínicos asumidos (fase mock)"
+        if evidence is not None:
+            spanish_trials = evidence.spanish_trials
+        else:
+            spanish_trials = self.trials_client.get_spanish_trials_for_disease(orpha_code)
         if spanish_trials:
             trial_count = len(spanish_trials)
             return f"Investigación clínica activa española con {trial_count} ensayo(s)"
         else:
             # Check EU trials as fallback
-            eu_trials = self.trials_client.get_eu_trials_for_disease(orpha_code)
+            if evidence is not None:
+                eu_trials = evidence.eu_trials
+            else:
+                eu_trials = self.trials_client.get_eu_trials_for_disease(orpha_code)
             if eu_trials:
                 trial_count = len(eu_trials)
                 return f"Investigación clínica activa UE con {trial_count} ensayo(s) (sin ensayos españoles)"
             else:
                 return "Sin ensayos clínicos en curso en España o UE"
     
-    def generate_gene_justification(self, orpha_code: str) -> str:
+    def generate_gene_justification(self, orpha_code: str, evidence: Optional[CriteriaEvidence] = None) -> str:
         """Generate justification for gene therapy scoring"""
-        genes = self.genes_client.get_genes_for_disease(orpha_code)
+        if self.config['criteria']['orpha_gene']['mock']:
+            return "Trazabilidad de terapia génica asumida (fase mock)"
+        if evidence is not None:
+            genes = evidence.genes
+        else:
+            genes = self.genes_client.get_genes_for_disease(orpha_code)
         if len(genes) == 1:
             return f"Enfermedad monogénica causada por gen {genes[0]}, ideal para terapia génica"
         elif len(genes) > 1:
@@ -554,12 +1181,15 @@ class RareDiseasePrioritizer:
         else:
             return "Sin genes causales conocidos identificados, sin diana genética para terapia génica"
     
-    def generate_groups_justification(self, orpha_code: str) -> str:
+    def generate_groups_justification(self, orpha_code: str, evidence: Optional[CriteriaEvidence] = None) -> str:
         """Generate justification for research groups scoring"""
         if self.config['criteria']['groups']['mock']:
             return "Grupos de investigación: asumida participación activa (fase mock)"
         else:
-            groups = self.groups_client.get_groups_for_disease(orpha_code)
+            if evidence is not None:
+                groups = evidence.groups
+            else:
+                groups = self.groups_client.get_groups_for_disease(orpha_code)
             if groups:
                 group_count = len(groups)
                 # Show first 3 groups in parentheses like drug justification
@@ -570,12 +1200,289 @@ class RareDiseasePrioritizer:
             else:
                 return "Sin grupos de investigación españoles identificados"
 
-    def export_to_excel(self, scored_diseases: List[DiseaseScore]) -> str:
+    def _justification_generators(self, drug_names: Optional[Dict[str, str]] = None) -> Tuple[Any, ...]:
+        """
+        Bound justification generators in CRITERIA_KEYS order
+        
+        Each one is called as generator(orpha_code, evidence); built once per
+        export so the per-disease loop does no method lookups.
+        
+        Args:
+            drug_names: Drug ID -> name map, see CuratedDrugsClient.get_drug_name_map
+        """
+        return (
+            self.generate_prevalence_justification,
+            self.generate_socioeconomic_justification,
+            partial(self.generate_drugs_justification, drug_names=drug_names),
+            self.generate_clinical_trials_justification,
+            self.generate_gene_justification,
+            self.generate_groups_justification
+        )
+    
+    def _disease_justifications(self, disease_score: DiseaseScore,
+                                generators: Optional[Tuple[Any, ...]] = None) -> Tuple[str, ...]:
+        """
+        Generate the six criteria justifications for a disease, once per run
+        
+        Results are memoized by ORPHA code, so a disease that appears in both
+        the full and the final top-N export is only justified once.
+        
+        Args:
+            disease_score: Scored disease, with the evidence gathered during scoring
+            generators: Generators from _justification_generators (built here if omitted)
+            
+        Returns:
+            Justifications in CRITERIA_KEYS order
+        """
+        orpha_code = disease_score.orpha_code
+        justifications = self._justification_cache.get(orpha_code)
+        if justifications is None:
+            if generators is None:
+                generators = self._justification_generators()
+            evidence = disease_score.evidence
+            justifications = tuple(generate(orpha_code, evidence) for generate in generators)
+            self._justification_cache[orpha_code] = justifications
+        return justifications
+    
+    def _justify_rows(self, scored_diseases: List[DiseaseScore], justify_max_rank: Optional[int] = None,
+                      log_progress: bool = False) -> List[Tuple[str, ...]]:
+        """
+        Justifications for each disease, in order
+        
+        Args:
+            scored_diseases: Scored diseases, in export order
+            justify_max_rank: If set, diseases ranked below it get empty justifications
+            log_progress: Log progress every 100 diseases
+            
+        Returns:
+            One tuple of justifications (CRITERIA_KEYS order) per disease
+        """
+        total_diseases = len(scored_diseases)
+        if self.config['criteria']['orpha_drugs']['mock']:
+            drug_names = None  # not read by the mocked drugs justification
+        else:
+            drug_names = self.drugs_client.get_drug_name_map()
+        generators = self._justification_generators(drug_names)
+        disease_justifications = self._disease_justifications
+        
+        empty_justifications = ('',) * len(CRITERIA_KEYS)
+        justifications = []
+        for i, disease_score in enumerate(scored_diseases):
+            if log_progress and i % 100 == 0:
+                self.logger.info(f"Generated justifications for {i}/{total_diseases} diseases")
+            
+            if justify_max_rank is not None and disease_score.rank > justify_max_rank:
+                justifications.append(empty_justifications)
+            else:
+                justifications.append(disease_justifications(disease_score, generators))
+        return justifications
+    
+    def _build_excel_dataframe(self, scored_diseases: List[DiseaseScore], log_progress: bool = False,
+                               justify_max_rank: Optional[int] = None) -> 'pd.DataFrame':
+        """
+        Build the Excel export table with Spanish column names and justifications
+        
+        Args:
+            scored_diseases: Scored diseases, in export order
+            log_progress: Log progress every 100 diseases
+            justify_max_rank: If set, diseases ranked below it get empty justifications
+            
+        Returns:
+            DataFrame with one row per disease
+        """
+        return self._excel_dataframe(
+            ScoredTable.from_disease_scores(scored_diseases),
+            self._justify_rows(scored_diseases, justify_max_rank, log_progress)
+        )
+    
+    def _excel_dataframe(self, table: ScoredTable, justifications: List[Tuple[str, ...]]) -> 'pd.DataFrame':
+        """
+        Build the Excel export table from a score table and per-row justifications
+        
+        Values are gathered column by column and the DataFrame is created once
+        from a dict of columns; scores are rounded to 2 decimals in bulk.
+        """
+        import pandas as pd
+        
+        # One list per criterion, in CRITERIA_KEYS order
+        justification_columns = [list(column) for column in zip(*justifications)] or [[]] * len(CRITERIA_KEYS)
+        
+        scores = table.criteria_scores.round(2)
+        
+        return pd.DataFrame({
+            'Ranking': table.ranks,
+            'Código ORPHA': table.orpha_codes,
+            'Nombre Enfermedad': table.disease_names,
+            'C1: Prevalencia (Score)': scores[:, 0],
+            'C1: Prevalencia (Justificación)': justification_columns[0],
+            'C2: Impacto Socioeconómico (Score)': scores[:, 1],
+            'C2: Impacto Socioeconómico (Justificación)': justification_columns[1],
+            'C3: Terapias Aprobadas (Score)': scores[:, 2],
+            'C3: Terapias Aprobadas (Justificación)': justification_columns[2],
+            'C4: Ensayos Clínicos (Score)': scores[:, 3],
+            'C4: Ensayos Clínicos (Justificación)': justification_columns[3],
+            'C5: Trazabilidad Genética (Score)': scores[:, 4],
+            'C5: Trazabilidad Genética (Justificación)': justification_columns[4],
+            'C6: Capacidad Investigadora (Score)': scores[:, 5],
+            'C6: Capacidad Investigadora (Justificación)': justification_columns[5],
+            'Índice de Prioridad Final': table.weighted_scores.round(2)
+        })
+    
+    def _excel_column_widths(self, df: 'pd.DataFrame') -> List[int]:
+        """
+        Compute auto-fit Excel column widths from the DataFrame being written
+        
+        Each column is as wide as its longest header or value string plus 2,
+        capped at 50 characters, measured from the DataFrame columns rather
+        than by walking the worksheet's Cell objects.
+        
+        Args:
+            df: DataFrame written with index=False
+            
+        Returns:
+            Column widths in DataFrame column order
+        """
+        value_lengths = np.fromiter(
+            (max(map(len, map(str, df[column].tolist())), default=0) for column in df.columns),
+            dtype=np.int64, count=df.shape[1]
+        )
+        header_lengths = np.fromiter((len(str(column)) for column in df.columns), dtype=np.int64, count=df.shape[1])
+        widths = np.minimum(np.maximum(value_lengths, header_lengths) + 2, 50)  # Cap at 50 characters
+        return widths.tolist()
+    
+    def _write_excel(self, df: 'pd.DataFrame', output_file: Path, sheet_name: str) -> None:
+        """
+        Write a DataFrame to a single-sheet Excel file with auto-fit column widths
+        
+        Uses the xlsxwriter engine when it is installed, since it writes
+        plain cell data instead of building an openpyxl Cell object per value,
+        and falls back to openpyxl otherwise.
+        
+        Args:
+            df: DataFrame to write (without index)
+            output_file: Path to the .xlsx file
+            sheet_name: Worksheet name
+        """
+        import pandas as pd
+        
+        widths = self._excel_column_widths(df)
+        
+        if XLSXWRITER_AVAILABLE:
+            with pd.ExcelWriter(output_file, engine='xlsxwriter') as writer:
+                df.to_excel(writer, index=False, sheet_name=sheet_name)
+                worksheet = writer.sheets[sheet_name]
+                for i, width in enumerate(widths):
+                    worksheet.set_column(i, i, width)
+        else:
+            from openpyxl.utils import get_column_letter
+            
+            with pd.ExcelWriter(output_file, engine='openpyxl') as writer:
+                df.to_excel(writer, index=False, sheet_name=sheet_name)
+                worksheet = writer.sheets[sheet_name]
+                for i, width in enumerate(widths):
+                    worksheet.column_dimensions[get_column_letter(i + 1)].width = width
+    
+    def _write_excel_streaming(self, df: 'pd.DataFrame', output_file: Path, sheet_name: str) -> None:
+        """
+        Write a DataFrame to a single-sheet Excel file by generating the XLSX XML directly
+        
+        Skips pandas' ExcelWriter and openpyxl entirely: the sheet XML is
+        streamed row by row into the zip archive next to a few static parts,
+        with a bold header, a shared strings table (each distinct string is
+        stored once) and column widths computed from the DataFrame.
+        
+        Args:
+            df: DataFrame to write (without index)
+            output_file: Path to the .xlsx file
+            sheet_name: Worksheet name
+        """
+        letters = [_xlsx_column_letter(i + 1) for i in range(len(df.columns))]
+        cols = ''.join(
+            f'<col min="{i}" max="{i}" width="{width}" customWidth="1"/>'
+            for i, width in enumerate(self._excel_column_widths(df), start=1)
+        )
+        
+        shared_strings: Dict[str, int] = {}
+        
+        with zipfile.ZipFile(output_file, 'w', zipfile.ZIP_DEFLATED) as archive:
+            archive.writestr('[Content_Types].xml', _XLSX_CONTENT_TYPES)
+            archive.writestr('_rels/.rels', _XLSX_ROOT_RELS)
+            archive.writestr('xl/_rels/workbook.xml.rels', _XLSX_WORKBOOK_RELS)
+            archive.writestr('xl/workbook.xml', _XLSX_WORKBOOK.format(sheet_name=quoteattr(sheet_name)))
+            archive.writestr('xl/styles.xml', _XLSX_STYLES)
+            
+            with archive.open('xl/worksheets/sheet1.xml', 'w') as sheet:
+                sheet.write(_XLSX_SHEET_HEADER.encode('utf-8'))
+                if cols:
+                    sheet.write(f'<cols>{cols}</cols>'.encode('utf-8'))
+                sheet.write(b'<sheetData>')
+                
+                header = ''.join(
+                    _xlsx_cell(f'{letter}1', column, shared_strings, style=1)
+                    for letter, column in zip(letters, df.columns)
+                )
+                sheet.write(f'<row r="1">{header}</row>'.encode('utf-8'))
+                
+                for row_number, row in enumerate(df.itertuples(index=False, name=None), start=2):
+                    cells = ''.join(
+                        _xlsx_cell(f'{letter}{row_number}', value, shared_strings)
+                        for letter, value in zip(letters, row)
+                    )
+                    sheet.write(f'<row r="{row_number}">{cells}</row>'.encode('utf-8'))
+                
+                sheet.write(b'</sheetData></worksheet>')
+            
+            # The table is complete only once every row has been written
+            with archive.open('xl/sharedStrings.xml', 'w') as sst:
+                sst.write(
+                    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+                    '<sst xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main" '
+                    f'uniqueCount="{len(shared_strings)}">'.encode('utf-8')
+                )
+                for text in shared_strings:
+                    sst.write(f'<si><t xml:space="preserve">{escape(text)}</t></si>'.encode('utf-8'))
+                sst.write(b'</sst>')
+    
+    def _build_records(self, scored_diseases: List[DiseaseScore], final_top_n: Optional[int] = None) -> ExportRecords:
+        """
+        Gather what all exports need in one pass over the scored diseases
+        
+        The score table is built once, justifications are generated once for
+        every disease any export shows them for (top_n, or all with
+        justify_all, and the final top N) and the JSON records are sliced from
+        the table. Pass the result to the export_* methods and
+        generate_summary_report so none of them walks the list again.
+        
+        Args:
+            scored_diseases: Scored diseases sorted by priority
+            final_top_n: Size of the final top-N export, if any
+            
+        Returns:
+            ExportRecords for this run
+        """
+        output_config = self.config['output']
+        top_n = output_config.get('top_n', 50)
+        
+        if output_config.get('justify_all', False):
+            justify_max_rank = None
+        else:
+            justify_max_rank = max(top_n, final_top_n or 0)
+        
+        table = ScoredTable.from_disease_scores(scored_diseases)
+        justifications = self._justify_rows(scored_diseases, justify_max_rank, log_progress=True)
+        json_records = [
+            {"disease_name": disease_name, "orpha_code": orpha_code}
+            for disease_name, orpha_code in zip(table.disease_names[:top_n].tolist(), table.orpha_codes[:top_n].tolist())
+        ]
+        return ExportRecords(table, justifications, json_records)
+    
+    def export_to_excel(self, scored_diseases: List[DiseaseScore], records: Optional[ExportRecords] = None) -> str:
         """
         Export prioritized diseases to Excel with Spanish column names and detailed justifications
         
         Args:
             scored_diseases: List of scored diseases
+            records: Precomputed export data from _build_records (optional)
             
         Returns:
             Path to output Excel file
@@ -584,82 +1491,57 @@ class RareDiseasePrioritizer:
         output_dir = Path(output_config['base_path'])
         output_dir.mkdir(parents=True, exist_ok=True)
         
-        # Create timestamp for filename
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        # Timestamp for filename, shared by all outputs of this run
+        timestamp = self._run_timestamp
         
         # Change extension to .xlsx and add timestamp
         base_filename = output_config['filename'].replace('.csv', '')
         output_filename = f"{base_filename}_{timestamp}.xlsx"
         output_file = output_dir / output_filename
         
-        # Export ALL diseases for complete analysis in Excel
+        # Export ALL diseases for complete analysis in Excel; justifications
+        # are only written for the top_n unless justify_all is set
         total_diseases = len(scored_diseases)
-        
-        self.logger.info(f"Generating justifications for all {total_diseases} diseases...")
+        if output_config.get('justify_all', False):
+            justify_max_rank = None
+            self.logger.info(f"Generating justifications for all {total_diseases} diseases...")
+        else:
+            justify_max_rank = output_config.get('top_n', 50)
+            self.logger.info(f"Generating justifications for top {justify_max_rank} of {total_diseases} diseases...")
         
         # Prepare data for Excel with separate justification columns - ALL diseases
-        excel_data = []
-        for i, disease_score in enumerate(scored_diseases):
-            if i % 100 == 0:
-                self.logger.info(f"Generated justifications for {i}/{total_diseases} diseases")
-            
-            orpha_code = disease_score.orpha_code
-            
-            excel_data.append({
-                'Ranking': disease_score.rank,
-                'Código ORPHA': disease_score.orpha_code,
-                'Nombre Enfermedad': disease_score.disease_name,
-                'C1: Prevalencia (Score)': round(disease_score.criteria_scores.prevalence, 2),
-                'C1: Prevalencia (Justificación)': self.generate_prevalence_justification(orpha_code),
-                'C2: Impacto Socioeconómico (Score)': round(disease_score.criteria_scores.socioeconomic, 2),
-                'C2: Impacto Socioeconómico (Justificación)': self.generate_socioeconomic_justification(orpha_code),
-                'C3: Terapias Aprobadas (Score)': round(disease_score.criteria_scores.orpha_drugs, 2),
-                'C3: Terapias Aprobadas (Justificación)': self.generate_drugs_justification(orpha_code),
-                'C4: Ensayos Clínicos (Score)': round(disease_score.criteria_scores.clinical_trials, 2),
-                'C4: Ensayos Clínicos (Justificación)': self.generate_clinical_trials_justification(orpha_code),
-                'C5: Trazabilidad Genética (Score)': round(disease_score.criteria_scores.orpha_gene, 2),
-                'C5: Trazabilidad Genética (Justificación)': self.generate_gene_justification(orpha_code),
-                'C6: Capacidad Investigadora (Score)': round(disease_score.criteria_scores.groups, 2),
-                'C6: Capacidad Investigadora (Justificación)': self.generate_groups_justification(orpha_code),
-                'Índice de Prioridad Final': round(disease_score.weighted_score, 2)
-            })
-        
-        # Create DataFrame and save to Excel
-        df = pd.DataFrame(excel_data)
-        
-        # Use openpyxl engine for Excel writing
-        with pd.ExcelWriter(output_file, engine='openpyxl') as writer:
-            df.to_excel(writer, index=False, sheet_name='Priorización Enfermedades')
-            
-            # Auto-adjust column widths
-            worksheet = writer.sheets['Priorización Enfermedades']
-            for column in worksheet.columns:
-                max_length = 0
-                column_letter = column[0].column_letter
-                for cell in column:
-                    try:
-                        if len(str(cell.value)) > max_length:
-                            max_length = len(str(cell.value))
-                    except:
-                        pass
-                adjusted_width = min(max_length + 2, 50)  # Cap at 50 characters
-                worksheet.column_dimensions[column_letter].width = adjusted_width
-        
-        self.logger.info(f"Exported all {len(excel_data)} diseases with justifications to {output_file}")
+        if records is None:
+            df = self._build_excel_dataframe(scored_diseases, log_progress=True, justify_max_rank=justify_max_rank)
+        else:
+            justifications = records.justifications
+            if justify_max_rank is not None:
+                # records may be justified further down for the final top N
+                empty_justifications = ('',) * len(CRITERIA_KEYS)
+                justifications = [
+                    justification if rank <= justify_max_rank else empty_justifications
+                    for justification, rank in zip(justifications, records.table.ranks.tolist())
+                ]
+            df = self._excel_dataframe(records.table, justifications)
+        
+        self._write_excel(df, output_file, 'Priorización Enfermedades')
+        
+        self.logger.info(f"Exported all {len(df)} diseases with justifications to {output_file}")
         return str(output_file)
 
-    def export_prioritized_diseases_json(self, scored_diseases: List[DiseaseScore]) -> str:
+    def export_prioritized_diseases_json(self, scored_diseases: List[DiseaseScore],
+                                         records: Optional[ExportRecords] = None) -> str:
         """
         Export prioritized diseases to JSON in the same format as metabolic disease instances
         
         Args:
             scored_diseases: List of scored diseases
+            records: Precomputed export data from _build_records (optional)
             
         Returns:
             Path to output JSON file
         """
-        # Create timestamp for filename
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        # Timestamp for filename, shared by all outputs of this run
+        timestamp = self._run_timestamp
         
         # Define output path in data/04_curated/metabolic
         output_dir = Path("data/04_curated/metabolic")
@@ -672,27 +1554,37 @@ class RareDiseasePrioritizer:
         top_n = self.config['output'].get('top_n', 50)
         
         # Prepare data in the same format as metabolic disease instances - only top_n diseases
-        json_data = []
-        for disease_score in scored_diseases[:top_n]:
-            json_data.append({
-                "disease_name": disease_score.disease_name,
-                "orpha_code": disease_score.orpha_code
-            })
-        
-        # Save to JSON file
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(json_data, f, indent=2, ensure_ascii=False)
+        if records is not None:
+            json_data = records.json_records
+        else:
+            json_data = []
+            for disease_score in scored_diseases[:top_n]:
+                json_data.append({
+                    "disease_name": disease_score.disease_name,
+                    "orpha_code": disease_score.orpha_code
+                })
+        
+        # Save to JSON file (orjson's indented UTF-8 output matches json.dump below)
+        if ORJSON_AVAILABLE:
+            output_file.write_bytes(orjson.dumps(json_data, option=orjson.OPT_INDENT_2))
+        else:
+            with open(output_file, 'w', encoding='utf-8') as f:
+                json.dump(json_data, f, indent=2, ensure_ascii=False)
         
         self.logger.info(f"Exported {len(json_data)} prioritized diseases to {output_file}")
         return str(output_file)
     
-    def export_final_top_n_excel(self, scored_diseases: List[DiseaseScore], final_top_n: int) -> str:
+    def export_final_top_n_excel(self, scored_diseases: Union[List[DiseaseScore], ScoredTable], final_top_n: int,
+                                 records: Optional[ExportRecords] = None) -> str:
         """
         Export final top N prioritized diseases to Excel with Spanish column names and detailed justifications
         
         Args:
-            scored_diseases: List of scored diseases
+            scored_diseases: List of scored diseases sorted by priority, or a
+                ScoredTable in any order (top N selected by partial sort)
             final_top_n: Number of top diseases to export
+            records: Precomputed export data from _build_records for the same
+                sorted list (optional; its rows are reused as is)
             
         Returns:
             Path to output Excel file
@@ -701,73 +1593,41 @@ class RareDiseasePrioritizer:
         output_dir = Path(output_config['base_path'])
         output_dir.mkdir(parents=True, exist_ok=True)
         
-        # Create timestamp for filename
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        # Timestamp for filename, shared by all outputs of this run
+        timestamp = self._run_timestamp
         
         # Create final top N filename
         base_filename = output_config['filename'].replace('.csv', '')
         output_filename = f"{base_filename}_final_top_{final_top_n}_{timestamp}.xlsx"
         output_file = output_dir / output_filename
         
-        # Export only final top N diseases
-        top_diseases = scored_diseases[:final_top_n]
-        
         self.logger.info(f"Generating justifications for final top {final_top_n} diseases...")
         
-        # Prepare data for Excel with separate justification columns
-        excel_data = []
-        for i, disease_score in enumerate(top_diseases):
-            orpha_code = disease_score.orpha_code
-            
-            excel_data.append({
-                'Ranking': disease_score.rank,
-                'Código ORPHA': disease_score.orpha_code,
-                'Nombre Enfermedad': disease_score.disease_name,
-                'C1: Prevalencia (Score)': round(disease_score.criteria_scores.prevalence, 2),
-                'C1: Prevalencia (Justificación)': self.generate_prevalence_justification(orpha_code),
-                'C2: Impacto Socioeconómico (Score)': round(disease_score.criteria_scores.socioeconomic, 2),
-                'C2: Impacto Socioeconómico (Justificación)': self.generate_socioeconomic_justification(orpha_code),
-                'C3: Terapias Aprobadas (Score)': round(disease_score.criteria_scores.orpha_drugs, 2),
-                'C3: Terapias Aprobadas (Justificación)': self.generate_drugs_justification(orpha_code),
-                'C4: Ensayos Clínicos (Score)': round(disease_score.criteria_scores.clinical_trials, 2),
-                'C4: Ensayos Clínicos (Justificación)': self.generate_clinical_trials_justification(orpha_code),
-                'C5: Trazabilidad Genética (Score)': round(disease_score.criteria_scores.orpha_gene, 2),
-                'C5: Trazabilidad Genética (Justificación)': self.generate_gene_justification(orpha_code),
-                'C6: Capacidad Investigadora (Score)': round(disease_score.criteria_scores.groups, 2),
-                'C6: Capacidad Investigadora (Justificación)': self.generate_groups_justification(orpha_code),
-                'Índice de Prioridad Final': round(disease_score.weighted_score, 2)
-            })
-        
-        # Create DataFrame and save to Excel
-        df = pd.DataFrame(excel_data)
-        
-        # Use openpyxl engine for Excel writing
-        with pd.ExcelWriter(output_file, engine='openpyxl') as writer:
-            df.to_excel(writer, index=False, sheet_name='Top Enfermedades Priorizadas')
-            
-            # Auto-adjust column widths
-            worksheet = writer.sheets['Top Enfermedades Priorizadas']
-            for column in worksheet.columns:
-                max_length = 0
-                column_letter = column[0].column_letter
-                for cell in column:
-                    try:
-                        if len(str(cell.value)) > max_length:
-                            max_length = len(str(cell.value))
-                    except:
-                        pass
-                adjusted_width = min(max_length + 2, 50)  # Cap at 50 characters
-                worksheet.column_dimensions[column_letter].width = adjusted_width
+        # Export only final top N diseases; a DiseaseScore list is already sorted
+        if records is not None:
+            df = self._excel_dataframe(records.table.head(final_top_n), records.justifications[:final_top_n])
+        else:
+            if isinstance(scored_diseases, ScoredTable):
+                top_diseases = scored_diseases.top_n(final_top_n).to_disease_scores()
+            else:
+                top_diseases = scored_diseases[:final_top_n]
+            
+            # Prepare data for Excel with separate justification columns
+            df = self._build_excel_dataframe(top_diseases)
+        
+        self._write_excel_streaming(df, output_file, 'Top Enfermedades Priorizadas')
         
         self.logger.info(f"Exported final top {final_top_n} diseases with justifications to {output_file}")
         return str(output_file)
 
-    def generate_summary_report(self, scored_diseases: List[DiseaseScore]) -> str:
+    def generate_summary_report(self, scored_diseases: List[DiseaseScore],
+                                records: Optional[ExportRecords] = None) -> str:
         """
         Generate a summary report of the prioritization
         
         Args:
             scored_diseases: List of scored diseases
+            records: Precomputed export data from _build_records (optional)
             
         Returns:
             Summary report text
@@ -775,15 +1635,23 @@ class RareDiseasePrioritizer:
         total_diseases = len(scored_diseases)
         criteria_config = self.config['criteria']
         
-        # Calculate statistics
-        scores = [d.weighted_score for d in scored_diseases]
-        mean_score = sum(scores) / len(scores)
+        # Calculate statistics on the score arrays
+        table = records.table if records is not None else ScoredTable.from_disease_scores(scored_diseases)
+        mean_score = table.weighted_scores.mean()
+        
+        weights = [(label, criteria_config[key]['weight']) for label, key in CRITERIA_LABELS]
+        weight_lines = "\n".join(f"- {label}: {weight:.0%}" for label, weight in weights)
         
         # Count diseases with data in each criterion
-        has_prevalence = sum(1 for d in scored_diseases if d.criteria_scores.prevalence > 0)
-        has_drugs = sum(1 for d in scored_diseases if d.criteria_scores.orpha_drugs < 10)  # Inverse scoring
-        has_trials = sum(1 for d in scored_diseases if d.criteria_scores.clinical_trials > 0)
-        has_genes = sum(1 for d in scored_diseases if d.criteria_scores.orpha_gene > 0)
+        coverage = {
+            'prevalence data': int(np.count_nonzero(table.criterion('prevalence') > 0)),
+            'approved therapies': int(np.count_nonzero(table.criterion('orpha_drugs') < 10)),  # Inverse scoring
+            'clinical trials': int(np.count_nonzero(table.criterion('clinical_trials') > 0)),
+            'gene data': int(np.count_nonzero(table.criterion('orpha_gene') > 0)),
+        }
+        coverage_lines = "\n".join(
+            f"- Diseases with {label}: {count} ({count/total_diseases:.1%})" for label, count in coverage.items()
+        )
         
         report = f"""
 Rare Disease Prioritization Summary Report
@@ -794,24 +1662,18 @@ Total Diseases Analyzed: {total_diseases}
 Mean Weighted Score: {mean_score:.2f}
 
 Criteria Weights (SOW Configuration):
-- Prevalence: {criteria_config['prevalence']['weight']:.0%}
-- Socioeconomic: {criteria_config['socioeconomic']['weight']:.0%}
-- Drugs (Therapies): {criteria_config['orpha_drugs']['weight']:.0%}
-- Clinical Trials: {criteria_config['clinical_trials']['weight']:.0%}
-- Gene Therapy: {criteria_config['orpha_gene']['weight']:.0%}
-- Groups: {criteria_config['groups']['weight']:.0%}
+{weight_lines}
 
 Data Coverage:
-- Diseases with prevalence data: {has_prevalence} ({has_prevalence/total_diseases:.1%})
-- Diseases with approved therapies: {has_drugs} ({has_drugs/total_diseases:.1%})
-- Diseases with clinical trials: {has_trials} ({has_trials/total_diseases:.1%})
-- Diseases with gene data: {has_genes} ({has_genes/total_diseases:.1%})
+{coverage_lines}
 
 Top 10 Prioritized Diseases:
 """
         
-        for i, disease in enumerate(scored_diseases[:10]):
-            report += f"{i+1:2d}. {disease.disease_name} (ORPHA:{disease.orpha_code}) - Score: {disease.weighted_score:.2f}\n"
+        top10 = table.head(10)
+        for i, (disease_name, orpha_code, weighted_score) in enumerate(zip(
+                top10.disease_names.tolist(), top10.orpha_codes.tolist(), top10.weighted_scores.tolist())):
+            report += f"{i+1:2d}. {disease_name} (ORPHA:{orpha_code}) - Score: {weighted_score:.2f}\n"
         
         return report
 
@@ -861,57 +1723,79 @@ Examples:
     return parser
 
 
+def apply_cli_overrides(config: dict, args: argparse.Namespace) -> None:
+    """Override config values in place with command line arguments"""
+    if args.output:
+        config['output']['filename'] = Path(args.output).name
+        config['output']['base_path'] = str(Path(args.output).parent)
+    
+    if args.top_n:
+        config['output']['top_n'] = args.top_n
+    
+    if args.verbose:
+        config.setdefault('logging', {})['level'] = 'DEBUG'
+
+
 def main():
     """Main function"""
     parser = create_argument_parser()
     args = parser.parse_args()
     
     try:
+        if args.dry_run:
+            # Validate the configuration without building the prioritizer
+            # (no log file, no scoring setup)
+            config = RareDiseasePrioritizer._load_config(args.config)
+            apply_cli_overrides(config, args)
+            logging.basicConfig(
+                level=getattr(logging, config.get('logging', {}).get('level', 'INFO')),
+                format=LOG_FORMAT
+            )
+            logger = logging.getLogger(__name__)
+            logger.info("Starting rare disease prioritization")
+            logger.info("DRY RUN - Configuration loaded successfully")
+            logger.info(f"Input: {config['input']['data_source']}")
+            logger.info(f"Output: {config['output']['base_path']}/{config['output']['filename']}")
+            logger.info(f"Top N: {config['output']['top_n']}")
+            return 0
+        
         # Initialize prioritizer
         prioritizer = RareDiseasePrioritizer(args.config)
         
         # Override config with command line arguments
-        if args.output:
-            prioritizer.config['output']['filename'] = Path(args.output).name
-            prioritizer.config['output']['base_path'] = str(Path(args.output).parent)
-        
-        if args.top_n:
-            prioritizer.config['output']['top_n'] = args.top_n
-        
+        apply_cli_overrides(prioritizer.config, args)
         if args.verbose:
-            prioritizer.config['logging']['level'] = 'DEBUG'
             prioritizer._setup_logging()
         
         logger = logging.getLogger(__name__)
         logger.info("Starting rare disease prioritization")
         
-        if args.dry_run:
-            logger.info("DRY RUN - Configuration loaded successfully")
-            logger.info(f"Input: {prioritizer.config['input']['data_source']}")
-            logger.info(f"Output: {prioritizer.config['output']['base_path']}/{prioritizer.config['output']['filename']}")
-            logger.info(f"Top N: {prioritizer.config['output']['top_n']}")
-            return 0
-        
         # Load diseases
         diseases = prioritizer.load_diseases()
         
         # Prioritize diseases
         scored_diseases = prioritizer.prioritize_diseases(diseases)
+        if not scored_diseases:
+            print("Error: no disease could be scored, nothing to export")
+            return 1
+        
+        # Gather the data for every export in one pass
+        output_final_top_n = prioritizer.config['output'].get('output_final_top_n')
+        records = prioritizer._build_records(scored_diseases, output_final_top_n)
         
         # Export results to Excel
-        excel_output_file = prioritizer.export_to_excel(scored_diseases)
+        excel_output_file = prioritizer.export_to_excel(scored_diseases, records)
         
         # Export results to JSON
-        json_output_file = prioritizer.export_prioritized_diseases_json(scored_diseases)
+        json_output_file = prioritizer.export_prioritized_diseases_json(scored_diseases, records)
         
         # Export final top N Excel if configured
         final_excel_output_file = None
-        output_final_top_n = prioritizer.config['output'].get('output_final_top_n')
         if output_final_top_n is not None:
-            final_excel_output_file = prioritizer.export_final_top_n_excel(scored_diseases, output_final_top_n)
+            final_excel_output_file = prioritizer.export_final_top_n_excel(scored_diseases, output_final_top_n, records)
         
         # Generate and print summary
-        summary = prioritizer.generate_summary_report(scored_diseases)
+        summary = prioritizer.generate_summary_report(scored_diseases, records)
         print(summary)
         
         logger.info(f"Prioritization complete.")
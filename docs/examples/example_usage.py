@@ -2,7 +2,6 @@
 Example usage of the Pydantic models for prompt validation and serialization.
 """
 
-import json
 from .prompt_models import (
     SocioeconomicImpactResponse, 
     GroupsResponse, 
@@ -129,9 +128,9 @@ def validate_json_string():
     '''
     
     try:
-        # Parse JSON and validate with Pydantic
-        data = json.loads(json_response)
-        validated_response = SocioeconomicImpactResponse(**data)
+        # Parse and validate in one step (pydantic-core parses the JSON directly,
+        # without building an intermediate dict)
+        validated_response = SocioeconomicImpactResponse.model_validate_json(json_response)
         print("✅ JSON validation successful!")
         print(f"Score: {validated_response.score}")
         print(f"Evidence Level: {validated_response.evidence_level}")
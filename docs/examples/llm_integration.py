@@ -5,8 +5,10 @@ for structured JSON responses.
 
 import os
 import json
-from typing import Type, TypeVar, Union
-from openai import OpenAI
+import asyncio
+from string import Template
+from functools import lru_cache
+from typing import Any, Dict, List, Type, TypeVar, Union
 from dotenv import load_dotenv
 from .prompt_models import (
     SocioeconomicImpactResponse, 
@@ -20,6 +22,46 @@ load_dotenv()
 # Type variable for generic response handling
 T = TypeVar('T', bound=Union[SocioeconomicImpactResponse, GroupsResponse])
 
+
+# Schema generation is not cheap in Pydantic v2 and the result only depends on
+# the model class, so it is built once per model
+@lru_cache(maxsize=None)
+def _json_schema_for(model_cls: type) -> Dict[str, Any]:
+    """JSON schema of a Pydantic model (treat as read-only)"""
+    return model_cls.model_json_schema()
+
+
+def _format_prompt(prompt: Union[str, Template], disease_query: DiseaseQuery) -> str:
+    """Fill a prompt with the disease fields (Template, or str.format-style string)"""
+    if isinstance(prompt, Template):
+        return prompt.substitute(
+            disease_name=disease_query.disease_name,
+            orphacode=disease_query.orphacode
+        )
+    return prompt.format(
+        disease_name=disease_query.disease_name,
+        orphacode=disease_query.orphacode
+    )
+
+
+def _function_schema(response_model: type) -> Dict[str, Any]:
+    """Function definition that makes the model submit a response_model instance"""
+    return {
+        "name": "submit_analysis",
+        "description": f"Submit the {response_model.__name__} analysis",
+        "parameters": _json_schema_for(response_model)
+    }
+
+
+def _function_call_response(response, response_model: Type[T]) -> T:
+    """Validate the submit_analysis call arguments of a function-calling response"""
+    function_call = response.choices[0].message.function_call
+    if function_call and function_call.name == "submit_analysis":
+        arguments = json.loads(function_call.arguments)
+        return response_model(**arguments)
+    raise Exception("Function call not found in response")
+
+
 class LLMClient:
     """Client for structured LLM interactions using Pydantic models"""
     
@@ -28,21 +70,28 @@ class LLMClient:
         if not api_key:
             raise ValueError("OAI_API_KEY environment variable is not set")
         
+        # Imported here so importing this module (e.g. for the prompts) doesn't load openai
+        from openai import OpenAI
+        
         self.client = OpenAI(api_key=api_key)
     
     def get_structured_response(
         self, 
-        prompt: str, 
+        prompt: Union[str, Template], 
         response_model: Type[T], 
         disease_query: DiseaseQuery,
         model: str = "gpt-4o-mini",
         temperature: float = 0.1
     ) -> T:
         """
-        Get structured JSON response using Pydantic model validation
+        Get a structured response parsed straight into the Pydantic model
+        
+        Uses OpenAI structured outputs (beta.chat.completions.parse): the API
+        is constrained by the model's schema and the SDK returns a validated
+        instance, so no schema goes into the prompt and no JSON is parsed here.
         
         Args:
-            prompt: The formatted prompt string
+            prompt: Prompt template (string.Template, or a str.format string)
             response_model: Pydantic model class for response validation
             disease_query: Disease information for prompt formatting
             model: OpenAI model to use
@@ -52,49 +101,35 @@ class LLMClient:
             Validated Pydantic model instance
         """
         
-        # Format prompt with disease information
-        formatted_prompt = prompt.format(
-            disease_name=disease_query.disease_name,
-            orphacode=disease_query.orphacode
-        )
-        
-        # Get JSON schema from Pydantic model
-        schema = response_model.model_json_schema()
-        
-        # Create system message with JSON schema
-        system_message = f"""
-        You are a biomedical research assistant. Respond with valid JSON that matches this exact schema:
-        
-        {json.dumps(schema, indent=2)}
-        
-        Important:
-        - Return ONLY the JSON object, no markdown formatting
-        - Use empty strings ("") for unknown fields, never null
-        - Follow the schema exactly
-        """
-        
         try:
-            # Method 1: Using JSON mode (recommended for most cases)
-            response = self.client.chat.completions.create(
+            # Method 1: Using structured outputs (recommended for most cases)
+            response = self.client.beta.chat.completions.parse(
                 model=model,
-                messages=[
-                    {"role": "system", "content": system_message},
-                    {"role": "user", "content": formatted_prompt}
-                ],
+                messages=self._messages(prompt, disease_query),
                 temperature=temperature,
-                response_format={"type": "json_object"}  # Forces JSON output
+                response_format=response_model
             )
-            
-            # Extract and validate JSON response
-            json_content = response.choices[0].message.content
-            return self._validate_response(json_content, response_model)
+            return self._parsed_response(response)
             
         except Exception as e:
             raise Exception(f"Error getting structured response: {e}")
     
+    def _messages(self, prompt: Union[str, Template], disease_query: DiseaseQuery) -> List[Dict[str, str]]:
+        """
+        Build the system/user messages for a request
+        """
+        
+        # Format prompt with disease information
+        formatted_prompt = _format_prompt(prompt, disease_query)
+        
+        return [
+            {"role": "system", "content": "You are a biomedical research assistant."},
+            {"role": "user", "content": formatted_prompt}
+        ]
+    
     def get_structured_response_with_function_calling(
         self, 
-        prompt: str, 
+        prompt: Union[str, Template], 
         response_model: Type[T], 
         disease_query: DiseaseQuery,
         model: str = "gpt-4o-mini"
@@ -103,67 +138,90 @@ class LLMClient:
         Alternative method using function calling for guaranteed structure
         """
         
-        # Format prompt with disease information
-        formatted_prompt = prompt.format(
-            disease_name=disease_query.disease_name,
-            orphacode=disease_query.orphacode
-        )
-        
-        # Create function schema from Pydantic model
-        function_schema = {
-            "name": "submit_analysis",
-            "description": f"Submit the {response_model.__name__} analysis",
-            "parameters": response_model.model_json_schema()
-        }
-        
         try:
             response = self.client.chat.completions.create(
                 model=model,
-                messages=[
-                    {"role": "system", "content": "You are a biomedical research assistant."},
-                    {"role": "user", "content": formatted_prompt}
-                ],
-                functions=[function_schema],
+                messages=self._messages(prompt, disease_query),
+                functions=[_function_schema(response_model)],
                 function_call={"name": "submit_analysis"}
             )
-            
-            # Extract function call arguments
-            function_call = response.choices[0].message.function_call
-            if function_call and function_call.name == "submit_analysis":
-                arguments = json.loads(function_call.arguments)
-                return response_model(**arguments)
-            else:
-                raise Exception("Function call not found in response")
+            return _function_call_response(response, response_model)
                 
         except Exception as e:
             raise Exception(f"Error with function calling: {e}")
     
-    def _validate_response(self, json_content: str, response_model: Type[T]) -> T:
+    def _parsed_response(self, response) -> T:
         """
-        Validate JSON response against Pydantic model
+        Return the model instance from a structured-output response
         """
+        message = response.choices[0].message
+        if message.parsed is None:
+            raise Exception(f"No structured response (refusal: {message.refusal})")
+        return message.parsed
+
+class AsyncLLMClient(LLMClient):
+    """Asynchronous variant of LLMClient for running many requests concurrently"""
+    
+    def __init__(self):
+        api_key = os.getenv('OAI_API_KEY')
+        if not api_key:
+            raise ValueError("OAI_API_KEY environment variable is not set")
+        
+        from openai import AsyncOpenAI
+        
+        self.client = AsyncOpenAI(api_key=api_key)
+    
+    async def get_structured_response(
+        self, 
+        prompt: Union[str, Template], 
+        response_model: Type[T], 
+        disease_query: DiseaseQuery,
+        model: str = "gpt-4o-mini",
+        temperature: float = 0.1
+    ) -> T:
+        """
+        Awaitable version of LLMClient.get_structured_response
+        """
+        
         try:
-            # Parse JSON
-            data = json.loads(json_content)
-            
-            # Validate with Pydantic model
-            validated_response = response_model(**data)
-            
-            return validated_response
+            response = await self.client.beta.chat.completions.parse(
+                model=model,
+                messages=self._messages(prompt, disease_query),
+                temperature=temperature,
+                response_format=response_model
+            )
+            return self._parsed_response(response)
             
-        except json.JSONDecodeError as e:
-            raise Exception(f"Invalid JSON response: {e}\nContent: {json_content}")
         except Exception as e:
-            raise Exception(f"Validation error: {e}\nContent: {json_content}")
-
-# Example usage functions
-def analyze_socioeconomic_impact(disease_query: DiseaseQuery) -> SocioeconomicImpactResponse:
-    """
-    Analyze socioeconomic impact of a rare disease
-    """
+            raise Exception(f"Error getting structured response: {e}")
     
-    # Your existing prompt from openai_tries.py
-    prompt = """Generate a single, well-formed JSON object that assigns a socioeconomic-impact score to a specific rare disease identified by its ORPHA code.
+    async def get_structured_response_with_function_calling(
+        self, 
+        prompt: Union[str, Template], 
+        response_model: Type[T], 
+        disease_query: DiseaseQuery,
+        model: str = "gpt-4o-mini"
+    ) -> T:
+        """
+        Awaitable version of LLMClient.get_structured_response_with_function_calling
+        """
+        
+        try:
+            response = await self.client.chat.completions.create(
+                model=model,
+                messages=self._messages(prompt, disease_query),
+                functions=[_function_schema(response_model)],
+                function_call={"name": "submit_analysis"}
+            )
+            return _function_call_response(response, response_model)
+                
+        except Exception as e:
+            raise Exception(f"Error with function calling: {e}")
+
+# Prompts, shared by the single-disease and batch helpers below. They use
+# string.Template placeholders ($disease_name, $orphacode) and are parsed once
+# at import, so literal braces in the text need no escaping.
+SOCIOECONOMIC_PROMPT = Template("""Generate a single, well-formed JSON object that assigns a socioeconomic-impact score to a specific rare disease identified by its ORPHA code.
 Follow every instruction precisely: add no extra keys, keep the indicated order, and output only the JSON object (no Markdown, no comments).
 
 1 · Gather the best available evidence
@@ -188,31 +246,18 @@ Score 5 – Medium evidence: quantitative data in a high-quality patient-organis
 Score 3 – Low evidence: only qualitative descriptions of severe burden.
 Score 0 – No evidence: no relevant information found.
 
-The disease name is: {disease_name}
-The ORPHA code is: {orphacode}
-"""
-    
-    client = LLMClient()
-    return client.get_structured_response(
-        prompt=prompt,
-        response_model=SocioeconomicImpactResponse,
-        disease_query=disease_query
-    )
+The disease name is: ${disease_name}
+The ORPHA code is: ${orphacode}
+""")
 
-def analyze_ciberer_groups(disease_query: DiseaseQuery) -> GroupsResponse:
-    """
-    Analyze CIBERER research groups for a rare disease
-    """
-    
-    # Your existing prompt from openai_tries.py
-    prompt = """**Improved Prompt for the Biomedical Text-Mining Assistant**
+GROUPS_PROMPT = Template("""**Improved Prompt for the Biomedical Text-Mining Assistant**
 
-Your goal is to build a single, well-formed JSON object that maps **every CIBERER research unit (Uxxx) with any connection to {disease_name} (ORPHA:{orphacode})**—even if the group has produced **no** relevant publications.
+Your goal is to build a single, well-formed JSON object that maps **every CIBERER research unit (Uxxx) with any connection to ${disease_name} (ORPHA:${orphacode})**—even if the group has produced **no** relevant publications.
 Follow the steps and JSON schema below **exactly**; add **no extra keys**, keep the **key order**, and output **only** the JSON object (no Markdown, no comments).
 
 ### 1 · Identify candidate units
 * **Scan the entire public domain of CIBERER** (annual reports, news, press releases, group profiles, "Results" pages, etc.).
-* Run comprehensive web searches (Google, Bing, DuckDuckGo) combining **"CIBERER" + "{disease_name}"** and synonyms or genes related to the disease.
+* Run comprehensive web searches (Google, Bing, DuckDuckGo) combining **"CIBERER" + "${disease_name}"** and synonyms or genes related to the disease.
 * Record **every** unit ID you find, **even when no paper is yet linked**.
 
 ### 2 · Collect core metadata for each unit
@@ -221,17 +266,66 @@ Follow the steps and JSON schema below **exactly**; add **no extra keys**, keep
 * **principal_investigators** – *all* PIs or co-PIs; capture their role ("Principal Investigator", "Co-PI", etc.).
 * Leave any unknown field as an empty string `""`.
 
-The disease name is: {disease_name}
-The ORPHA code is: {orphacode}
-"""
+The disease name is: ${disease_name}
+The ORPHA code is: ${orphacode}
+""")
+
+PROMPTS = {
+    SocioeconomicImpactResponse: SOCIOECONOMIC_PROMPT,
+    GroupsResponse: GROUPS_PROMPT,
+}
+
+# Example usage functions
+def analyze_socioeconomic_impact(disease_query: DiseaseQuery) -> SocioeconomicImpactResponse:
+    """
+    Analyze socioeconomic impact of a rare disease
+    """
     
     client = LLMClient()
     return client.get_structured_response(
-        prompt=prompt,
+        prompt=SOCIOECONOMIC_PROMPT,
+        response_model=SocioeconomicImpactResponse,
+        disease_query=disease_query
+    )
+
+def analyze_ciberer_groups(disease_query: DiseaseQuery) -> GroupsResponse:
+    """
+    Analyze CIBERER research groups for a rare disease
+    """
+    
+    client = LLMClient()
+    return client.get_structured_response(
+        prompt=GROUPS_PROMPT,
         response_model=GroupsResponse,
         disease_query=disease_query
     )
 
+async def analyze_many(
+    diseases: List[DiseaseQuery],
+    response_model: Type[T] = SocioeconomicImpactResponse,
+    limit: int = 20
+) -> List[Union[T, Exception]]:
+    """
+    Run one analysis per disease concurrently, with at most `limit` requests in flight
+    
+    Results come back in the order of `diseases`; a failed request yields its
+    exception instead of cancelling the rest. Run with asyncio.run(analyze_many(...)).
+    """
+    
+    client = AsyncLLMClient()
+    prompt = PROMPTS[response_model]
+    semaphore = asyncio.Semaphore(limit)
+    
+    async def bounded(disease_query: DiseaseQuery) -> T:
+        async with semaphore:
+            return await client.get_structured_response(
+                prompt=prompt,
+                response_model=response_model,
+                disease_query=disease_query
+            )
+    
+    return await asyncio.gather(*(bounded(d) for d in diseases), return_exceptions=True)
+
 # Example usage
 def main():
     """
@@ -16,6 +16,12 @@ class SocioeconomicScore(int, Enum):
     LOW = 3
     NONE = 0
 
+# Response fields are annotated with the enum values as Literal types:
+# pydantic-core checks a Literal against a set of allowed values, which is
+# cheaper than enum validation. The Enum classes stay as named constants.
+EvidenceLevelValue = Literal["High evidence", "Medium-High evidence", "Medium evidence", "Low evidence", ""]
+SocioeconomicScoreValue = Literal[10, 7, 5, 3, 0]
+
 class SocioeconomicStudy(BaseModel):
     """Model for individual socioeconomic impact studies"""
     cost: int = Field(default=0, description="Annual mean cost in euros (rounded to integer)")
@@ -33,13 +39,20 @@ class SocioeconomicImpactResponse(BaseModel):
         default_factory=list,
         description="List of relevant studies and reports"
     )
-    score: SocioeconomicScore = Field(description="Overall socioeconomic impact score")
-    evidence_level: EvidenceLevel = Field(description="Level of evidence supporting the score")
+    score: SocioeconomicScoreValue = Field(description="Overall socioeconomic impact score")
+    evidence_level: EvidenceLevelValue = Field(description="Level of evidence supporting the score")
     justification: str = Field(
         default="",
         description="1-3 sentences explaining why this score was assigned"
     )
 
+class SocioeconomicImpactBatchResponse(BaseModel):
+    """Model for several socioeconomic impact analyses returned in one response"""
+    results: List[SocioeconomicImpactResponse] = Field(
+        default_factory=list,
+        description="One analysis per requested disease, in the requested order"
+    )
+
 class PrincipalInvestigator(BaseModel):
     """Model for principal investigators"""
     name: str = Field(default="", description="Name of the principal investigator")
@@ -5,32 +5,59 @@ from OpenAI's API using Pydantic models.
 
 import os
 import json
-from openai import OpenAI
+import asyncio
+from itertools import islice
+from typing import List, Optional
+from openai import OpenAI, AsyncOpenAI
 from dotenv import load_dotenv
-from .prompt_models import SocioeconomicImpactResponse, DiseaseQuery
+from .prompt_models import SocioeconomicImpactResponse, SocioeconomicImpactBatchResponse, DiseaseQuery
 
 # Load environment variables
 load_dotenv()
 
-def method_1_json_mode():
+# Response schemas and the request parameters built from them, generated
+# once at import instead of on every call
+_SCHEMA = SocioeconomicImpactResponse.model_json_schema()
+_SCHEMA_JSON = json.dumps(_SCHEMA, indent=2)
+
+_FUNCTION_SCHEMA = {
+    "name": "submit_analysis",
+    "description": "Submit socioeconomic impact analysis",
+    "parameters": _SCHEMA
+}
+
+_RESPONSE_FORMAT = {
+    "type": "json_schema",
+    "json_schema": {
+        "name": "socioeconomic_analysis",
+        "schema": _SCHEMA
+    }
+}
+
+_BATCH_RESPONSE_FORMAT = {
+    "type": "json_schema",
+    "json_schema": {
+        "name": "socioeconomic_analysis_batch",
+        "schema": SocioeconomicImpactBatchResponse.model_json_schema()
+    }
+}
+
+async def method_1_json_mode():
     """
     Method 1: Using JSON mode (recommended)
     Forces the model to respond with valid JSON
     """
     
-    client = OpenAI(api_key=os.getenv('OAI_API_KEY'))
+    client = AsyncOpenAI(api_key=os.getenv('OAI_API_KEY'))
     
     # Create disease query
     disease = DiseaseQuery(orphacode="905", disease_name="Wilson disease")
     
-    # Get JSON schema from Pydantic model
-    schema = SocioeconomicImpactResponse.model_json_schema()
-    
     # System prompt with schema
     system_prompt = f"""
     You are a research assistant. Respond with valid JSON matching this schema:
     
-    {json.dumps(schema, indent=2)}
+    {_SCHEMA_JSON}
     
     Use empty strings ("") for unknown fields, never null.
     """
@@ -42,7 +69,7 @@ def method_1_json_mode():
     """
     
     # Call API with JSON mode
-    response = client.chat.completions.create(
+    response = await client.chat.completions.create(
         model="gpt-4o-mini",
         messages=[
             {"role": "system", "content": system_prompt},
@@ -52,30 +79,22 @@ def method_1_json_mode():
         response_format={"type": "json_object"}  # This forces JSON output
     )
     
-    # Parse and validate response
+    # Parse and validate response in one step
     json_content = response.choices[0].message.content
-    data = json.loads(json_content)
-    validated_response = SocioeconomicImpactResponse(**data)
+    validated_response = SocioeconomicImpactResponse.model_validate_json(json_content)
     
     return validated_response
 
-def method_2_function_calling():
+async def method_2_function_calling():
     """
     Method 2: Using function calling for guaranteed structure
     """
     
-    client = OpenAI(api_key=os.getenv('OAI_API_KEY'))
+    client = AsyncOpenAI(api_key=os.getenv('OAI_API_KEY'))
     
     # Create disease query
     disease = DiseaseQuery(orphacode="905", disease_name="Wilson disease")
     
-    # Define function schema from Pydantic model
-    function_schema = {
-        "name": "submit_analysis",
-        "description": "Submit socioeconomic impact analysis",
-        "parameters": SocioeconomicImpactResponse.model_json_schema()
-    }
-    
     # User prompt
     user_prompt = f"""
     Analyze the socioeconomic impact of {disease.disease_name} (ORPHA:{disease.orphacode}).
@@ -83,31 +102,30 @@ def method_2_function_calling():
     """
     
     # Call API with function calling
-    response = client.chat.completions.create(
+    response = await client.chat.completions.create(
         model="gpt-4o-mini",
         messages=[
             {"role": "user", "content": user_prompt}
         ],
-        functions=[function_schema],
+        functions=[_FUNCTION_SCHEMA],
         function_call={"name": "submit_analysis"}
     )
     
     # Extract function call arguments
     function_call = response.choices[0].message.function_call
     if function_call and function_call.name == "submit_analysis":
-        arguments = json.loads(function_call.arguments)
-        validated_response = SocioeconomicImpactResponse(**arguments)
+        validated_response = SocioeconomicImpactResponse.model_validate_json(function_call.arguments)
         return validated_response
     else:
         raise Exception("Function call not found in response")
 
-def method_3_structured_outputs():
+async def method_3_structured_outputs():
     """
     Method 3: Using OpenAI's Structured Outputs (newest method)
     Available with newer models like gpt-4o-mini
     """
     
-    client = OpenAI(api_key=os.getenv('OAI_API_KEY'))
+    client = AsyncOpenAI(api_key=os.getenv('OAI_API_KEY'))
     
     # Create disease query
     disease = DiseaseQuery(orphacode="905", disease_name="Wilson disease")
@@ -118,40 +136,86 @@ def method_3_structured_outputs():
     Find cost studies and assign a score (0, 3, 5, 7, or 10).
     """
     
-    # Get JSON schema from Pydantic model
-    schema = SocioeconomicImpactResponse.model_json_schema()
-    
     try:
         # Call API with structured outputs
-        response = client.chat.completions.create(
+        response = await client.chat.completions.create(
             model="gpt-4o-mini",
             messages=[
                 {"role": "user", "content": user_prompt}
             ],
-            response_format={
-                "type": "json_schema",
-                "json_schema": {
-                    "name": "socioeconomic_analysis",
-                    "schema": schema
-                }
-            }
+            response_format=_RESPONSE_FORMAT
         )
         
-        # Parse and validate response
+        # Parse and validate response in one step
         json_content = response.choices[0].message.content
-        data = json.loads(json_content)
-        validated_response = SocioeconomicImpactResponse(**data)
+        validated_response = SocioeconomicImpactResponse.model_validate_json(json_content)
         
         return validated_response
         
     except Exception as e:
         print(f"Structured outputs not available: {e}")
         # Fallback to JSON mode
-        return method_1_json_mode()
+        return await method_1_json_mode()
+
+def analyze_batch(diseases: List[DiseaseQuery], k: int = 10) -> List[Optional[SocioeconomicImpactResponse]]:
+    """
+    Batch prompting: analyze up to k diseases per API call
+    
+    Each request lists k diseases and asks for one analysis per disease in a
+    single structured response, so the per-request overhead (network,
+    queueing, system prompt tokens) is paid once per batch instead of once
+    per disease. Keep k small enough for the answers to fit the context window.
+    
+    Returns:
+        One result per input disease, in input order (None if the model
+        left a disease out)
+    """
+    
+    client = OpenAI(api_key=os.getenv('OAI_API_KEY'))
+    
+    results = []
+    disease_iter = iter(diseases)
+    while True:
+        batch = list(islice(disease_iter, k))
+        if not batch:
+            break
+        
+        disease_list = "\n".join(
+            f"{i}. {disease.disease_name} (ORPHA:{disease.orphacode})"
+            for i, disease in enumerate(batch, start=1)
+        )
+        user_prompt = f"""
+    Analyze the socioeconomic impact of each of these {len(batch)} diseases:
+    {disease_list}
+    
+    For each one, find cost studies and assign a score (0, 3, 5, 7, or 10).
+    Return one entry in "results" per disease, in the same order.
+    """
+        
+        response = client.chat.completions.create(
+            model="gpt-4o-mini",
+            messages=[
+                {"role": "user", "content": user_prompt}
+            ],
+            response_format=_BATCH_RESPONSE_FORMAT
+        )
+        
+        # Parse and validate the whole batch at once
+        json_content = response.choices[0].message.content
+        batch_response = SocioeconomicImpactBatchResponse.model_validate_json(json_content)
+        
+        # Match answers back to the requested diseases by ORPHA code
+        by_orphacode = {result.orphacode: result for result in batch_response.results}
+        results.extend(by_orphacode.get(disease.orphacode) for disease in batch)
+    
+    return results
 
-def compare_methods():
+async def compare_methods():
     """
     Compare different methods for getting structured JSON
+    
+    The three requests are independent, so they run concurrently and the
+    comparison takes as long as the slowest one.
     """
     
     methods = [
@@ -160,10 +224,13 @@ def compare_methods():
         ("Structured Outputs", method_3_structured_outputs)
     ]
     
-    for method_name, method_func in methods:
+    results = await asyncio.gather(*(method_func() for _, method_func in methods), return_exceptions=True)
+    
+    for (method_name, _), result in zip(methods, results):
         print(f"\n=== {method_name} ===")
         try:
-            result = method_func()
+            if isinstance(result, BaseException):
+                raise result
             print(f"✅ Success!")
             print(f"Score: {result.score}")
             print(f"Evidence Level: {result.evidence_level}")
@@ -204,7 +271,7 @@ def validate_existing_json():
     
     try:
         # Validate with Pydantic
-        validated = SocioeconomicImpactResponse(**json_response)
+        validated = SocioeconomicImpactResponse.model_validate(json_response)
         print("✅ JSON validation successful!")
         print(f"Validated score: {validated.score}")
         return validated
@@ -223,7 +290,7 @@ if __name__ == "__main__":
     
     # Compare API methods
     print("\n2. Comparing API methods:")
-    compare_methods()
+    asyncio.run(compare_methods())
     
     print("\n=== Summary ===")
     print("✅ JSON Mode: Most reliable, forces JSON output")
@@ -1,93 +1,195 @@
-import json
 import sys
+import time
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from datetime import datetime
+from typing import List
+
+from pydantic import TypeAdapter
 
 # Add project root to path
 sys.path.append(str(Path(__file__).parent.parent))
 
 from utils.clinical_trials.clinical_trials import ClinicalTrialsAPIClient
-from utils.pipeline.run_management import get_next_run_number, is_disease_processed, save_processing_result
+from utils.pipeline.run_management import RUN_HISTORY_PATH, build_run_manifest, save_processing_result
 from data.models.disease import SimpleDisease, ClinicalTrialResult
 
 
+logger = logging.getLogger(__name__)
+
+
+# Concurrent API requests and the global politeness delay between request
+# starts; ClinicalTrials.gov allows about 50 requests per minute per client
+DEFAULT_MAX_WORKERS = 4
+DEFAULT_DELAY = 1.2
+
+# requests.Session is not thread-safe, so each worker thread gets its own client
+_thread_local = threading.local()
+_clients = []
+
+# Parses and validates the whole diseases file in a single pydantic-core pass
+_DISEASE_LIST = TypeAdapter(List[SimpleDisease])
+
+
+def _get_client():
+    """Return this thread's ClinicalTrialsAPIClient, creating it on first use"""
+    client = getattr(_thread_local, 'client', None)
+    if client is None:
+        client = _thread_local.client = ClinicalTrialsAPIClient()
+        _clients.append(client)
+    return client
+
+
+def _close_clients():
+    """Close every per-thread client's connection pool once the workers are done"""
+    while _clients:
+        _clients.pop().close()
+
+
+class _RequestPacer:
+    """Spaces request starts by a fixed delay across all worker threads"""
+    
+    def __init__(self, delay):
+        self.delay = delay
+        self._lock = threading.Lock()
+        self._next_start = time.monotonic()
+    
+    def wait(self):
+        """Block until this thread's request may start"""
+        # Reserve the next request slot, then wait for it outside the lock
+        with self._lock:
+            now = time.monotonic()
+            wait = self._next_start - now
+            self._next_start = max(self._next_start, now) + self.delay
+        if wait > 0:
+            time.sleep(wait)
+
+
+def _search_disease_trials(disease, pacer):
+    """Query ClinicalTrials.gov for one disease (runs in a worker thread)"""
+    pacer.wait()
+    return _get_client()._search_trials(
+        query_term=disease.disease_name,
+        query_locn="Spain",
+        filter_overall_status=['RECRUITING', 'ACTIVE_NOT_RECRUITING'],
+        max_results=100
+    )
+
+
 def process_clinical_trials(diseases_file="data/input/etl/init_diseases/diseases_sample_10.json", 
-                           run_number=None):
+                           run_number=None, max_workers=DEFAULT_MAX_WORKERS, delay=DEFAULT_DELAY):
     """Process diseases through clinical trials API"""
     
-    with open(diseases_file, 'r', encoding='utf-8') as f:
-        diseases_data = json.load(f)
+    with open(diseases_file, 'rb') as f:
+        diseases = _DISEASE_LIST.validate_json(f.read())
+    
+    # Results are saved per orpha code, so each code only needs to be queried once
+    unique_diseases = {}
+    for disease in diseases:
+        unique_diseases.setdefault(disease.orpha_code, disease)
+    if len(unique_diseases) < len(diseases):
+        logger.info(f"Skipping {len(diseases) - len(unique_diseases)} duplicate orpha codes")
+    diseases = list(unique_diseases.values())
     
-    diseases = [SimpleDisease(**disease) for disease in diseases_data]
-    client = ClinicalTrialsAPIClient()
     data_type = "clinical_trials"
     
     processed_count = 0
     failed_diseases = []
     
-    print(f"Processing {len(diseases)} diseases for clinical trials...")
+    logger.info(f"Processing {len(diseases)} diseases for clinical trials...")
+    
+    # Every result of this run is stamped with the run's start time
+    run_started_at = datetime.now()
+    
+    # Resolve run numbers and skip checks up front, before any request is in
+    # flight, so the file checks never race with results being saved
+    # One directory scan each instead of filesystem probes for every disease
+    earlier_runs = build_run_manifest(data_type, RUN_HISTORY_PATH)
+    saved_runs = build_run_manifest(data_type)
     
+    pending = []
     for disease in diseases:
         try:
             # Determine run number for this disease
             if run_number is None:
-                current_run = get_next_run_number(data_type, disease.orpha_code)
+                current_run = max(earlier_runs.get(disease.orpha_code, {0})) + 1
             else:
                 current_run = run_number
             
             # Check if already processed
-            if is_disease_processed(disease.orpha_code, data_type, current_run):
-                print(f"Skipping {disease.disease_name} (already processed in run {current_run})")
+            if current_run in saved_runs.get(disease.orpha_code, ()):
+                logger.info(f"Skipping {disease.disease_name} (already processed in run {current_run})")
                 continue
             
-            print(f"Processing {disease.disease_name} (run {current_run})...")
-            
-            # Execute clinical trials query
-            results = client._search_trials(
-                query_term=disease.disease_name,
-                query_locn="Spain",
-                filter_overall_status=['RECRUITING', 'ACTIVE_NOT_RECRUITING'],
-                max_results=100
-            )
-            
-            # Create result object
-            result = ClinicalTrialResult(
-                disease_name=disease.disease_name,
-                orpha_code=disease.orpha_code,
-                trials=results,
-                processing_timestamp=datetime.now(),
-                run_number=current_run,
-                total_trials_found=len(results)
-            )
-            
-            # Save result
-            save_processing_result(
-                result.model_dump(mode='json'), 
-                data_type, 
-                disease.orpha_code, 
-                current_run
-            )
-            
-            processed_count += 1
-            print(f"  Found {len(results)} trials")
+            pending.append((disease, current_run))
             
         except Exception as e:
-            print(f"Error processing {disease.disease_name}: {e}")
+            logger.error(f"Error processing {disease.disease_name}: {e}")
             failed_diseases.append(disease.orpha_code)
     
-    print(f"\nProcessing complete: {processed_count} diseases processed, {len(failed_diseases)} failed")
+    # Queries run concurrently, with request starts spaced by delay seconds
+    # across all workers; results are saved here on the main thread
+    pacer = _RequestPacer(delay)
+    try:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {}
+            for disease, current_run in pending:
+                logger.info(f"Processing {disease.disease_name} (run {current_run})...")
+                futures[executor.submit(_search_disease_trials, disease, pacer)] = (disease, current_run)
+            
+            for future in as_completed(futures):
+                disease, current_run = futures[future]
+                try:
+                    results = future.result()
+                    
+                    # Create result object
+                    result = ClinicalTrialResult(
+                        disease_name=disease.disease_name,
+                        orpha_code=disease.orpha_code,
+                        trials=results,
+                        processing_timestamp=run_started_at,
+                        run_number=current_run,
+                        total_trials_found=len(results)
+                    )
+                    
+                    # Save result
+                    save_processing_result(
+                        result, 
+                        data_type, 
+                        disease.orpha_code, 
+                        current_run
+                    )
+                    
+                    processed_count += 1
+                    logger.info(f"{disease.disease_name}: found {len(results)} trials")
+                    
+                except Exception as e:
+                    logger.error(f"Error processing {disease.disease_name}: {e}")
+                    failed_diseases.append(disease.orpha_code)
+    finally:
+        _close_clients()
+    
+    logger.info(f"Processing complete: {processed_count} diseases processed, {len(failed_diseases)} failed")
     if failed_diseases:
-        print(f"Failed diseases: {failed_diseases}")
+        logger.warning(f"Failed diseases: {failed_diseases}")
 
 
 if __name__ == "__main__":
     import argparse
     
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+    
     parser = argparse.ArgumentParser(description='Process diseases for clinical trials')
     parser.add_argument('--file', default="data/input/etl/init_diseases/diseases_sample_10.json",
                        help='Path to diseases JSON file')
     parser.add_argument('--run', type=int, help='Specific run number to use')
+    parser.add_argument('--workers', type=int, default=DEFAULT_MAX_WORKERS,
+                       help='Number of concurrent API requests')
+    parser.add_argument('--delay', type=float, default=DEFAULT_DELAY,
+                       help='Seconds between request starts, across all workers')
     
     args = parser.parse_args()
     
-    process_clinical_trials(args.file, args.run) 
\ No newline at end of file
+    process_clinical_trials(args.file, args.run, args.workers, args.delay)
@@ -1,108 +1,225 @@
-import json
 import sys
+import logging
+import asyncio
+import threading
 from pathlib import Path
 from datetime import datetime
+from typing import List
+
+from pydantic import TypeAdapter
 
 # Add project root to path
 sys.path.append(str(Path(__file__).parent.parent.parent.parent.parent))
 
 from core.infrastructure.orpha_drug.orpha_drug import OrphaDrugAPIClient
-from core.infrastructure.pipeline.run_management import get_next_run_number, is_disease_processed, should_reprocess_disease, save_processing_result
+from core.infrastructure.pipeline.run_management import RUN_HISTORY_PATH, build_run_manifest, should_reprocess_disease, save_processing_result
+from core.infrastructure.utils.retry import http_retry_counts
 from core.schemas.old import SimpleDisease, DrugResult
 
 
+logger = logging.getLogger(__name__)
+
+
+# Concurrent searches and the global politeness delay between request starts
+DEFAULT_MAX_WORKERS = 8
+DEFAULT_DELAY = 0.5
+
+# Root under which the per-disease result files are saved
+BASE_PATH = "data/02_preprocess/orpha/orphadata"
+
+# requests.Session is not thread-safe, so each worker thread gets its own
+# client; pacing is done globally in _search_all, not per client
+_thread_local = threading.local()
+_clients = []
+
+# Parses and validates the whole diseases file in a single pydantic-core pass
+_DISEASE_LIST = TypeAdapter(List[SimpleDisease])
+
+
+def _get_client():
+    """Return this thread's OrphaDrugAPIClient, creating it on first use"""
+    client = getattr(_thread_local, 'client', None)
+    if client is None:
+        client = _thread_local.client = OrphaDrugAPIClient(delay=0)
+        _clients.append(client)
+    return client
+
+
+def _close_clients():
+    """Close every per-thread client's connection pool once the workers are done"""
+    while _clients:
+        _clients.pop().close()
+
+
+def _search_disease_drugs(disease):
+    """Search Orpha.net drugs for one disease (runs in a worker thread)"""
+    return _get_client().search(
+        disease_name=disease.disease_name,
+        orphacode=disease.orpha_code
+    )
+
+
+def _build_and_save_result(disease, current_run, results, data_type, run_started_at):
+    """Turn raw search results into a DrugResult and save it; returns the drug count"""
+    # Extract drug data or handle errors
+    if 'error' in results:
+        logger.error(f"Error in search for {disease.disease_name}: {results['error']}")
+        drugs_data = []
+        search_url = ""
+        search_params = {}
+    else:
+        drugs_data = results.get('drugs', [])
+        search_url = results.get('url', '')
+        search_params = results.get('search_params', {})
+    
+    # Create result object
+    result = DrugResult(
+        disease_name=disease.disease_name,
+        orpha_code=disease.orpha_code,
+        drugs=drugs_data,
+        processing_timestamp=run_started_at,
+        run_number=current_run,
+        total_drugs_found=len(drugs_data),
+        search_url=search_url,
+        search_params=search_params
+    )
+    
+    # Save result
+    save_processing_result(
+        result, 
+        data_type, 
+        disease.orpha_code, 
+        current_run,
+        BASE_PATH
+    )
+    
+    return len(drugs_data)
+
+
+async def _search_all(pending, data_type, run_started_at, max_workers, delay):
+    """
+    Search and save all pending (disease, run) pairs concurrently
+    
+    At most max_workers searches are in flight, and request starts are
+    spaced by delay seconds across all workers. The blocking HTTP calls,
+    HTML parsing and file writes run in the default thread pool.
+    
+    Returns:
+        List of (disease, drug count or exception), one per pending entry
+    """
+    loop = asyncio.get_running_loop()
+    semaphore = asyncio.Semaphore(max_workers)
+    pace_lock = asyncio.Lock()
+    next_start = loop.time()
+    
+    async def worker(disease, current_run):
+        nonlocal next_start
+        async with semaphore:
+            # Reserve the next request slot, then wait for it outside the lock
+            async with pace_lock:
+                wait = next_start - loop.time()
+                next_start = max(next_start, loop.time()) + delay
+            if wait > 0:
+                await asyncio.sleep(wait)
+            
+            logger.info(f"Processing {disease.disease_name} (run {current_run})...")
+            results = await loop.run_in_executor(None, _search_disease_drugs, disease)
+            drug_count = await loop.run_in_executor(
+                None, _build_and_save_result, disease, current_run, results, data_type, run_started_at
+            )
+            logger.info(f"{disease.disease_name}: found {drug_count} drugs")
+            return drug_count
+    
+    outcomes = await asyncio.gather(
+        *(worker(disease, current_run) for disease, current_run in pending),
+        return_exceptions=True
+    )
+    return [(disease, outcome) for (disease, _), outcome in zip(pending, outcomes)]
+
+
 def process_drug_data(diseases_file="data/input/etl/init_diseases/diseases_sample_10.json", 
-                     run_number=None):
+                     run_number=None, max_workers=DEFAULT_MAX_WORKERS, delay=DEFAULT_DELAY):
     """Process diseases through Orpha.net drug database"""
     
-    with open(diseases_file, 'r', encoding='utf-8') as f:
-        diseases_data = json.load(f)
+    with open(diseases_file, 'rb') as f:
+        diseases = _DISEASE_LIST.validate_json(f.read())
+    
+    # Results are saved per orpha code, so each code only needs to be queried once
+    unique_diseases = {}
+    for disease in diseases:
+        unique_diseases.setdefault(disease.orpha_code, disease)
+    if len(unique_diseases) < len(diseases):
+        logger.info(f"Skipping {len(diseases) - len(unique_diseases)} duplicate orpha codes")
+    diseases = list(unique_diseases.values())
     
-    diseases = [SimpleDisease(**disease) for disease in diseases_data]
-    client = OrphaDrugAPIClient(delay=0.5)
     data_type = "orpha_drugs"
     
     processed_count = 0
     failed_diseases = []
     
-    print(f"Processing {len(diseases)} diseases for drug data...")
-    base_path = "data/02_preprocess/orpha/orphadata/"
+    logger.info(f"Processing {len(diseases)} diseases for drug data...")
+    # Every result of this run is stamped with the run's start time
+    run_started_at = datetime.now()
+    
+    # Resolve run numbers and skip checks up front, before any search is in flight
+    # One directory scan each instead of filesystem probes for every disease
+    earlier_runs = build_run_manifest(data_type, RUN_HISTORY_PATH)
+    saved_runs = build_run_manifest(data_type)
+    
+    pending = []
     for disease in diseases:
         try:
             # Determine run number for this disease
             if run_number is None:
-                current_run = get_next_run_number(data_type, disease.orpha_code)
+                current_run = max(earlier_runs.get(disease.orpha_code, {0})) + 1
             else:
                 current_run = run_number
             
             # Check if already processed and has meaningful data
-            if is_disease_processed(disease.orpha_code, data_type, current_run):
+            if current_run in saved_runs.get(disease.orpha_code, ()):
                 if not should_reprocess_disease(data_type, disease.orpha_code, current_run):
-                    print(f"Skipping {disease.disease_name} (already processed in run {current_run})")
+                    logger.info(f"Skipping {disease.disease_name} (already processed in run {current_run})")
                     continue
                 else:
-                    print(f"Reprocessing {disease.disease_name} (run {current_run} was empty)")
-            
-            print(f"Processing {disease.disease_name} (run {current_run})...")
+                    logger.info(f"Reprocessing {disease.disease_name} (run {current_run} was empty)")
             
-            # Execute drug search query
-            results = client.search(
-                disease_name=disease.disease_name,
-                orphacode=disease.orpha_code
-            )
-            
-            # Extract drug data or handle errors
-            if 'error' in results:
-                print(f"  Error in search: {results['error']}")
-                drugs_data = []
-                search_url = ""
-                search_params = {}
-            else:
-                drugs_data = results.get('drugs', [])
-                search_url = results.get('url', '')
-                search_params = results.get('search_params', {})
-            
-            # Create result object
-            result = DrugResult(
-                disease_name=disease.disease_name,
-                orpha_code=disease.orpha_code,
-                drugs=drugs_data,
-                processing_timestamp=datetime.now(),
-                run_number=current_run,
-                total_drugs_found=len(drugs_data),
-                search_url=search_url,
-                search_params=search_params
-            )
-            
-            # Save result
-            save_processing_result(
-                result.model_dump(mode='json'), 
-                data_type, 
-                disease.orpha_code, 
-                current_run,
-                base_path
-            )
-            
-            processed_count += 1
-            print(f"  Found {len(drugs_data)} drugs")
+            pending.append((disease, current_run))
             
         except Exception as e:
-            print(f"Error processing {disease.disease_name}: {e}")
+            logger.error(f"Error processing {disease.disease_name}: {e}")
             failed_diseases.append(disease.orpha_code)
     
-    print(f"\nProcessing complete: {processed_count} diseases processed, {len(failed_diseases)} failed")
+    outcomes = asyncio.run(_search_all(pending, data_type, run_started_at, max_workers, delay))
+    _close_clients()
+    
+    for disease, outcome in outcomes:
+        if isinstance(outcome, Exception):
+            logger.error(f"Error processing {disease.disease_name}: {outcome}")
+            failed_diseases.append(disease.orpha_code)
+        else:
+            processed_count += 1
+    
+    logger.info(f"Processing complete: {processed_count} diseases processed, {len(failed_diseases)} failed")
     if failed_diseases:
-        print(f"Failed diseases: {failed_diseases}")
+        logger.warning(f"Failed diseases: {failed_diseases}")
+    if http_retry_counts:
+        logger.info(f"HTTP retries: {dict(http_retry_counts)}")
 
 
 if __name__ == "__main__":
     import argparse
     
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+    
     parser = argparse.ArgumentParser(description='Process diseases for drug data')
     parser.add_argument('--file', default="data/input/etl/init_diseases/diseases_sample_10.json",
                        help='Path to diseases JSON file')
     parser.add_argument('--run', type=int, help='Specific run number to use')
+    parser.add_argument('--workers', type=int, default=DEFAULT_MAX_WORKERS,
+                       help='Number of concurrent searches')
+    parser.add_argument('--delay', type=float, default=DEFAULT_DELAY,
+                       help='Seconds between request starts, across all workers')
     
     args = parser.parse_args()
     
-    process_drug_data(args.file, args.run) 
\ No newline at end of file
+    process_drug_data(args.file, args.run, args.workers, args.delay) 
\ No newline at end of file
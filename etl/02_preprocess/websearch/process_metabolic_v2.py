@@ -15,16 +15,25 @@ Usage:
 import sys
 import logging
 import argparse
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime
 from pathlib import Path
 from typing import Optional
 
 try:
     # Try relative imports (when run as module)
     from .utils.processing import (
-        load_config, load_diseases, process_diseases, create_processing_summary_report
+        load_config, load_diseases, process_diseases, create_processing_summary_report,
+        create_websearch_result, save_disease_result
     )
     from .utils.yaml_config import get_nested_config, merge_configs
-    from .utils.run_management import list_all_disease_runs, get_disease_run_summary
+    from .utils.io import create_timestamped_filename
+    from .utils.run_management import (
+        list_all_disease_runs, get_disease_run_summary, should_skip_disease, get_next_run_number
+    )
+    from ....core.infrastructure.utils.retry import create_retry_wrapper, EmptySearchError
+    from ....core.infrastructure.agents.web_searcher import WebSearcher
 except ImportError:
     # Fallback for direct execution
     import sys
@@ -36,10 +45,18 @@ except ImportError:
     sys.path.insert(0, str(project_root))
     
     from utils.processing import (
-        load_config, load_diseases, process_diseases, create_processing_summary_report
+        load_config, load_diseases, process_diseases, create_processing_summary_report,
+        create_websearch_result, save_disease_result
     )
     from utils.yaml_config import get_nested_config, merge_configs
-    from utils.run_management import list_all_disease_runs, get_disease_run_summary
+    from utils.io import create_timestamped_filename
+    from utils.run_management import (
+        list_all_disease_runs, get_disease_run_summary, should_skip_disease, get_next_run_number
+    )
+    from core.infrastructure.utils.retry import create_retry_wrapper, EmptySearchError
+    from core.infrastructure.agents.web_searcher import WebSearcher
+
+logger = logging.getLogger(__name__)
 
 
 def setup_logging(level: str = "INFO", verbose: bool = False) -> None:
@@ -279,13 +296,38 @@ def initial_log(analysis_type: str, input_file: str, config: dict, args: argpars
     logger.info(f"  Max Retries: {config['websearch']['metabolic']['retry']['max_attempts']}")
     logger.info(f"  Dry Run: {args.dry_run}")
 
+
+# Each worker thread gets its own WebSearcher rather than sharing one
+_thread_local = threading.local()
+
+
+def _get_searcher(prompt_alias: str, client_config: dict) -> WebSearcher:
+    """
+    Return this thread's WebSearcher, creating it on first use.
+    
+    Args:
+        prompt_alias: Prompt alias for the searcher
+        client_config: Client keyword arguments for the searcher
+        
+    Returns:
+        WebSearcher owned by the calling thread
+    """
+    searcher = getattr(_thread_local, 'searcher', None)
+    if searcher is None:
+        searcher = _thread_local.searcher = WebSearcher(
+            prompt_alias=prompt_alias,
+            client_kwargs=client_config
+        )
+    return searcher
+
+
 def process_single_disease(disease_data: dict, searcher: WebSearcher) -> dict:
     logger.info(f"running search for {disease_data['disease_name']}")
     result = searcher.search(disease_data)
     logger.info(f"search completed for {disease_data['disease_name']}, go to test if empty")
     # Check for empty search
     if hasattr(result, 'is_empty_search') and result.is_empty_search():
-        raise EmptySearchError(f"Groups analysis returned empty results for {disease['disease_name']}")
+        raise EmptySearchError(f"Groups analysis returned empty results for {disease_data['disease_name']}")
     
     if hasattr(result, 'model_dump'):
         result_dict = result.model_dump()
@@ -375,18 +417,16 @@ def main():
 
     prompt_alias = config['websearch']['metabolic']['processing']['prompts']['groups']
     client_config = config['websearch']['metabolic']['processing']['client']
+    concurrency = get_nested_config(config, ['websearch', 'metabolic', 'processing', 'concurrency'], 1)
+    base_path = config['websearch']['metabolic']['output']['base_path']
     
-
-    searcher = WebSearcher(
-        prompt_alias=prompt_alias,
-        client_kwargs=client_config
-    )
-       
+    # Skip checks and run numbers are resolved here on the main thread, before
+    # any search is in flight, so run-number allocation cannot race
+    pending = []
     for disease in diseases:
         orphacode = disease['orpha_code']
         disease_name = disease['disease_name']
     
-    
         logger.info(f"Running {analysis_type} analysis for {disease_name} (ORPHA:{orphacode})")
     
         # Check if should skip
@@ -398,10 +438,9 @@ def main():
                     'disease_name': disease_name,
                     'reason': 'existing_runs'
                 })
-                print(f"Skipping {disease_name} (ORPHA:{orphacode}) because it already has runs")
+                logger.info(f"Skipping {disease_name} (ORPHA:{orphacode}) because it already has runs")
                 continue
 
-        
         # Determine run number
         if specific_run:
             run_number = specific_run
@@ -421,14 +460,57 @@ def main():
             })
             continue
         
-        # Process disease - let exceptions propagate to caller
+        pending.append((disease, run_number))
+    
+    def search_disease(disease):
+        """Run the retried search for one disease; returns the analysis and its duration"""
+        start_time = datetime.now()
+        analysis_result = process_disease_with_retry(disease, _get_searcher(prompt_alias, client_config))
+        return analysis_result, (datetime.now() - start_time).total_seconds()
+    
+    # Searches are network-bound and run concurrently; results are saved here
+    # on the main thread as they arrive
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        futures = {
+            executor.submit(search_disease, disease): (disease, run_number)
+            for disease, run_number in pending
+        }
         
-        result = process_disease_with_retry(disease, searcher)
-        file_path = save_disease_result(result, base_path)
-
-
-
+        for future in as_completed(futures):
+            disease, run_number = futures[future]
+            orphacode = disease['orpha_code']
+            disease_name = disease['disease_name']
+            try:
+                analysis_result, processing_duration = future.result()
+                result = create_websearch_result(
+                    disease, analysis_type, analysis_result, processing_duration, run_number
+                )
+                file_path = save_disease_result(result, base_path)
+                
+                summary['processed'] += 1
+                summary['processed_diseases'].append({
+                    'orphacode': orphacode,
+                    'disease_name': disease_name,
+                    'run_number': run_number,
+                    'file_path': file_path,
+                    'processing_duration': processing_duration
+                })
+                
+            except Exception as e:
+                logger.error(f"Processing failed for {disease_name}: {e}")
+                summary['failed'] += 1
+                summary['failed_diseases'].append({
+                    'orphacode': orphacode,
+                    'disease_name': disease_name,
+                    'run_number': run_number,
+                    'error': str(e)
+                })
     
+    summary['end_time'] = datetime.now().isoformat()
+    summary['total_duration'] = (
+        datetime.fromisoformat(summary['end_time']) - 
+        datetime.fromisoformat(summary['start_time'])
+    ).total_seconds()
     
     # Create and display summary report
     report = create_processing_summary_report(summary)
@@ -436,7 +518,6 @@ def main():
     
     # Save summary report if not dry run
     if not args.dry_run:
-        from .utils.io import create_timestamped_filename
         report_filename = create_timestamped_filename(
             f"metabolic_{analysis_type}_summary", ".txt"
         )
@@ -13,6 +13,12 @@ from typing import Dict, List, Any, Optional, Union
 from datetime import datetime
 import os
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
 
@@ -37,8 +43,13 @@ def load_json_data(file_path: str, encoding: str = 'utf-8') -> Union[Dict, List]
         raise FileNotFoundError(f"JSON file not found: {file_path}")
     
     try:
-        with open(file_path, 'r', encoding=encoding) as f:
-            data = json.load(f)
+        if ORJSON_AVAILABLE and encoding.lower().replace('-', '') == 'utf8':
+            # orjson.JSONDecodeError subclasses json.JSONDecodeError
+            with open(file_path, 'rb') as f:
+                data = orjson.loads(f.read())
+        else:
+            with open(file_path, 'r', encoding=encoding) as f:
+                data = json.load(f)
         
         logger.info(f"Successfully loaded JSON data from {file_path}")
         return data
@@ -68,8 +79,23 @@ def save_json_data(data: Union[Dict, List], file_path: str,
     file_path.parent.mkdir(parents=True, exist_ok=True)
     
     try:
-        with open(file_path, 'w', encoding=encoding) as f:
-            json.dump(data, f, indent=indent, ensure_ascii=ensure_ascii)
+        content = None
+        if (ORJSON_AVAILABLE and indent == 2 and not ensure_ascii
+                and encoding.lower().replace('-', '') == 'utf8'):
+            # orjson writes the same layout as json.dump(indent=2, ensure_ascii=False),
+            # except that NaN and Infinity are written as null. Data it cannot
+            # encode (e.g. integers wider than 64 bits) goes through json instead.
+            try:
+                content = orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+            except orjson.JSONEncodeError:
+                content = None
+        
+        if content is not None:
+            with open(file_path, 'wb') as f:
+                f.write(content)
+        else:
+            with open(file_path, 'w', encoding=encoding) as f:
+                json.dump(data, f, indent=indent, ensure_ascii=ensure_ascii)
         
         logger.info(f"Successfully saved JSON data to {file_path}")
         
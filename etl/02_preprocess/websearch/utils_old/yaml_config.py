@@ -11,6 +11,13 @@ from pathlib import Path
 from typing import Dict, Any, Optional, List
 import os
 
+# libyaml's C loader parses several times faster than the pure-Python one
+# and builds the same result; fall back when PyYAML was built without it
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
 logger = logging.getLogger(__name__)
 
 
@@ -35,7 +42,7 @@ def load_yaml_config(config_path: str) -> Dict[str, Any]:
     
     try:
         with open(config_path, 'r', encoding='utf-8') as f:
-            config = yaml.safe_load(f)
+            config = yaml.load(f, Loader=SafeLoader)
         
         logger.info(f"Successfully loaded configuration from {config_path}")
         return config
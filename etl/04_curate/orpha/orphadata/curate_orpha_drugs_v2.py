@@ -29,7 +29,13 @@ import argparse
 from pathlib import Path
 from collections import defaultdict
 from datetime import datetime
-from typing import Dict, List, Optional, Tuple, Any
+from typing import Dict, List, Optional, Tuple, Any, Iterable, Iterator
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 # Add the project root to the Python path
 sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent.parent))
@@ -44,7 +50,7 @@ from core.schemas.orpha.orphadata.orpha_drugs_v2 import (
     is_available_in_region_v2,
     filter_drugs_by_criteria_v2,
     extract_drug_ids_v2,
-    create_drug_name_mapping_v2,
+    create_drug_name_mapping_v2_stream,
     validate_disease_data_v2
 )
 
@@ -52,6 +58,18 @@ from core.schemas.orpha.orphadata.orpha_drugs_v2 import (
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Drug type and region combinations, one curated file each
+DRUG_TYPES = ["tradename", "medical_product"]
+REGIONS = ["eu", "usa", "all"]
+
+
+def _read_json(path: Path) -> Any:
+    """Read a JSON file, using orjson's C parser when available"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(path.read_bytes())
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
 
 def get_latest_non_empty_run(disease_dir: Path) -> Tuple[Optional[int], Optional[Dict]]:
     """Get the latest run with non-empty drugs for a disease"""
@@ -65,11 +83,10 @@ def get_latest_non_empty_run(disease_dir: Path) -> Tuple[Optional[int], Optional
     
     for run_file in run_files:
         try:
-            with open(run_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                if data.get('total_drugs_found', 0) > 0:
-                    run_number = int(run_file.name.split("_")[0].replace("run", ""))
-                    return run_number, data
+            data = _read_json(run_file)
+            if data.get('total_drugs_found', 0) > 0:
+                run_number = int(run_file.name.split("_")[0].replace("run", ""))
+                return run_number, data
         except Exception as e:
             logger.warning(f"Error reading {run_file}: {e}")
     
@@ -92,32 +109,65 @@ def load_disease_data_v2(disease_dir: Path) -> Optional[DiseaseDataV2]:
         return None
 
 
-def aggregate_drugs_by_criteria(diseases_data: Dict[str, DiseaseDataV2], 
-                              drug_type: str, 
-                              region: str) -> Dict[str, List[str]]:
-    """Filter and aggregate drugs by type and region"""
-    logger.info(f"Filtering {drug_type} drugs available in {region}...")
+def iter_disease_data_v2(input_dir: Path) -> Iterator[Tuple[str, Optional[DiseaseDataV2]]]:
+    """
+    Lazily load disease data from each disease directory
     
-    filtered_drugs = {}
+    Yields one (orpha_code, disease_data) pair at a time; disease_data is None
+    when the disease has no valid non-empty run.
+    """
+    for disease_dir in input_dir.iterdir():
+        if not disease_dir.is_dir():
+            continue
+        yield disease_dir.name, load_disease_data_v2(disease_dir)
+
+
+def iter_diseases_with_drugs(input_dir: Path, processing_stats: Dict[str, Any]) -> Iterator[Tuple[str, DiseaseDataV2]]:
+    """
+    Lazily load the diseases that have at least one drug, updating processing_stats
     
-    for orpha_code, disease_data in diseases_data.items():
-        # Filter drugs by criteria
-        matching_drugs = filter_drugs_by_criteria_v2(disease_data.drugs, drug_type, region)
+    Diseases without a valid run are recorded in processing_stats["empty_diseases"].
+    """
+    for orpha_code, disease_data in iter_disease_data_v2(input_dir):
+        processing_stats["total_diseases_processed"] += 1
+        
+        if disease_data is None:
+            processing_stats["empty_diseases"].append(orpha_code)
+            logger.debug(f"No valid data found for disease {orpha_code}")
+            continue
         
-        if matching_drugs:
-            # Extract drug IDs
-            drug_ids = extract_drug_ids_v2(matching_drugs)
-            filtered_drugs[orpha_code] = drug_ids
+        if len(disease_data.drugs) > 0:
+            processing_stats["diseases_with_drugs"] += 1
+            
+            logger.debug(f"Processed {disease_data.disease_name} ({orpha_code}): {len(disease_data.drugs)} drugs")
+            yield orpha_code, disease_data
+
+
+def aggregate_drugs_by_criteria_stream(diseases: Iterable[Tuple[str, DiseaseDataV2]],
+                                       filtered_drugs: Dict[Tuple[str, str], Dict[str, List[str]]]) -> Iterator[DiseaseDataV2]:
+    """
+    Filter each disease's drugs for every drug type and region as it streams past
     
-    logger.info(f"Found {len(filtered_drugs)} diseases with {drug_type} drugs ({region})")
-    return filtered_drugs
+    Matching drug IDs are added to filtered_drugs[(drug_type, region)] and the
+    disease is passed on, so the same single pass can feed the drug name
+    mapping without keeping the diseases in memory.
+    """
+    for orpha_code, disease_data in diseases:
+        for drug_type in DRUG_TYPES:
+            for region in REGIONS:
+                matching_drugs = filter_drugs_by_criteria_v2(disease_data.drugs, drug_type, region)
+                
+                if matching_drugs:
+                    filtered_drugs[(drug_type, region)][orpha_code] = extract_drug_ids_v2(matching_drugs)
+        
+        yield disease_data
 
 
-def generate_drug_name_mapping(diseases_data: Dict[str, DiseaseDataV2]) -> Dict[str, str]:
+def generate_drug_name_mapping(diseases: Iterable[DiseaseDataV2]) -> Dict[str, str]:
     """Create drug ID to name mapping"""
     logger.info("Generating drug name mapping...")
     
-    drug_names = create_drug_name_mapping_v2(diseases_data)
+    drug_names = create_drug_name_mapping_v2_stream(diseases)
     
     logger.info(f"Generated mapping for {len(drug_names)} unique drugs")
     return drug_names
@@ -155,7 +205,7 @@ def curate_orpha_drugs_v2(input_dir: str = "data/02_preprocess/orpha/orphadata/o
     logger.info(f"Output: {output_dir_path}")
     
     # Data structures for aggregation
-    diseases_data = {}
+    filtered_drugs = {(drug_type, region): {} for drug_type in DRUG_TYPES for region in REGIONS}
     processing_stats = {
         "total_diseases_processed": 0,
         "diseases_with_drugs": 0,
@@ -164,66 +214,43 @@ def curate_orpha_drugs_v2(input_dir: str = "data/02_preprocess/orpha/orphadata/o
         "empty_diseases": []
     }
     
-    # Process each disease directory
+    # Single pass over the disease directories: each disease is loaded,
+    # filtered into every drug type/region and added to the name mapping,
+    # then dropped
     logger.info("Loading disease data...")
-    for disease_dir in preprocessing_dir.iterdir():
-        if not disease_dir.is_dir():
-            continue
-            
-        orpha_code = disease_dir.name
-        processing_stats["total_diseases_processed"] += 1
-        
-        # Load disease data with V2 schema
-        disease_data = load_disease_data_v2(disease_dir)
-        
-        if disease_data is None:
-            processing_stats["empty_diseases"].append(orpha_code)
-            logger.debug(f"No valid data found for disease {orpha_code}")
-            continue
-        
-        if len(disease_data.drugs) > 0:
-            processing_stats["diseases_with_drugs"] += 1
-            diseases_data[orpha_code] = disease_data
-            
-            logger.debug(f"Processed {disease_data.disease_name} ({orpha_code}): {len(disease_data.drugs)} drugs")
-    
-    logger.info(f"Loaded {len(diseases_data)} diseases with drugs")
-    
-    # Generate drug name mapping
-    drug_names = generate_drug_name_mapping(diseases_data)
+    diseases = iter_diseases_with_drugs(preprocessing_dir, processing_stats)
+    drug_names = generate_drug_name_mapping(aggregate_drugs_by_criteria_stream(diseases, filtered_drugs))
     processing_stats["total_unique_drugs"] = len(drug_names)
     
+    logger.info(f"Loaded {processing_stats['diseases_with_drugs']} diseases with drugs")
+    
     # Generate all curated files
     logger.info("Generating curated drug files...")
     
-    # Define all combinations of drug types and regions
-    drug_types = ["tradename", "medical_product"]
-    regions = ["eu", "usa", "all"]
-    
     curated_files = {}
     coverage_stats = {
         "tradename_coverage": {},
         "medical_product_coverage": {}
     }
     
-    # Generate filtered drug files
-    for drug_type in drug_types:
-        for region in regions:
-            # Generate filtered data
-            filtered_drugs = aggregate_drugs_by_criteria(diseases_data, drug_type, region)
+    # Save filtered drug files
+    for drug_type in DRUG_TYPES:
+        for region in REGIONS:
+            filtered = filtered_drugs[(drug_type, region)]
+            logger.info(f"Found {len(filtered)} diseases with {drug_type} drugs ({region})")
             
             # Save to file
             filename = f"disease2{region}_{drug_type}_drugs.json"
-            save_curated_file(filtered_drugs, filename, output_dir_path)
+            save_curated_file(filtered, filename, output_dir_path)
             
             # Store for return
-            curated_files[filename.replace('.json', '')] = filtered_drugs
+            curated_files[filename.replace('.json', '')] = filtered
             
             # Store coverage stats
             if drug_type == "tradename":
-                coverage_stats["tradename_coverage"][region] = len(filtered_drugs)
+                coverage_stats["tradename_coverage"][region] = len(filtered)
             else:
-                coverage_stats["medical_product_coverage"][region] = len(filtered_drugs)
+                coverage_stats["medical_product_coverage"][region] = len(filtered)
     
     # Save drug name mapping
     save_curated_file(drug_names, "drug2name.json", output_dir_path)
@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the streaming XLSX writer of RareDiseasePrioritizer
+
+_write_excel_streaming generates the workbook XML itself, so the files it
+writes are read back with openpyxl and pandas and compared with the frame.
+"""
+
+import sys
+import math
+import zipfile
+from pathlib import Path
+
+import numpy as np
+import yaml
+import pytest
+
+pd = pytest.importorskip('pandas')
+openpyxl = pytest.importorskip('openpyxl')
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from core.services.raredisease_prioritization import RareDiseasePrioritizer, CRITERIA_KEYS, _xlsx_cell
+
+
+SHEET_NAME = 'Top & <Priorizadas>'
+
+REPEATED_TEXT = 'Monogénica: 1 gen asociado (ideal para terapia génica)'
+
+
+@pytest.fixture
+def prioritizer(tmp_path):
+    config = {
+        'input': {'data_source': 'unused.json'},
+        'output': {'base_path': str(tmp_path), 'top_n': 5},
+        'criteria': {key: {'mock': True, 'mock_value': 10.0, 'weight': 1 / 6} for key in CRITERIA_KEYS}
+    }
+    config_path = tmp_path / 'prioritization.yaml'
+    config_path.write_text(yaml.safe_dump(config))
+    return RareDiseasePrioritizer(str(config_path))
+
+
+@pytest.fixture
+def frame():
+    return pd.DataFrame({
+        'Rank': np.array([1, 2, 3, 4], dtype=np.int64),
+        'ORPHA Code': ['905', '79321', '905', '42'],
+        'Disease & <Name>': ['Wilson disease', 'Tabs\tand\nnewlines', 'Ñandú "quoted"', '  padded  '],
+        'Score': [8.0, 7.25, float('nan'), 1e-7],
+        'Monogenic': np.array([True, False, True, False]),
+        'Justification': [REPEATED_TEXT, '\x01Control\x0b chars\x1f removed\x00', REPEATED_TEXT, REPEATED_TEXT],
+    })
+
+
+def _expected_value(value):
+    """What a cell should read back as: None for NaN, control characters stripped"""
+    if isinstance(value, float) and math.isnan(value):
+        return None
+    if isinstance(value, str):
+        return ''.join(c for c in value if c in '\t\n' or ord(c) >= 0x20)
+    if isinstance(value, np.generic):
+        return value.item()
+    return value
+
+
+def test_streaming_workbook_reads_back_with_openpyxl(prioritizer, frame, tmp_path):
+    output_file = tmp_path / 'streamed.xlsx'
+    prioritizer._write_excel_streaming(frame, output_file, SHEET_NAME)
+
+    workbook = openpyxl.load_workbook(output_file)
+    assert workbook.sheetnames == [SHEET_NAME]
+    worksheet = workbook[SHEET_NAME]
+
+    rows = list(worksheet.iter_rows(values_only=True))
+    assert rows[0] == tuple(frame.columns)
+    expected = [tuple(_expected_value(v) for v in row) for row in frame.itertuples(index=False, name=None)]
+    assert rows[1:] == expected
+
+    # Bools keep their type instead of reading back as 0/1
+    assert [type(row[4]) for row in rows[1:]] == [bool] * len(frame)
+
+    assert all(cell.font.b for cell in worksheet[1])
+    assert not worksheet['A2'].font.b
+
+    widths = prioritizer._excel_column_widths(frame)
+    for letter, width in zip('ABCDEF', widths):
+        assert worksheet.column_dimensions[letter].width == width
+
+
+def test_streaming_workbook_reads_back_with_pandas(prioritizer, frame, tmp_path):
+    output_file = tmp_path / 'streamed.xlsx'
+    prioritizer._write_excel_streaming(frame, output_file, SHEET_NAME)
+
+    result = pd.read_excel(output_file, sheet_name=SHEET_NAME, dtype={'ORPHA Code': str})
+
+    expected = frame.copy()
+    expected['Justification'] = expected['Justification'].map(_expected_value)
+    pd.testing.assert_frame_equal(result, expected)
+
+
+def test_streaming_matches_excel_writer(prioritizer, frame, tmp_path):
+    streamed_file = tmp_path / 'streamed.xlsx'
+    written_file = tmp_path / 'written.xlsx'
+    prioritizer._write_excel_streaming(frame, streamed_file, SHEET_NAME)
+    clean = frame.assign(Justification=frame['Justification'].map(_expected_value))
+    prioritizer._write_excel(clean, written_file, SHEET_NAME)
+
+    streamed = list(openpyxl.load_workbook(streamed_file)[SHEET_NAME].iter_rows(values_only=True))
+    written = list(openpyxl.load_workbook(written_file)[SHEET_NAME].iter_rows(values_only=True))
+    assert streamed == written
+
+
+def test_repeated_strings_are_shared(prioritizer, frame, tmp_path):
+    output_file = tmp_path / 'streamed.xlsx'
+    prioritizer._write_excel_streaming(frame, output_file, SHEET_NAME)
+
+    with zipfile.ZipFile(output_file) as archive:
+        shared_strings = archive.read('xl/sharedStrings.xml').decode('utf-8')
+
+    assert shared_strings.count('Monogénica') == 1
+    # Headers plus the distinct text cells ('905' appears twice)
+    distinct = set(frame.columns) | set(frame['ORPHA Code']) | set(frame['Disease & <Name>']) \
+        | {_expected_value(v) for v in frame['Justification']}
+    assert f'uniqueCount="{len(distinct)}"' in shared_strings
+
+
+def test_xlsx_cell():
+    shared_strings = {}
+
+    assert _xlsx_cell('A1', None, shared_strings) == ''
+    assert _xlsx_cell('A1', float('nan'), shared_strings) == ''
+    assert _xlsx_cell('A1', np.float64('inf'), shared_strings) == ''
+    assert _xlsx_cell('A1', True, shared_strings) == '<c r="A1" t="b"><v>1</v></c>'
+    assert _xlsx_cell('A1', np.bool_(False), shared_strings) == '<c r="A1" t="b"><v>0</v></c>'
+    assert _xlsx_cell('A1', np.int64(7), shared_strings) == '<c r="A1"><v>7</v></c>'
+    assert _xlsx_cell('A1', 8.0, shared_strings) == '<c r="A1"><v>8</v></c>'
+    assert _xlsx_cell('A1', 0.1, shared_strings) == '<c r="A1"><v>0.1</v></c>'
+    assert _xlsx_cell('B1', 'Header', shared_strings, style=1) == '<c r="B1" s="1" t="s"><v>0</v></c>'
+    assert _xlsx_cell('B2', 'a\x02b', shared_strings) == '<c r="B2" t="s"><v>1</v></c>'
+    assert _xlsx_cell('B3', 'Header', shared_strings) == '<c r="B3" t="s"><v>0</v></c>'
+    assert shared_strings == {'Header': 0, 'ab': 1}
@@ -0,0 +1,303 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the scoring paths of RareDiseasePrioritizer
+
+The per-disease score_* methods are the reference formulas; rank_diseases
+and score_disease score through the column-wise path and must reproduce
+them exactly, weighted sum included.
+"""
+
+import sys
+import copy
+from pathlib import Path
+
+import numpy as np
+import yaml
+import pytest
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from core.services.raredisease_prioritization import RareDiseasePrioritizer, ScoredTable, CRITERIA_KEYS
+
+
+# Per-disease client data: prevalence class, evidence level, EU tradenames,
+# EU medical products, Spanish trials, EU trials, genes, research groups
+DISEASE_DATA = {
+    '1': ('>1 / 1000', 'High evidence', ['d1'], [], ['t1', 't2'], [], ['G1'], ['g1']),
+    '2': ('<1 / 1 000 000', 'Low evidence', [], ['m1', 'm2', 'm3'], [], ['t3'], ['G1', 'G2'], []),
+    '3': (None, None, ['d%d' % i for i in range(12)], ['m%d' % i for i in range(25)], [], [], [], ['g1', 'g2', 'g3', 'g4']),
+    '4': ('Unknown class', 'Unmapped evidence', [], [], ['t%d' % i for i in range(150)], ['t0'], ['G3'], ['g1']),
+    '5': ('1-9 / 100 000', 'Medium evidence', ['d1', 'd2'], ['m1'], [], [], [], ['g1', 'g2']),
+}
+
+DISEASES = [{'orpha_code': code, 'disease_name': f'Disease {code}'} for code in DISEASE_DATA]
+
+BASE_CONFIG = {
+    'input': {'data_source': 'unused.json'},
+    'output': {'base_path': 'unused', 'top_n': 5},
+    'criteria': {
+        'prevalence': {
+            'mock': False, 'mock_value': 10.0, 'weight': 0.20,
+            'scoring': {
+                'class_mapping': {'>1 / 1000': 10, '1-9 / 100 000': 6, '<1 / 1 000 000': 2},
+                'handle_missing_data': 'zero_score'
+            }
+        },
+        'socioeconomic': {
+            'mock': False, 'mock_value': 10.0, 'weight': 0.20,
+            'scoring': {
+                'evidence_mappings': {'High evidence': 10, 'Medium evidence': 5, 'Low evidence': 3},
+                'handle_missing_data': 'zero_score'
+            }
+        },
+        'orpha_drugs': {
+            'mock': False, 'mock_value': 10.0, 'weight': 0.25,
+            'scoring': {
+                'components': [
+                    {'data_source': 'eu_tradename_drugs', 'weight': 0.8, 'max': 10, 'scale_factor': 10},
+                    {'data_source': 'medical_products_eu', 'weight': 0.2, 'max': 20, 'scale_factor': 10}
+                ]
+            }
+        },
+        'clinical_trials': {
+            'mock': False, 'mock_value': 10.0, 'weight': 0.10,
+            'scoring': {'max': 100, 'scale_factor': 10},
+            'data_usage': {'source_preference': 'spanish_trials', 'fallback': 'eu_trials'}
+        },
+        'orpha_gene': {'mock': False, 'mock_value': 10.0, 'weight': 0.15},
+        'groups': {
+            'mock': False, 'mock_value': 10.0, 'weight': 0.10,
+            'scoring': {'max': 3, 'scale_factor': 10}
+        }
+    }
+}
+
+
+class FakeClient:
+    """Serves DISEASE_DATA through the single and batch methods of every curated client"""
+
+    def _field(self, index, orpha_code):
+        return DISEASE_DATA[orpha_code][index]
+
+    def _batch(self, index, orpha_codes):
+        return [self._field(index, code) for code in orpha_codes]
+
+    def get_prevalence_class(self, orpha_code):
+        return self._field(0, orpha_code)
+
+    def get_prevalence_classes(self, orpha_codes):
+        return self._batch(0, orpha_codes)
+
+    def get_evidence_level_for_disease(self, orpha_code):
+        return self._field(1, orpha_code)
+
+    def get_evidence_levels_for_diseases(self, orpha_codes):
+        return self._batch(1, orpha_codes)
+
+    def get_eu_tradename_drugs_for_disease(self, orpha_code):
+        return self._field(2, orpha_code)
+
+    def get_eu_tradename_drugs_for_diseases(self, orpha_codes):
+        return self._batch(2, orpha_codes)
+
+    def get_eu_medical_products_for_disease(self, orpha_code):
+        return self._field(3, orpha_code)
+
+    def get_eu_medical_products_for_diseases(self, orpha_codes):
+        return self._batch(3, orpha_codes)
+
+    def get_spanish_trials_for_disease(self, orpha_code):
+        return self._field(4, orpha_code)
+
+    def get_spanish_trials_for_diseases(self, orpha_codes):
+        return self._batch(4, orpha_codes)
+
+    def get_eu_trials_for_disease(self, orpha_code):
+        return self._field(5, orpha_code)
+
+    def get_eu_trials_for_diseases(self, orpha_codes):
+        return self._batch(5, orpha_codes)
+
+    def get_all_trials_for_disease(self, orpha_code):
+        return self._field(4, orpha_code) + self._field(5, orpha_code)
+
+    def get_all_trials_for_diseases(self, orpha_codes):
+        return [self.get_all_trials_for_disease(code) for code in orpha_codes]
+
+    def get_genes_for_disease(self, orpha_code):
+        return self._field(6, orpha_code)
+
+    def get_genes_for_diseases(self, orpha_codes):
+        return self._batch(6, orpha_codes)
+
+    def get_groups_for_disease(self, orpha_code):
+        return self._field(7, orpha_code)
+
+    def get_groups_for_diseases(self, orpha_codes):
+        return self._batch(7, orpha_codes)
+
+
+def _mock(*keys):
+    def apply(criteria):
+        for key in keys:
+            criteria[key]['mock'] = True
+    return apply
+
+
+def _missing_as_mock(criteria):
+    for key in ('prevalence', 'socioeconomic'):
+        criteria[key]['scoring']['handle_missing_data'] = 'mock_value'
+
+
+def _all_trials(criteria):
+    criteria['clinical_trials']['data_usage']['source_preference'] = 'all_trials'
+
+
+def _no_fallback(criteria):
+    del criteria['clinical_trials']['data_usage']['fallback']
+
+
+def _zero_max(criteria):
+    criteria['orpha_drugs']['scoring']['components'][1]['max'] = 0
+    criteria['clinical_trials']['scoring']['max'] = 0
+    criteria['groups']['scoring']['max'] = 0
+
+
+CONFIG_VARIANTS = {
+    'default': lambda criteria: None,
+    'mock_all': _mock(*CRITERIA_KEYS),
+    'mock_some': _mock('socioeconomic', 'orpha_gene'),
+    'missing_as_mock': _missing_as_mock,
+    'all_trials': _all_trials,
+    'no_fallback': _no_fallback,
+    'zero_max': _zero_max,
+}
+
+
+@pytest.fixture(params=sorted(CONFIG_VARIANTS))
+def prioritizer(request, tmp_path):
+    config = copy.deepcopy(BASE_CONFIG)
+    CONFIG_VARIANTS[request.param](config['criteria'])
+    config_path = tmp_path / 'prioritization.yaml'
+    config_path.write_text(yaml.safe_dump(config))
+
+    prioritizer = RareDiseasePrioritizer(str(config_path))
+    client = FakeClient()
+    for name in ('prevalence_client', 'drugs_client', 'genes_client', 'trials_client',
+                 'socioeconomic_client', 'groups_client'):
+        setattr(prioritizer, name, client)
+    return prioritizer
+
+
+def _reference_scores(prioritizer, orpha_code):
+    """Criteria scores from the per-disease score_* methods, in CRITERIA_KEYS order"""
+    return tuple(getattr(prioritizer, 'score_' + key)(orpha_code) for key in CRITERIA_KEYS)
+
+
+def _reference_weighted_score(prioritizer, scores):
+    weighted_score = 0.0
+    for key, score in zip(CRITERIA_KEYS, scores):
+        weighted_score += score * prioritizer.config['criteria'][key]['weight']
+    return weighted_score
+
+
+def test_column_path_matches_score_methods(prioritizer):
+    table = prioritizer.rank_diseases(DISEASES)
+
+    assert sorted(table.orpha_codes.tolist()) == sorted(DISEASE_DATA)
+    for orpha_code, criteria_row, weighted_score in zip(
+            table.orpha_codes.tolist(), table.criteria_scores.tolist(), table.weighted_scores.tolist()):
+        expected = _reference_scores(prioritizer, orpha_code)
+        assert tuple(criteria_row) == expected
+        assert weighted_score == _reference_weighted_score(prioritizer, expected)
+
+
+def test_rank_diseases_orders_by_weighted_score(prioritizer):
+    table = prioritizer.rank_diseases(DISEASES)
+
+    expected = sorted(
+        DISEASES,
+        key=lambda d: _reference_weighted_score(prioritizer, _reference_scores(prioritizer, d['orpha_code'])),
+        reverse=True
+    )
+    assert table.orpha_codes.tolist() == [d['orpha_code'] for d in expected]
+    assert table.ranks.tolist() == list(range(1, len(DISEASES) + 1))
+
+
+def test_score_disease_matches_score_methods(prioritizer):
+    for disease in DISEASES:
+        disease_score = prioritizer.score_disease(disease)
+        expected = _reference_scores(prioritizer, disease['orpha_code'])
+
+        c = disease_score.criteria_scores
+        assert (c.prevalence, c.socioeconomic, c.orpha_drugs, c.clinical_trials, c.orpha_gene, c.groups) == expected
+        assert disease_score.weighted_score == _reference_weighted_score(prioritizer, expected)
+        assert disease_score.disease_name == disease['disease_name']
+
+
+@pytest.fixture
+def mocked_prioritizer(tmp_path):
+    config = copy.deepcopy(BASE_CONFIG)
+    for key in CRITERIA_KEYS:
+        config['criteria'][key]['mock'] = True
+        config['criteria'][key]['path'] = str(tmp_path / 'missing' / key)
+    config_path = tmp_path / 'prioritization.yaml'
+    config_path.write_text(yaml.safe_dump(config))
+    return RareDiseasePrioritizer(str(config_path))
+
+
+def test_fully_mocked_run_needs_no_data(mocked_prioritizer):
+    scored_diseases = mocked_prioritizer.prioritize_diseases(DISEASES)
+
+    assert [d.orpha_code for d in scored_diseases] == list(DISEASE_DATA)
+    expected = _reference_weighted_score(mocked_prioritizer, (10.0,) * len(CRITERIA_KEYS))
+    assert all(d.weighted_score == expected for d in scored_diseases)
+
+    justifications = mocked_prioritizer._justify_rows(scored_diseases)
+    assert all(text.endswith('(fase mock)') for row in justifications for text in row)
+
+    # No client was created for any criterion
+    for name in ('prevalence_client', 'drugs_client', 'genes_client', 'trials_client',
+                 'socioeconomic_client', 'groups_client'):
+        assert name not in vars(mocked_prioritizer)
+
+
+def test_prioritize_diseases_with_nothing_scored(mocked_prioritizer):
+    assert mocked_prioritizer.prioritize_diseases([]) == []
+
+
+def test_reweighted_then_top_n_reranks():
+    # Ranked a, b, c under the original weights (prevalence only)
+    criteria_scores = np.array([
+        [9.0, 0.0, 0.0, 0.0, 0.0, 0.0],
+        [5.0, 2.0, 0.0, 0.0, 0.0, 0.0],
+        [1.0, 10.0, 0.0, 0.0, 0.0, 0.0],
+    ])
+    table = ScoredTable(
+        ranks=np.array([1, 2, 3]),
+        orpha_codes=np.array(['a', 'b', 'c'], dtype=object),
+        disease_names=np.array(['A', 'B', 'C'], dtype=object),
+        criteria_scores=criteria_scores,
+        weighted_scores=criteria_scores[:, 0].copy(),
+        evidence=[None, None, None]
+    )
+
+    weights = dict.fromkeys(CRITERIA_KEYS, 0.0)
+    weights.update(prevalence=0.5, socioeconomic=0.5)
+    reweighted = table.reweighted(weights)
+
+    # Rows and ranks are kept as they were
+    assert reweighted.orpha_codes.tolist() == ['a', 'b', 'c']
+    assert reweighted.ranks.tolist() == [1, 2, 3]
+    assert reweighted.weighted_scores.tolist() == [4.5, 3.5, 5.5]
+
+    reranked = reweighted.top_n(3)
+    assert reranked.orpha_codes.tolist() == ['c', 'a', 'b']
+    assert reranked.ranks.tolist() == [1, 2, 3]
+    assert reranked.weighted_scores.tolist() == [5.5, 4.5, 3.5]
+
+    top_two = reweighted.top_n(2)
+    assert top_two.orpha_codes.tolist() == ['c', 'a']
+    assert top_two.ranks.tolist() == [1, 2]